@@ -0,0 +1,95 @@
+"""
+Backfill Index - SQLite record of which dates have been backfilled.
+
+HistoricalBackfill used to find finished dates by probing
+data/processed/daily_scores_{date}.json one date at a time. This index keeps
+one row per analyzed date with its daily scores, plus which raw sources fed
+it, so the whole skip-set is a single query.
+
+Each row also keeps a hash of the raw files the date was analyzed from, so
+a rerun can tell unchanged dates from ones whose raw data was refetched.
+"""
+
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Set, Union
+
+# Add parent directory for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scrapers.utils import DATA_DIR
+
+DEFAULT_INDEX_PATH = DATA_DIR / 'index.db'
+
+
+class BackfillIndex:
+    """SQLite-backed index of analyzed dates."""
+
+    def __init__(self, path: Union[str, Path] = DEFAULT_INDEX_PATH):
+        """
+        Open (or create) the index database.
+
+        Args:
+            path: SQLite file path
+        """
+        self.path = Path(path)
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS scores ("
+            "date TEXT PRIMARY KEY, overall REAL, github REAL, irc REAL, ml REAL, api_calls INT, "
+            "input_hash TEXT)"
+        )
+        # Indexes created before input hashes were recorded
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(scores)")}
+        if 'input_hash' not in columns:
+            self.conn.execute("ALTER TABLE scores ADD COLUMN input_hash TEXT")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS raw_present ("
+            "date TEXT NOT NULL, source TEXT NOT NULL, PRIMARY KEY (date, source))"
+        )
+        self.conn.commit()
+
+    def processed_dates(self) -> Set[str]:
+        """Dates that have daily scores recorded."""
+        return {row[0] for row in self.conn.execute("SELECT date FROM scores")}
+
+    def input_hashes(self) -> Dict[str, str]:
+        """Raw input hash of each date that has one recorded."""
+        return dict(self.conn.execute(
+            "SELECT date, input_hash FROM scores WHERE input_hash IS NOT NULL"
+        ))
+
+    def record(self, date_str: str, daily_scores: Dict, sources: Iterable[str], api_calls: int,
+               input_hash: Optional[str] = None):
+        """
+        Record an analyzed date. Writes are batched until commit().
+
+        Args:
+            date_str: Date in YYYY-MM-DD format
+            daily_scores: The result's daily_scores dict
+            sources: Raw sources the analysis had data from
+            api_calls: Approximate Claude API calls spent on the date
+            input_hash: Hash of the raw files the date was analyzed from
+        """
+        self.conn.execute(
+            "INSERT OR REPLACE INTO scores (date, overall, github, irc, ml, api_calls, input_hash) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (date_str, daily_scores.get('overall'), daily_scores.get('github'),
+             daily_scores.get('irc'), daily_scores.get('mailing_list'), api_calls, input_hash)
+        )
+        self.conn.execute("DELETE FROM raw_present WHERE date = ?", (date_str,))
+        self.conn.executemany(
+            "INSERT INTO raw_present (date, source) VALUES (?, ?)",
+            [(date_str, source) for source in sources]
+        )
+
+    def commit(self):
+        """Write recorded dates to disk."""
+        self.conn.commit()
+
+    def close(self):
+        """Commit and close the database connection."""
+        self.conn.commit()
+        self.conn.close()
@@ -11,16 +11,25 @@ This module takes raw scraped data and produces drama scores, identifying:
 import os
 import sys
 import json
+import asyncio
+import heapq
+import importlib.util
 import re
+import time
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 from collections import defaultdict, Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+import numpy as np
 
 # Add parent directory for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from anthropic import Anthropic
+import httpx
+from anthropic import Anthropic, AsyncAnthropic, DefaultAsyncHttpxClient, DefaultHttpxClient
 from dotenv import load_dotenv
 
 from scrapers.utils import (
@@ -33,27 +42,221 @@ from scrapers.utils import (
 
 # Multi-dimensional analyzer
 from analyzer.multi_dimensional_analyzer import MultiDimensionalAnalyzer, ParticipantProfiler
+from analyzer.llm_cache import LLMCache, DEFAULT_CACHE_PATH
 
 # Load environment variables
 load_dotenv()
 
+# Common Bitcoin dev topics and the keywords that identify them
+_TOPIC_KEYWORDS = (
+    ('taproot', ('taproot', 'bip340', 'bip341', 'bip342')),
+    ('mempool', ('mempool', 'rbf', 'package relay', 'cluster mempool')),
+    ('wallet', ('wallet', 'descriptor', 'psbt')),
+    ('consensus', ('consensus', 'soft fork', 'hard fork', 'activation')),
+    ('p2p', ('p2p', 'peer', 'network', 'connection')),
+    ('testing', ('test', 'fuzzing', 'ci', 'coverage')),
+    ('gui', ('gui', 'qt', 'interface')),
+    ('rpc', ('rpc', 'rest', 'api')),
+    ('validation', ('validation', 'verify', 'check')),
+    ('mining', ('mining', 'block template', 'getblocktemplate')),
+)
+
+# Zero-width lookahead so overlapping keywords are still seen
+# (substring semantics, matched against lowercased text)
+_TOPIC_RE = re.compile('(?=' + '|'.join(
+    f"(?P<{topic}>{'|'.join(map(re.escape, keywords))})"
+    for topic, keywords in _TOPIC_KEYWORDS
+) + ')')
+
+@lru_cache(maxsize=4096)
+def _topics_for_text(text: str) -> Tuple[str, ...]:
+    """
+    Topics for a title, memoized.
+
+    Open PRs keep the same title across days, so backfills and re-runs
+    lowercase and scan each distinct title once.
+    """
+    text_lower = text.lower()
+
+    # One scan finds every topic with a keyword anywhere in the text
+    found = {match.lastgroup for match in _TOPIC_RE.finditer(text_lower)}
+    topics = [topic for topic, _ in _TOPIC_KEYWORDS if topic in found]
+
+    # Look for BIP/PR numbers
+    if 'bip' in text_lower or '#' in text:
+        if not any(t.startswith('BIP') for t in topics):
+            topics.append('BIP Discussion')
+
+    return tuple(topics) if topics else ('general',)
+
+
+# Content budgets for single-item and per-item batch analysis
+SINGLE_MAX_CHARS = 8000
+BATCH_MAX_CHARS = 2000
+
+# Score for trivially calm items that skip Claude
+CALM_DRAMA_SCORE = 1.0
+
+# Requests per Message Batches job when prefetching many dates
+BATCH_JOB_MAX_REQUESTS = 1000
+
+# Display names used in Claude contexts
+SOURCE_LABELS = {
+    'github': 'GitHub',
+    'bips': 'BIPs',
+}
+
+# Scoring criteria shared by single-item and batch prompts
+_DRAMA_CRITERIA = """1. **Drama Score (0-10)**: How contentious/heated is this discussion?
+   - 0-2: Calm, constructive, consensus
+   - 3-4: Minor disagreement, mostly constructive
+   - 5-6: Active debate, some friction
+   - 7-8: Heated discussion, significant disagreement
+   - 9-10: Highly contentious, strong opposition
+
+2. **Key Signals**: What specific indicators suggest drama?
+   - Strong disagreement phrases (NACK, "fundamentally wrong", etc.)
+   - Personal/political undertones
+   - References to past controversies
+   - Activation/consensus concerns
+
+3. **Main Topics**: What are the core topics being discussed?
+
+4. **Stance Summary**: What are the main positions/viewpoints?"""
+
+# Static instructions, sent as a cached system block on every analysis call
+DRAMA_RUBRIC = f"""You are analyzing Bitcoin developer discussions for signs of controversy, debate intensity, and consensus issues.
+
+The user message gives the context and the content to analyze. Please analyze this content and provide:
+
+{_DRAMA_CRITERIA}
+
+Record your analysis with the record_drama_analysis tool, including notable quotes or phrases as key_phrases."""
+
+BATCH_DRAMA_RUBRIC = f"""You are analyzing Bitcoin developer discussions for signs of controversy, debate intensity, and consensus issues.
+
+The user message is a JSON list of items, each with an id, context, and content. Analyze each item independently and provide:
+
+{_DRAMA_CRITERIA}
+
+Record your analyses with the record_drama_analyses tool, one result per item using the item's id, including notable quotes or phrases as key_phrases."""
+
+# Structured output: Claude is forced to call these tools, so the analysis
+# arrives as already-parsed tool input instead of JSON text
+_ANALYSIS_PROPERTIES = {
+    "drama_score": {"type": "number", "minimum": 0, "maximum": 10},
+    "signals": {"type": "array", "items": {"type": "string"}, "description": "Specific drama signals found"},
+    "topics": {"type": "array", "items": {"type": "string"}, "description": "Main topics"},
+    "stance_summary": {"type": "string", "description": "Brief summary of positions"},
+    "key_phrases": {"type": "array", "items": {"type": "string"}, "description": "Notable quotes or phrases"},
+}
+
+DRAMA_ANALYSIS_TOOL = {
+    "name": "record_drama_analysis",
+    "description": "Record the drama analysis of one discussion.",
+    "input_schema": {
+        "type": "object",
+        "properties": _ANALYSIS_PROPERTIES,
+        "required": list(_ANALYSIS_PROPERTIES),
+    },
+}
+
+BATCH_DRAMA_ANALYSIS_TOOL = {
+    "name": "record_drama_analyses",
+    "description": "Record the drama analysis of every item in the batch.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "results": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {"id": {"type": "integer"}, **_ANALYSIS_PROPERTIES},
+                    "required": ["id", *_ANALYSIS_PROPERTIES],
+                },
+            }
+        },
+        "required": ["results"],
+    },
+}
+
+
+# SDK-level retries for 429/529 and connection errors, with its backoff
+CLAUDE_MAX_RETRIES = 5
+
+# Keep idle connections for five minutes so a backfill's calls share them;
+# multiplex over HTTP/2 when the optional h2 package is installed
+_CLIENT_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=300)
+_HTTP2 = importlib.util.find_spec('h2') is not None
+
+# One sync client per API key, shared by every DramaScorer in the process
+_SHARED_CLIENTS: Dict[str, Anthropic] = {}
+
+
+def _shared_client(api_key: str) -> Anthropic:
+    """
+    Get the process-wide Anthropic client for an API key.
+
+    Reusing one client keeps its keep-alive connection pool, so scorers
+    created by schedulers or scripts skip the TCP/TLS handshake.
+    """
+    client = _SHARED_CLIENTS.get(api_key)
+    if client is None:
+        client = Anthropic(
+            api_key=api_key,
+            max_retries=CLAUDE_MAX_RETRIES,
+            http_client=DefaultHttpxClient(limits=_CLIENT_LIMITS, http2=_HTTP2)
+        )
+        _SHARED_CLIENTS[api_key] = client
+    return client
+
 
 class DramaScorer:
     """Analyzes Bitcoin dev discussions for drama/controversy signals."""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        use_claude: bool = False,
+        use_batch_api: bool = False,
+        batch_poll_interval: float = 30.0,
+        max_concurrency: int = 8,
+        cache_path: Optional[Path] = DEFAULT_CACHE_PATH
+    ):
         """
         Initialize the drama scorer.
 
         Args:
             api_key: Anthropic API key (or uses ANTHROPIC_API_KEY env var)
+            use_claude: If True, score GitHub/BIPs items with Claude instead
+                of the local multi-dimensional analyzer
+            use_batch_api: If True, send Claude requests through the Message
+                Batches API instead of synchronous calls
+            batch_poll_interval: Seconds between Message Batches status checks
+            max_concurrency: Maximum in-flight async Claude requests
+            cache_path: SQLite file for cached Claude analyses (None disables caching)
         """
         self.api_key = api_key or os.getenv('ANTHROPIC_API_KEY')
         if not self.api_key:
             raise ValueError("ANTHROPIC_API_KEY not found in environment")
 
-        self.client = Anthropic(api_key=self.api_key)
+        self.client = _shared_client(self.api_key)
+        self.async_client = AsyncAnthropic(
+            api_key=self.api_key,
+            max_retries=CLAUDE_MAX_RETRIES,
+            http_client=DefaultAsyncHttpxClient(limits=_CLIENT_LIMITS, http2=_HTTP2)
+        )
         self.model = "claude-sonnet-4-20250514"
+        # Cheaper model for items with no local drama signals
+        self.triage_model = "claude-haiku-4-5-20251001"
+        self.use_claude = use_claude
+        self.use_batch_api = use_batch_api
+        self.batch_poll_interval = batch_poll_interval
+        self.max_concurrency = max_concurrency
+        self._loop = None
+        self._semaphore = None
+        self.cache_path = cache_path
+        self._cache = None  # Opened on first Claude call
 
         # Add the multi-dimensional analyzer
         self.md_analyzer = MultiDimensionalAnalyzer()
@@ -118,123 +321,429 @@ class DramaScorer:
 
     def _create_drama_analysis_prompt(self, content: str, context: str = "GitHub PR") -> str:
         """
-        Create a prompt for Claude to analyze drama levels.
+        Create the per-item part of the drama analysis prompt.
+
+        The instructions live in DRAMA_RUBRIC and are sent as a cached
+        system block, so only the context and content vary per call.
 
         Args:
             content: The text content to analyze
             context: Context about the content (e.g., "GitHub PR", "IRC discussion")
 
         Returns:
-            Formatted prompt for Claude
+            Formatted user message for Claude
         """
-        return f"""You are analyzing Bitcoin developer discussions for signs of controversy, debate intensity, and consensus issues.
+        return f"Context: {context}\n\n{content}"
 
-Context: {context}
+    def _cached_system(self, rubric: str) -> List[Dict]:
+        """Wrap a static rubric as a system block marked for prompt caching."""
+        return [{
+            "type": "text",
+            "text": rubric,
+            "cache_control": {"type": "ephemeral"}
+        }]
 
-Content to analyze:
-{content}
+    def _analysis_request_params(self, content: str, context: str, model: Optional[str] = None) -> Dict:
+        """
+        Build messages.create parameters for a single-item analysis.
 
-Please analyze this content and provide:
+        Args:
+            content: Text to analyze
+            context: Context description
+            model: Claude model ID (defaults to self.model)
 
-1. **Drama Score (0-10)**: How contentious/heated is this discussion?
-   - 0-2: Calm, constructive, consensus
-   - 3-4: Minor disagreement, mostly constructive
-   - 5-6: Active debate, some friction
-   - 7-8: Heated discussion, significant disagreement
-   - 9-10: Highly contentious, strong opposition
+        Returns:
+            Keyword arguments for a Claude messages request
+        """
+        return {
+            "model": model or self.model,
+            "max_tokens": 1024,
+            "system": self._cached_system(DRAMA_RUBRIC),
+            "tools": [DRAMA_ANALYSIS_TOOL],
+            "tool_choice": {"type": "tool", "name": DRAMA_ANALYSIS_TOOL["name"]},
+            "messages": [{
+                "role": "user",
+                "content": self._create_drama_analysis_prompt(
+                    self._truncate(content, SINGLE_MAX_CHARS), context
+                )
+            }]
+        }
 
-2. **Key Signals**: What specific indicators suggest drama?
-   - Strong disagreement phrases (NACK, "fundamentally wrong", etc.)
-   - Personal/political undertones
-   - References to past controversies
-   - Activation/consensus concerns
+    def _tool_input(self, message, tool_name: str) -> Dict:
+        """
+        Get the input of the forced tool call from a Claude message.
 
-3. **Main Topics**: What are the core topics being discussed?
+        Args:
+            message: Claude response message
+            tool_name: Name of the tool Claude was required to call
 
-4. **Stance Summary**: What are the main positions/viewpoints?
+        Returns:
+            The tool input (already a parsed dict)
 
-Respond in JSON format:
-{{
-  "drama_score": <number 0-10>,
-  "signals": [<list of specific drama signals found>],
-  "topics": [<list of main topics>],
-  "stance_summary": "<brief summary of positions>",
-  "key_phrases": [<notable quotes or phrases>]
-}}"""
+        Raises:
+            ValueError: If the message has no call to that tool
+        """
+        for block in message.content:
+            if block.type == "tool_use" and block.name == tool_name:
+                return dict(block.input)
+        raise ValueError(f"No {tool_name} tool call in Claude response")
 
-    def analyze_text(self, content: str, context: str = "discussion") -> Dict:
+    def _truncate(self, content: str, max_chars: int) -> str:
+        """Truncate very long content to stay within limits."""
+        if len(content) > max_chars:
+            return content[:max_chars] + "\n\n[Content truncated...]"
+        return content
+
+    def _cache_key(self, content: str, context: str, model: Optional[str], max_chars: int) -> str:
+        """Cache key for content as it is actually sent to Claude."""
+        return LLMCache.make_key(model or self.model, context, self._truncate(content, max_chars))
+
+    def _batch_cache_key(self, item: Dict, model: Optional[str] = None) -> str:
+        """Cache key for a batch item."""
+        return self._cache_key(
+            item['content'], item.get('context', 'discussion'), model, BATCH_MAX_CHARS
+        )
+
+    def _get_cache(self) -> Optional[LLMCache]:
+        """Open the analysis cache on first use (None with caching disabled)."""
+        if self.cache_path is None:
+            return None
+        if self._cache is None:
+            self._cache = LLMCache(self.cache_path)
+        return self._cache
+
+    def _cache_get(self, key: str) -> Optional[Dict]:
+        """Look up a cached analysis (None on a miss or with caching disabled)."""
+        cache = self._get_cache()
+        return cache.get(key) if cache else None
+
+    def _cache_set(self, key: str, result: Dict):
+        """Store a successful analysis in the cache."""
+        cache = self._get_cache()
+        if cache:
+            cache.set(key, result)
+
+    def _stored_item_analysis(self, item: Dict, model: str) -> Optional[Dict]:
+        """Previous analysis of a PR/issue if its updated_at hasn't changed."""
+        cache = self._get_cache()
+        if not cache or not item.get('url') or not item.get('updated_at'):
+            return None
+        return cache.get_item(item['url'], model, item['updated_at'])
+
+    def analyze_text(self, content: str, context: str = "discussion", model: Optional[str] = None) -> Dict:
         """
         Use Claude API to analyze a piece of text for drama signals.
 
         Args:
             content: Text to analyze
             context: Context description
+            model: Claude model ID (defaults to self.model)
 
         Returns:
             Analysis results dict with drama_score and signals
         """
-        # Truncate very long content to stay within limits
-        max_chars = 8000
-        if len(content) > max_chars:
-            content = content[:max_chars] + "\n\n[Content truncated...]"
-
-        prompt = self._create_drama_analysis_prompt(content, context)
+        key = self._cache_key(content, context, model, SINGLE_MAX_CHARS)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
 
         try:
             response = self.client.messages.create(
-                model=self.model,
-                max_tokens=1024,
-                messages=[{
-                    "role": "user",
-                    "content": prompt
-                }]
+                **self._analysis_request_params(content, context, model)
             )
+            result = self._tool_input(response, DRAMA_ANALYSIS_TOOL["name"])
+            self._cache_set(key, result)
+            return result
+
+        except Exception as e:
+            logger.error(f"Error analyzing with Claude API: {e}")
+            # Return default low-drama result on error
+            return self._default_analysis()
+
+    async def analyze_text_async(self, content: str, context: str = "discussion", model: Optional[str] = None) -> Dict:
+        """
+        Async version of analyze_text, bounded by the shared request semaphore.
 
-            # Extract JSON from response
-            response_text = response.content[0].text
+        Args:
+            content: Text to analyze
+            context: Context description
+            model: Claude model ID (defaults to self.model)
 
-            # Try to parse JSON (Claude might wrap it in markdown code blocks)
-            json_match = re.search(r'```json\s*(.*?)\s*```', response_text, re.DOTALL)
-            if json_match:
-                response_text = json_match.group(1)
+        Returns:
+            Analysis results dict with drama_score and signals
+        """
+        key = self._cache_key(content, context, model, SINGLE_MAX_CHARS)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
 
-            result = json.loads(response_text)
+        try:
+            async with self._semaphore:
+                response = await self.async_client.messages.create(
+                    **self._analysis_request_params(content, context, model)
+                )
+            result = self._tool_input(response, DRAMA_ANALYSIS_TOOL["name"])
+            self._cache_set(key, result)
             return result
 
         except Exception as e:
             logger.error(f"Error analyzing with Claude API: {e}")
-            # Return default low-drama result on error
-            return {
-                "drama_score": 2.0,
-                "signals": [],
-                "topics": ["unknown"],
-                "stance_summary": "Unable to analyze",
-                "key_phrases": []
+            return self._default_analysis()
+
+    def _default_analysis(self) -> Dict:
+        """Default low-drama result used when Claude analysis fails."""
+        return {
+            "drama_score": 2.0,
+            "signals": [],
+            "topics": ["unknown"],
+            "stance_summary": "Unable to analyze",
+            "key_phrases": []
+        }
+
+    def _create_batch_analysis_prompt(self, items: List[Dict]) -> str:
+        """
+        Create the per-request part of the batch analysis prompt.
+
+        Args:
+            items: List of {"id", "context", "content"} dicts
+
+        Returns:
+            Formatted user message for Claude
+        """
+        return f"Items to analyze:\n{json.dumps(items, ensure_ascii=False, indent=1)}"
+
+    def _batch_request_params(self, items: List[Dict], model: Optional[str] = None) -> Dict:
+        """
+        Build messages.create parameters for a batch of items.
+
+        Args:
+            items: List of dicts with 'content' and optional 'context' keys
+            model: Claude model ID (defaults to self.model)
+
+        Returns:
+            Keyword arguments for a Claude messages request
+        """
+        batch = [
+            {
+                "id": i,
+                "context": item.get('context', 'discussion'),
+                "content": self._truncate(item['content'], BATCH_MAX_CHARS)
             }
+            for i, item in enumerate(items)
+        ]
 
-    def analyze_github_pr(self, pr: Dict) -> Dict:
+        return {
+            "model": model or self.model,
+            "max_tokens": min(300 * len(batch) + 256, 16000),
+            "system": self._cached_system(BATCH_DRAMA_RUBRIC),
+            "tools": [BATCH_DRAMA_ANALYSIS_TOOL],
+            "tool_choice": {"type": "tool", "name": BATCH_DRAMA_ANALYSIS_TOOL["name"]},
+            "messages": [{
+                "role": "user",
+                "content": self._create_batch_analysis_prompt(batch)
+            }]
+        }
+
+    def _parse_batch_response(
+        self,
+        message,
+        items: List[Dict],
+        model: Optional[str] = None
+    ) -> List[Dict]:
         """
-        Analyze a GitHub PR for drama signals using multi-dimensional analyzer.
+        Map a batch response back onto its items by id and cache the results.
 
         Args:
-            pr: PR data dict from scraper
+            message: Claude response message (None if the request failed)
+            items: Items that were sent in the batch
+            model: Claude model ID the batch was sent to
 
         Returns:
-            Enhanced PR dict with drama analysis
+            List of analysis result dicts, one per item
+        """
+        count = len(items)
+        results = {}
+        if message is not None:
+            try:
+                tool_input = self._tool_input(message, BATCH_DRAMA_ANALYSIS_TOOL["name"])
+                for result in tool_input.get('results', []):
+                    try:
+                        results[int(result.pop('id'))] = result
+                    except (KeyError, TypeError, ValueError):
+                        continue
+            except Exception as e:
+                logger.error(f"Error parsing Claude batch response: {e}")
+
+        missing = count - sum(1 for i in range(count) if i in results)
+        if missing:
+            logger.warning(f"Claude returned no analysis for {missing}/{count} items")
+
+        cache = self._get_cache()
+        for i, result in results.items():
+            if 0 <= i < count and result and cache:
+                item = items[i]
+                cache.set(self._batch_cache_key(item, model), result)
+                if item.get('url') and item.get('updated_at'):
+                    cache.set_item(item['url'], model or self.model, item['updated_at'], result)
+
+        return [results.get(i) or self._default_analysis() for i in range(count)]
+
+    def _lookup_batch(self, items: List[Dict], model: Optional[str] = None) -> Tuple[List[Optional[Dict]], List[Dict]]:
+        """
+        Split batch items into cached results and items still to analyze.
+
+        Args:
+            items: List of dicts with 'content' and optional 'context' keys
+            model: Claude model ID (defaults to self.model)
+
+        Returns:
+            Tuple of (results with None for misses, items that missed the cache)
+        """
+        results = [self._cache_get(self._batch_cache_key(item, model)) for item in items]
+        misses = [item for item, result in zip(items, results) if result is None]
+        return results, misses
+
+    def _merge_batch(self, results: List[Optional[Dict]], fresh: List[Dict]) -> List[Dict]:
+        """Fill the cache misses from _lookup_batch with freshly parsed results, in order."""
+        fresh = iter(fresh)
+        return [result if result is not None else next(fresh) for result in results]
+
+    def analyze_batch(self, items: List[Dict], model: Optional[str] = None) -> List[Dict]:
+        """
+        Use a single Claude API request to analyze many items for drama signals.
+
+        Args:
+            items: List of dicts with 'content' and optional 'context' keys
+            model: Claude model ID (defaults to self.model)
+
+        Returns:
+            List of analysis result dicts, in the same order as items
+        """
+        results, misses = self._lookup_batch(items, model)
+        if not misses:
+            return results
+
+        response = None
+        try:
+            response = self.client.messages.create(**self._batch_request_params(misses, model))
+        except Exception as e:
+            logger.error(f"Error analyzing batch with Claude API: {e}")
+
+        return self._merge_batch(results, self._parse_batch_response(response, misses, model))
+
+    async def analyze_batch_async(self, items: List[Dict], model: Optional[str] = None) -> List[Dict]:
+        """
+        Async version of analyze_batch, bounded by the shared request semaphore.
+
+        Args:
+            items: List of dicts with 'content' and optional 'context' keys
+            model: Claude model ID (defaults to self.model)
+
+        Returns:
+            List of analysis result dicts, in the same order as items
+        """
+        results, misses = self._lookup_batch(items, model)
+        if not misses:
+            return results
+
+        response = None
+        try:
+            async with self._semaphore:
+                response = await self.async_client.messages.create(
+                    **self._batch_request_params(misses, model)
+                )
+        except Exception as e:
+            logger.error(f"Error analyzing batch with Claude API: {e}")
+
+        return self._merge_batch(results, self._parse_batch_response(response, misses, model))
+
+    def _run_async(self, coro):
+        """
+        Run a coroutine on the scorer's event loop.
+
+        The loop is kept for the scorer's lifetime so the AsyncAnthropic
+        connection pool stays usable across calls (e.g. one per backfill date).
+        """
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._loop.run_until_complete(coro)
+
+    def submit_batch(self, requests: List[Dict]) -> Dict[str, Optional[object]]:
+        """
+        Run requests through the Message Batches API and wait for the results.
+
+        Batches are billed at half the synchronous price, which suits the
+        daily job where nothing waits on an individual response.
+
+        Args:
+            requests: List of {"custom_id": str, "params": dict} entries
+
+        Returns:
+            Dict mapping custom_id to the response message (None if the request failed)
+        """
+        if not requests:
+            return {}
+
+        batch = self.client.messages.batches.create(requests=requests)
+        logger.info(f"Submitted message batch {batch.id} with {len(requests)} requests")
+
+        while batch.processing_status != "ended":
+            time.sleep(self.batch_poll_interval)
+            batch = self.client.messages.batches.retrieve(batch.id)
+            logger.info(f"Message batch {batch.id}: {batch.processing_status}")
+
+        results = {entry['custom_id']: None for entry in requests}
+        for entry in self.client.messages.batches.results(batch.id):
+            if entry.result.type == "succeeded":
+                results[entry.custom_id] = entry.result.message
+            else:
+                logger.error(f"Batch request {entry.custom_id} {entry.result.type}")
+
+        return results
+
+    def _build_item_content(self, item: Dict, kind: str, max_chars: Optional[int] = None) -> str:
+        """
+        Combine a PR/issue title, body, and comments into analysis text.
+
+        Args:
+            item: PR or issue data dict from scraper
+            kind: Label for the item ("PR" or "Issue")
+            max_chars: If set, stop adding parts once the text is longer than
+                this; the result truncates to the same text as the full one
+
+        Returns:
+            Text to analyze
         """
-        # Combine PR title, body, and comments into analysis text
         content_parts = [
-            f"PR #{pr['number']}: {pr['title']}",
-            pr.get('body', '')[:1000]  # First 1000 chars of body
+            f"{kind} #{item['number']}: {item['title']}",
+            item.get('body', '')[:1000]  # First 1000 chars of body
         ]
+        length = len(content_parts[0]) + 2 + len(content_parts[1])
 
         # Add comments if available
-        if pr.get('comment_data'):
-            comments = pr['comment_data'][:10]  # First 10 comments
+        if item.get('comment_data'):
+            comments = item['comment_data'][:10]  # First 10 comments
             for comment in comments:
-                content_parts.append(f"Comment by {comment['user']}: {comment['body'][:300]}")
+                if max_chars is not None and length > max_chars:
+                    break
+                part = f"Comment by {comment['user']}: {comment['body'][:300]}"
+                content_parts.append(part)
+                length += 2 + len(part)
+
+        return "\n\n".join(content_parts)
+
+    def analyze_github_pr(self, pr: Dict) -> Dict:
+        """
+        Analyze a GitHub PR for drama signals using multi-dimensional analyzer.
+
+        Args:
+            pr: PR data dict from scraper
 
-        full_content = "\n\n".join(content_parts)
+        Returns:
+            Enhanced PR dict with drama analysis
+        """
+        full_content = self._build_item_content(pr, "PR")
 
         # Use multi-dimensional analyzer
         analysis = self.analyze_content(full_content, author=pr.get('user'))
@@ -255,17 +764,7 @@ Respond in JSON format:
         Returns:
             Enhanced issue dict with drama analysis
         """
-        content_parts = [
-            f"Issue #{issue['number']}: {issue['title']}",
-            issue.get('body', '')[:1000]
-        ]
-
-        if issue.get('comment_data'):
-            comments = issue['comment_data'][:10]
-            for comment in comments:
-                content_parts.append(f"Comment by {comment['user']}: {comment['body'][:300]}")
-
-        full_content = "\n\n".join(content_parts)
+        full_content = self._build_item_content(issue, "Issue")
 
         # Use multi-dimensional analyzer
         analysis = self.analyze_content(full_content, author=issue.get('user'))
@@ -276,6 +775,226 @@ Respond in JSON format:
             'drama_score': analysis['drama_score']
         }
 
+    def _pick_model(self, item: Dict) -> str:
+        """
+        Choose the Claude model for an item from its local drama signals.
+
+        Items with no drama keywords and no NACK in the body or included
+        comments go to the cheaper triage model; anything else, or items
+        without signals, go to the main model.
+
+        Args:
+            item: PR or issue data dict from scraper
+
+        Returns:
+            Claude model ID
+        """
+        return self.model if self._has_drama_signals(item) else self.triage_model
+
+    def _has_drama_signals(self, item: Dict) -> bool:
+        """
+        Check an item's local drama signals (body and included comments).
+
+        Args:
+            item: PR or issue data dict from scraper
+
+        Returns:
+            True if any drama keyword or NACK was seen, or the item has no signals
+        """
+        signal_sets = [item.get('drama_signals')] + [
+            comment.get('drama_signals') for comment in item.get('comment_data', [])[:10]
+        ]
+        if signal_sets[0] is None:
+            return True
+
+        for signals in signal_sets:
+            if signals and (signals.get('drama_keywords', 0) > 0 or signals.get('has_nack')):
+                return True
+        return False
+
+    def _is_trivially_calm(self, item: Dict) -> bool:
+        """Items with no drama signals and little discussion aren't worth a Claude call."""
+        comment_count = item.get('comments', 0) + item.get('review_comments', 0)
+        return comment_count < 5 and not self._has_drama_signals(item)
+
+    def _claude_request_groups(self, data: Dict, source: str) -> Tuple[Dict[str, List[Dict]], List[float]]:
+        """
+        Sample PRs and issues and group their Claude batch items by model.
+
+        Trivially calm items are not sent and score CALM_DRAMA_SCORE; items
+        unchanged (same updated_at) since their last analysis reuse it.
+
+        Args:
+            data: GitHub or BIPs data dict from scraper
+            source: Source key ('github' or 'bips')
+
+        Returns:
+            Tuple of (dict mapping model ID to the batch items routed to it,
+            scores of items that need no request)
+        """
+        prs = data.get('pull_requests', [])[:20]  # Sample first 20
+        issues = data.get('issues', [])[:10]  # Sample first 10
+        label = SOURCE_LABELS[source]
+
+        groups = defaultdict(list)
+        local_scores = []
+        for kind, context, items in (("PR", f"{label} PR", prs), ("Issue", f"{label} issue", issues)):
+            for item in items:
+                if self._is_trivially_calm(item):
+                    local_scores.append(CALM_DRAMA_SCORE)
+                    continue
+
+                model = self._pick_model(item)
+                stored = self._stored_item_analysis(item, model)
+                if stored is not None:
+                    local_scores.append(float(stored.get('drama_score', 2.0)))
+                    continue
+
+                groups[model].append({
+                    'context': context,
+                    'content': self._build_item_content(item, kind, BATCH_MAX_CHARS),
+                    'url': item.get('url'),
+                    'updated_at': item.get('updated_at')
+                })
+        return dict(groups), local_scores
+
+    def _score_github_items(self, data: Dict, source: str) -> List[float]:
+        """
+        Score a sample of PRs and issues from a GitHub-style data dict.
+
+        With Claude enabled, the sample is analyzed in one request per model.
+
+        Args:
+            data: GitHub or BIPs data dict from scraper
+            source: Source key ('github' or 'bips')
+
+        Returns:
+            List of drama scores for the sampled items
+        """
+        if not self.use_claude:
+            prs = data.get('pull_requests', [])[:20]  # Sample first 20
+            issues = data.get('issues', [])[:10]  # Sample first 10
+            return (
+                [self.analyze_github_pr(pr)['drama_score'] for pr in prs] +
+                [self.analyze_github_issue(issue)['drama_score'] for issue in issues]
+            )
+
+        return self._score_with_claude({source: data})[source]
+
+    def _score_with_claude(self, sources: Dict[str, Dict]) -> Dict[str, List[float]]:
+        """
+        Score every source's sample with concurrent Claude batch requests.
+
+        Args:
+            sources: Dict mapping source key to its GitHub-style data dict
+
+        Returns:
+            Dict mapping source key to the list of drama scores
+        """
+        scores = {source: [] for source in sources}
+        requests = []
+        for source, data in sources.items():
+            groups, local_scores = self._claude_request_groups(data, source)
+            scores[source].extend(local_scores)
+            requests.extend((source, model, items) for model, items in groups.items())
+
+        async def gather():
+            return await asyncio.gather(*[
+                self.analyze_batch_async(items, model=model) for _, model, items in requests
+            ])
+
+        for (source, _, _), analyses in zip(requests, self._run_async(gather())):
+            scores[source].extend(float(analysis.get('drama_score', 2.0)) for analysis in analyses)
+        return scores
+
+    def _score_with_batch_api(self, sources: Dict[str, Dict]) -> Dict[str, List[float]]:
+        """
+        Score every source's sample through a single Message Batches job.
+
+        Args:
+            sources: Dict mapping source key to its GitHub-style data dict
+
+        Returns:
+            Dict mapping source key to the list of drama scores
+        """
+        scores = {source: [] for source in sources}
+        pending = {}
+        for source, data in sources.items():
+            groups, local_scores = self._claude_request_groups(data, source)
+            scores[source].extend(local_scores)
+            for i, (model, items) in enumerate(groups.items()):
+                results, misses = self._lookup_batch(items, model)
+                pending[f"{source}_{i}"] = (source, model, results, misses)
+
+        responses = self.submit_batch([
+            {"custom_id": custom_id, "params": self._batch_request_params(misses, model=model)}
+            for custom_id, (_, model, _, misses) in pending.items()
+            if misses
+        ])
+
+        for custom_id, (source, model, results, misses) in pending.items():
+            if misses:
+                fresh = self._parse_batch_response(responses.get(custom_id), misses, model)
+                results = self._merge_batch(results, fresh)
+            scores[source].extend(float(analysis.get('drama_score', 2.0)) for analysis in results)
+        return scores
+
+    def prefetch_batch(self, date_strs: List[str], max_requests: int = BATCH_JOB_MAX_REQUESTS) -> int:
+        """
+        Analyze the GitHub/BIPs samples of many dates in shared Message Batches jobs.
+
+        Results are written to the analysis cache, so process_all_data for
+        each date afterwards finds its items already analyzed instead of
+        submitting one small job per date.
+
+        Args:
+            date_strs: Dates (YYYY-MM-DD) whose raw data to analyze
+            max_requests: Requests per job before it is submitted
+
+        Returns:
+            Number of batch requests sent
+        """
+        if self._get_cache() is None:
+            logger.warning("Batch prefetch needs the analysis cache; skipping")
+            return 0
+
+        sent = 0
+        pending = {}
+        queued = set()
+        for date_str in date_strs:
+            for source in ('github', 'bips'):
+                data = load_raw_data(source, date_str)
+                if not data:
+                    continue
+                groups, _ = self._claude_request_groups(data, source)
+                for i, (model, items) in enumerate(groups.items()):
+                    _, misses = self._lookup_batch(items, model)
+                    # Open items recur across dates; send each one once
+                    fresh = []
+                    for item in misses:
+                        key = self._batch_cache_key(item, model)
+                        if key not in queued:
+                            queued.add(key)
+                            fresh.append(item)
+                    if fresh:
+                        pending[f"{date_str}_{source}_{i}"] = (model, fresh)
+
+            if len(pending) >= max_requests:
+                sent += self._submit_prefetch(pending)
+                pending = {}
+
+        return sent + self._submit_prefetch(pending)
+
+    def _submit_prefetch(self, pending: Dict[str, Tuple[str, List[Dict]]]) -> int:
+        """Submit prefetch requests as one job and cache the parsed results."""
+        responses = self.submit_batch([
+            {"custom_id": custom_id, "params": self._batch_request_params(misses, model=model)}
+            for custom_id, (model, misses) in pending.items()
+        ])
+        for custom_id, (model, misses) in pending.items():
+            self._parse_batch_response(responses.get(custom_id), misses, model)
+        return len(pending)
+
     def calculate_daily_scores(
         self,
         github_data: Optional[Dict] = None,
@@ -303,39 +1022,26 @@ Respond in JSON format:
             'overall': 0.0
         }
 
-        # Calculate GitHub score if data available
-        if github_data:
-            all_scores = []
-
-            # Analyze PRs
-            for pr in github_data.get('pull_requests', [])[:20]:  # Sample first 20
-                analyzed = self.analyze_github_pr(pr)
-                all_scores.append(analyzed['drama_score'])
-
-            # Analyze issues
-            for issue in github_data.get('issues', [])[:10]:  # Sample first 10
-                analyzed = self.analyze_github_issue(issue)
-                all_scores.append(analyzed['drama_score'])
-
-            if all_scores:
-                scores['github'] = round(sum(all_scores) / len(all_scores), 1)
-
-        # Calculate BIPs score if data available
-        if bips_data:
-            all_scores = []
-
-            # Analyze BIP PRs
-            for pr in bips_data.get('pull_requests', [])[:20]:  # Sample first 20
-                analyzed = self.analyze_github_pr(pr)
-                all_scores.append(analyzed['drama_score'])
+        # Calculate GitHub and BIPs scores if data available
+        github_sources = {
+            source: data
+            for source, data in (('github', github_data), ('bips', bips_data))
+            if data
+        }
 
-            # Analyze BIP issues
-            for issue in bips_data.get('issues', [])[:10]:  # Sample first 10
-                analyzed = self.analyze_github_issue(issue)
-                all_scores.append(analyzed['drama_score'])
+        if self.use_claude and self.use_batch_api:
+            source_scores = self._score_with_batch_api(github_sources)
+        elif self.use_claude:
+            source_scores = self._score_with_claude(github_sources)
+        else:
+            source_scores = {
+                source: self._score_github_items(data, source)
+                for source, data in github_sources.items()
+            }
 
+        for source, all_scores in source_scores.items():
             if all_scores:
-                scores['bips'] = round(sum(all_scores) / len(all_scores), 1)
+                scores[source] = round(sum(all_scores) / len(all_scores), 1)
 
         # Calculate IRC score if data available
         if irc_data:
@@ -371,12 +1077,127 @@ Respond in JSON format:
 
         return scores
 
+    def _aggregate(
+        self,
+        github_data: Optional[Dict] = None,
+        bips_data: Optional[Dict] = None
+    ) -> Dict:
+        """
+        Collect hot topic, spicy thread, and participant aggregates in one pass.
+
+        Each PR/issue is visited once; the formatters (extract_hot_topics,
+        identify_spicy_threads, identify_key_participants) build their output
+        from the result. Hot topics only sample the first 30 PRs and 20 issues
+        per source; threads and participants use every item.
+
+        Args:
+            github_data: GitHub data dict
+            bips_data: BIPs repository data dict
+
+        Returns:
+            Dict of aggregates keyed by name
+        """
+        topics_counter = Counter()
+        topic_drama_scores = defaultdict(list)
+        topic_sources = defaultdict(set)
+        candidates = []  # (source, id_prefix, item, signals) for spicy scoring
+        participant_stats = defaultdict(lambda: [0, 0])  # [messages, drama keyword total]
+
+        for source, id_prefix, data in (('github', 'gh', github_data), ('bips', 'bip', bips_data)):
+            if not data:
+                continue
+
+            for items, topic_sample in (
+                (data.get('pull_requests', []), 30),
+                (data.get('issues', []), 20)
+            ):
+                for index, item in enumerate(items):
+                    signals = item.get('drama_signals', {})
+                    drama_keywords = signals.get('drama_keywords', 0)
+
+                    # Hot topics: extract topics from title of sampled items
+                    if index < topic_sample:
+                        for topic in self._extract_topics_from_text(item['title']):
+                            topics_counter[topic] += 1
+                            topic_drama_scores[topic].append(drama_keywords)
+                            topic_sources[topic].add(source)
+
+                    # Spicy threads: scored together after the pass
+                    candidates.append((source, id_prefix, item, signals))
+
+                    # Key participants: count PR/issue authors
+                    stats = participant_stats[item['user']]
+                    stats[0] += 1
+                    stats[1] += drama_keywords
+
+        # Spicy threads: quick drama score from basic signals
+        drama_scores = self._quick_drama_scores([signals for _, _, _, signals in candidates], [
+            item.get('comments', 0) + item.get('review_comments', 0) for _, _, item, _ in candidates
+        ])
+
+        threads = []
+        for index in np.flatnonzero(drama_scores >= 4.0):  # Only include moderately spicy threads
+            source, id_prefix, item, signals = candidates[index]
+            threads.append({
+                'id': f"{id_prefix}-{item['number']}",
+                'title': item['title'],
+                'source': source,
+                'drama_score': round(float(drama_scores[index]), 1),
+                'date': item['created_at'][:10],
+                'participants': [item['user']],
+                'nack_count': 1 if signals.get('has_nack') else 0,
+                'ack_count': 1 if signals.get('has_ack') else 0,
+                'key_phrases': [],  # Would need full analysis
+                'url': item['url']
+            })
+
+        return {
+            'topics_counter': topics_counter,
+            'topic_drama_scores': topic_drama_scores,
+            'topic_sources': topic_sources,
+            'threads': threads,
+            'participant_stats': participant_stats,
+        }
+
+    def _quick_drama_scores(self, signals_list: List[Dict], comment_counts: List[int]) -> np.ndarray:
+        """
+        Vectorized quick drama score for a batch of items.
+
+        Score is drama_keywords * 2 + has_nack * 3 - positive_keywords * 0.5,
+        plus 2 for more than 20 comments (1 for more than 10), clamped to 0-10.
+
+        Args:
+            signals_list: basic drama_signals dict for each item
+            comment_counts: comments + review_comments for each item
+
+        Returns:
+            Float array of scores, one per item
+        """
+        count = len(signals_list)
+        drama_keywords = np.fromiter(
+            (signals.get('drama_keywords', 0) for signals in signals_list), dtype=np.float64, count=count
+        )
+        has_nack = np.fromiter(
+            (bool(signals.get('has_nack', False)) for signals in signals_list), dtype=np.float64, count=count
+        )
+        positive_keywords = np.fromiter(
+            (signals.get('positive_keywords', 0) for signals in signals_list), dtype=np.float64, count=count
+        )
+        comments = np.asarray(comment_counts, dtype=np.int64)
+
+        # Boost score for high activity
+        activity_boost = np.where(comments > 20, 2.0, np.where(comments > 10, 1.0, 0.0))
+
+        scores = drama_keywords * 2.0 + has_nack * 3.0 - positive_keywords * 0.5 + activity_boost
+        return np.clip(scores, 0, 10)
+
     def extract_hot_topics(
         self,
         github_data: Optional[Dict] = None,
         bips_data: Optional[Dict] = None,
         irc_data: Optional[Dict] = None,
-        mailing_list_data: Optional[Dict] = None
+        mailing_list_data: Optional[Dict] = None,
+        aggregates: Optional[Dict] = None
     ) -> List[Dict]:
         """
         Extract hot topics from discussions.
@@ -386,56 +1207,20 @@ Respond in JSON format:
             bips_data: BIPs repository data dict
             irc_data: IRC data dict
             mailing_list_data: Mailing list data dict
+            aggregates: Precomputed result of _aggregate (computed if omitted)
 
         Returns:
             List of hot topics with heat scores
         """
-        topics_counter = Counter()
-        topic_drama_scores = defaultdict(list)
-        topic_sources = defaultdict(set)
-
-        if github_data:
-            # Analyze a sample of PRs and issues
-            items = (
-                github_data.get('pull_requests', [])[:30] +
-                github_data.get('issues', [])[:20]
-            )
-
-            for item in items:
-                # Quick analysis or use existing basic drama signals
-                content = f"{item['title']} {item.get('body', '')}"
-                drama_score = item.get('drama_signals', {}).get('drama_keywords', 0)
-
-                # Extract topics from title (simple approach)
-                # Look for BIP numbers, feature names, etc.
-                topics = self._extract_topics_from_text(item['title'])
-
-                for topic in topics:
-                    topics_counter[topic] += 1
-                    topic_drama_scores[topic].append(drama_score)
-                    topic_sources[topic].add('github')
-
-        if bips_data:
-            # Analyze BIPs PRs and issues
-            items = (
-                bips_data.get('pull_requests', [])[:30] +
-                bips_data.get('issues', [])[:20]
-            )
-
-            for item in items:
-                content = f"{item['title']} {item.get('body', '')}"
-                drama_score = item.get('drama_signals', {}).get('drama_keywords', 0)
+        if aggregates is None:
+            aggregates = self._aggregate(github_data, bips_data)
 
-                topics = self._extract_topics_from_text(item['title'])
-
-                for topic in topics:
-                    topics_counter[topic] += 1
-                    topic_drama_scores[topic].append(drama_score)
-                    topic_sources[topic].add('bips')
+        topic_drama_scores = aggregates['topic_drama_scores']
+        topic_sources = aggregates['topic_sources']
 
         # Build hot topics list
         hot_topics = []
-        for topic, count in topics_counter.most_common(10):
+        for topic, count in aggregates['topics_counter'].most_common(10):
             scores = topic_drama_scores[topic]
             avg_score = sum(scores) / len(scores) if scores else 0
 
@@ -463,33 +1248,7 @@ Respond in JSON format:
         Returns:
             List of identified topics
         """
-        text_lower = text.lower()
-        topics = []
-
-        # Common Bitcoin dev topics
-        topic_keywords = {
-            'taproot': ['taproot', 'bip340', 'bip341', 'bip342'],
-            'mempool': ['mempool', 'rbf', 'package relay', 'cluster mempool'],
-            'wallet': ['wallet', 'descriptor', 'psbt'],
-            'consensus': ['consensus', 'soft fork', 'hard fork', 'activation'],
-            'p2p': ['p2p', 'peer', 'network', 'connection'],
-            'testing': ['test', 'fuzzing', 'ci', 'coverage'],
-            'gui': ['gui', 'qt', 'interface'],
-            'rpc': ['rpc', 'rest', 'api'],
-            'validation': ['validation', 'verify', 'check'],
-            'mining': ['mining', 'block template', 'getblocktemplate'],
-        }
-
-        for topic, keywords in topic_keywords.items():
-            if any(kw in text_lower for kw in keywords):
-                topics.append(topic)
-
-        # Look for BIP/PR numbers
-        if 'bip' in text_lower or '#' in text:
-            if not any(t.startswith('BIP') for t in topics):
-                topics.append('BIP Discussion')
-
-        return topics if topics else ['general']
+        return list(_topics_for_text(text))
 
     def identify_spicy_threads(
         self,
@@ -497,7 +1256,8 @@ Respond in JSON format:
         bips_data: Optional[Dict] = None,
         irc_data: Optional[Dict] = None,
         mailing_list_data: Optional[Dict] = None,
-        limit: int = 10
+        limit: int = 10,
+        aggregates: Optional[Dict] = None
     ) -> List[Dict]:
         """
         Identify the most contentious threads/discussions.
@@ -508,97 +1268,16 @@ Respond in JSON format:
             irc_data: IRC data dict
             mailing_list_data: Mailing list data dict
             limit: Number of threads to return
+            aggregates: Precomputed result of _aggregate (computed if omitted)
 
         Returns:
             List of spicy threads with drama scores
         """
-        threads = []
+        if aggregates is None:
+            aggregates = self._aggregate(github_data, bips_data)
 
-        # Process GitHub data
-        if github_data:
-            # Combine PRs and issues
-            items = github_data.get('pull_requests', []) + github_data.get('issues', [])
-
-            # Score each item based on basic signals
-            for item in items:
-                signals = item.get('drama_signals', {})
-
-                # Calculate a quick drama score
-                drama_score = (
-                    signals.get('drama_keywords', 0) * 2.0 +
-                    signals.get('has_nack', False) * 3.0 -
-                    signals.get('positive_keywords', 0) * 0.5
-                )
-
-                comment_count = item.get('comments', 0) + item.get('review_comments', 0)
-
-                # Boost score for high activity
-                if comment_count > 20:
-                    drama_score += 2.0
-                elif comment_count > 10:
-                    drama_score += 1.0
-
-                # Normalize to 0-10
-                drama_score = max(0, min(10, drama_score))
-
-                if drama_score >= 4.0:  # Only include moderately spicy threads
-                    threads.append({
-                        'id': f"gh-{item['number']}",
-                        'title': item['title'],
-                        'source': 'github',
-                        'drama_score': round(drama_score, 1),
-                        'date': item['created_at'][:10],
-                        'participants': [item['user']],
-                        'nack_count': 1 if signals.get('has_nack') else 0,
-                        'ack_count': 1 if signals.get('has_ack') else 0,
-                        'key_phrases': [],  # Would need full analysis
-                        'url': item['url']
-                    })
-
-        # Process BIPs data
-        if bips_data:
-            # Combine PRs and issues
-            items = bips_data.get('pull_requests', []) + bips_data.get('issues', [])
-
-            # Score each item based on basic signals
-            for item in items:
-                signals = item.get('drama_signals', {})
-
-                # Calculate a quick drama score
-                drama_score = (
-                    signals.get('drama_keywords', 0) * 2.0 +
-                    signals.get('has_nack', False) * 3.0 -
-                    signals.get('positive_keywords', 0) * 0.5
-                )
-
-                comment_count = item.get('comments', 0) + item.get('review_comments', 0)
-
-                # Boost score for high activity
-                if comment_count > 20:
-                    drama_score += 2.0
-                elif comment_count > 10:
-                    drama_score += 1.0
-
-                # Normalize to 0-10
-                drama_score = max(0, min(10, drama_score))
-
-                if drama_score >= 4.0:  # Only include moderately spicy threads
-                    threads.append({
-                        'id': f"bip-{item['number']}",
-                        'title': item['title'],
-                        'source': 'bips',
-                        'drama_score': round(drama_score, 1),
-                        'date': item['created_at'][:10],
-                        'participants': [item['user']],
-                        'nack_count': 1 if signals.get('has_nack') else 0,
-                        'ack_count': 1 if signals.get('has_ack') else 0,
-                        'key_phrases': [],  # Would need full analysis
-                        'url': item['url']
-                    })
-
-        # Sort by drama score and return top threads
-        threads.sort(key=lambda x: x['drama_score'], reverse=True)
-        return threads[:limit]
+        # Top threads by drama score (same order as a stable sort)
+        return heapq.nlargest(limit, aggregates['threads'], key=lambda x: x['drama_score'])
 
     def identify_key_participants(
         self,
@@ -606,7 +1285,8 @@ Respond in JSON format:
         bips_data: Optional[Dict] = None,
         irc_data: Optional[Dict] = None,
         mailing_list_data: Optional[Dict] = None,
-        limit: int = 10
+        limit: int = 10,
+        aggregates: Optional[Dict] = None
     ) -> List[Dict]:
         """
         Identify the most active participants in discussions.
@@ -617,69 +1297,30 @@ Respond in JSON format:
             irc_data: IRC data dict
             mailing_list_data: Mailing list data dict
             limit: Number of participants to return
+            aggregates: Precomputed result of _aggregate (computed if omitted)
 
         Returns:
             List of key participants with activity metrics
         """
-        participant_stats = defaultdict(lambda: {
-            'messages': 0,
-            'drama_contributions': []
-        })
-
-        if github_data:
-            # Count PR/issue authors
-            for pr in github_data.get('pull_requests', []):
-                user = pr['user']
-                signals = pr.get('drama_signals', {})
-                drama_level = signals.get('drama_keywords', 0)
-
-                participant_stats[user]['messages'] += 1
-                participant_stats[user]['drama_contributions'].append(drama_level)
-
-            for issue in github_data.get('issues', []):
-                user = issue['user']
-                signals = issue.get('drama_signals', {})
-                drama_level = signals.get('drama_keywords', 0)
-
-                participant_stats[user]['messages'] += 1
-                participant_stats[user]['drama_contributions'].append(drama_level)
-
-        if bips_data:
-            # Count BIP PR/issue authors
-            for pr in bips_data.get('pull_requests', []):
-                user = pr['user']
-                signals = pr.get('drama_signals', {})
-                drama_level = signals.get('drama_keywords', 0)
-
-                participant_stats[user]['messages'] += 1
-                participant_stats[user]['drama_contributions'].append(drama_level)
-
-            for issue in bips_data.get('issues', []):
-                user = issue['user']
-                signals = issue.get('drama_signals', {})
-                drama_level = signals.get('drama_keywords', 0)
-
-                participant_stats[user]['messages'] += 1
-                participant_stats[user]['drama_contributions'].append(drama_level)
+        if aggregates is None:
+            aggregates = self._aggregate(github_data, bips_data)
 
         # Build participant list
         participants = []
-        for user, stats in participant_stats.items():
-            drama_scores = stats['drama_contributions']
-            avg_drama = sum(drama_scores) / len(drama_scores) if drama_scores else 0
+        for user, (messages, drama_total) in aggregates['participant_stats'].items():
+            avg_drama = drama_total / messages if messages else 0
 
             participants.append({
                 'name': user,
                 'handle': user,
-                'messages': stats['messages'],
+                'messages': messages,
                 'avg_drama_contribution': round(avg_drama, 1),
                 'stance_summary': 'Active contributor',
                 'primary_topics': ['general']
             })
 
-        # Sort by activity level
-        participants.sort(key=lambda x: x['messages'], reverse=True)
-        return participants[:limit]
+        # Most active participants (same order as a stable sort)
+        return heapq.nlargest(limit, participants, key=lambda x: x['messages'])
 
     def process_all_data(self, date_str: Optional[str] = None) -> Dict:
         """
@@ -696,11 +1337,12 @@ Respond in JSON format:
 
         logger.info(f"Processing data for {date_str}")
 
-        # Load raw data from all sources
-        github_data = load_raw_data('github', date_str)
-        bips_data = load_raw_data('bips', date_str)
-        irc_data = load_raw_data('irc', date_str)
-        mailing_list_data = load_raw_data('mailing_list', date_str)
+        # Load raw data from all sources (file reads overlap in threads)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            github_data, bips_data, irc_data, mailing_list_data = executor.map(
+                lambda source: load_raw_data(source, date_str),
+                ['github', 'bips', 'irc', 'mailing_list']
+            )
 
         if not github_data:
             logger.warning(f"No GitHub data found for {date_str}")
@@ -725,20 +1367,28 @@ Respond in JSON format:
             **self.calculate_daily_scores(github_data, bips_data, irc_data, mailing_list_data)
         }
 
+        # Single pass over PRs/issues shared by the three outputs below
+        aggregates = self._aggregate(github_data, bips_data)
+
         logger.info("Extracting hot topics...")
-        hot_topics = self.extract_hot_topics(github_data, bips_data, irc_data, mailing_list_data)
+        hot_topics = self.extract_hot_topics(aggregates=aggregates)
 
         logger.info("Identifying spicy threads...")
-        spicy_threads = self.identify_spicy_threads(github_data, bips_data, irc_data, mailing_list_data)
+        spicy_threads = self.identify_spicy_threads(aggregates=aggregates)
 
         logger.info("Identifying key participants...")
-        key_participants = self.identify_key_participants(github_data, bips_data, irc_data, mailing_list_data)
+        key_participants = self.identify_key_participants(aggregates=aggregates)
 
         # Save processed data
-        save_processed_data(daily_scores, f'daily_scores_{date_str}.json')
-        save_processed_data({'hot_topics': hot_topics}, 'hot_topics.json')
-        save_processed_data({'spicy_threads': spicy_threads}, 'spicy_threads.json')
-        save_processed_data({'key_participants': key_participants}, 'key_participants.json')
+        outputs = [
+            (daily_scores, f'daily_scores_{date_str}.json'),
+            ({'hot_topics': hot_topics}, 'hot_topics.json'),
+            ({'spicy_threads': spicy_threads}, 'spicy_threads.json'),
+            ({'key_participants': key_participants}, 'key_participants.json'),
+        ]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            # list() so any write error is raised here
+            list(executor.map(lambda output: save_processed_data(*output), outputs))
 
         summary = {
             'date': date_str,
@@ -759,10 +1409,12 @@ def main():
     parser = argparse.ArgumentParser(description='Analyze Bitcoin dev discussions for drama signals')
     parser.add_argument('--date', type=str, help='Date to process (YYYY-MM-DD), defaults to latest')
     parser.add_argument('--api-key', type=str, help='Anthropic API key (or set ANTHROPIC_API_KEY env var)')
+    parser.add_argument('--claude', action='store_true', help='Score GitHub/BIPs items with Claude (batched per source)')
+    parser.add_argument('--batch-api', action='store_true', help='With --claude, use the Message Batches API (50%% cheaper, slower)')
     args = parser.parse_args()
 
     try:
-        scorer = DramaScorer(api_key=args.api_key)
+        scorer = DramaScorer(api_key=args.api_key, use_claude=args.claude, use_batch_api=args.batch_api)
         result = scorer.process_all_data(date_str=args.date)
 
         print(f"\n✅ Drama analysis complete!")
@@ -0,0 +1,132 @@
+"""
+LLM Response Cache - Exact-match cache for Claude drama analyses.
+
+Open PRs and repeat runs for the same date send identical text to Claude.
+Results are stored in SQLite keyed by a SHA-256 of (model, context, content)
+so those items are only analyzed once.
+
+A second table records the last analysis of each PR/issue URL with its
+updated_at, so unchanged items can be skipped before their text is built.
+"""
+
+import json
+import sqlite3
+import hashlib
+import sys
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+# Add parent directory for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scrapers.utils import logger, PROCESSED_DATA_DIR
+
+DEFAULT_CACHE_PATH = PROCESSED_DATA_DIR / 'llm_cache.sqlite'
+
+
+class LLMCache:
+    """SQLite-backed exact-match cache of analysis results."""
+
+    def __init__(self, path: Union[str, Path] = DEFAULT_CACHE_PATH):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: SQLite file path
+        """
+        self.path = Path(path)
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, result TEXT NOT NULL)"
+        )
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS items ("
+            "url TEXT NOT NULL, model TEXT NOT NULL, updated_at TEXT NOT NULL, "
+            "result TEXT NOT NULL, PRIMARY KEY (url, model))"
+        )
+        self.conn.commit()
+
+    @staticmethod
+    def make_key(model: str, context: str, content: str) -> str:
+        """Hash the inputs that determine an analysis result."""
+        return hashlib.sha256(
+            json.dumps([model, context, content], ensure_ascii=False).encode('utf-8')
+        ).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Look up a cached result.
+
+        Args:
+            key: Key from make_key
+
+        Returns:
+            Cached result dict, or None on a miss
+        """
+        row = self.conn.execute("SELECT result FROM cache WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        try:
+            return json.loads(row[0])
+        except ValueError:
+            logger.warning(f"Dropping corrupt LLM cache entry {key[:12]}")
+            return None
+
+    def set(self, key: str, result: Dict):
+        """
+        Store a result.
+
+        Args:
+            key: Key from make_key
+            result: Analysis result dict
+        """
+        self.conn.execute(
+            "INSERT OR REPLACE INTO cache (key, result) VALUES (?, ?)",
+            (key, json.dumps(result, ensure_ascii=False))
+        )
+        self.conn.commit()
+
+    def get_item(self, url: str, model: str, updated_at: str) -> Optional[Dict]:
+        """
+        Look up the stored analysis of a PR/issue if it hasn't changed.
+
+        Args:
+            url: Item URL
+            model: Claude model ID the item was analyzed with
+            updated_at: The item's current updated_at
+
+        Returns:
+            Stored result dict, or None if missing or the item was updated since
+        """
+        row = self.conn.execute(
+            "SELECT result FROM items WHERE url = ? AND model = ? AND updated_at = ?",
+            (url, model, updated_at)
+        ).fetchone()
+        if row is None:
+            return None
+        try:
+            return json.loads(row[0])
+        except ValueError:
+            logger.warning(f"Dropping corrupt LLM item entry {url}")
+            return None
+
+    def set_item(self, url: str, model: str, updated_at: str, result: Dict):
+        """
+        Record the latest analysis of a PR/issue.
+
+        Args:
+            url: Item URL
+            model: Claude model ID the item was analyzed with
+            updated_at: The item's updated_at when analyzed
+            result: Analysis result dict
+        """
+        self.conn.execute(
+            "INSERT OR REPLACE INTO items (url, model, updated_at, result) VALUES (?, ?, ?, ?)",
+            (url, model, updated_at, json.dumps(result, ensure_ascii=False))
+        )
+        self.conn.commit()
+
+    def close(self):
+        """Close the database connection."""
+        self.conn.close()
@@ -13,22 +13,55 @@ Combines multiple frameworks:
 Output: Simple drama/neutrality scores (0-10) backed by measurable signals.
 """
 
-import re
+import copy
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass, field
+from dataclasses import dataclass
+import numpy as np
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
-from textblob import TextBlob
-
-from analyzer.pattern_libraries import (
-    POSITIVE_POLITENESS, HEDGES, FACE_THREATENING, INDIRECT_AGGRESSION,
-    DIRECTIVES, EXPRESSIVES, ACCUSATIONS, CHALLENGES,
-    EVIDENCE_MARKERS, ACKNOWLEDGMENT, CONSTRUCTIVE, DISMISSIVE,
-    AD_HOMINEM, STRAWMAN, APPEAL_TO_AUTHORITY, MOVING_GOALPOSTS, WHATABOUTISM,
-    STONEWALLING, THREATS, DISMISS_WITHOUT_ENGAGEMENT
+from textblob.en import sentiment as pattern_sentiment
+
+from analyzer.pattern_libraries import CategoryScanner, scan_categories, scan_categories_batch
+
+
+@lru_cache(maxsize=None)
+def _shared_vader() -> SentimentIntensityAnalyzer:
+    """
+    Process-wide VADER analyzer, so each MultiDimensionalAnalyzer doesn't
+    reload the lexicon. polarity_scores only reads it, so sharing is safe.
+    """
+    return SentimentIntensityAnalyzer()
+
+
+def _classify_health(drama: float, neutrality: float) -> str:
+    """Map (drama, neutrality) to a health label."""
+    if drama >= 6 and neutrality < 5:
+        return "toxic"
+    elif drama >= 5 and neutrality >= 5:
+        return "heated-but-fair"
+    elif drama < 4 and neutrality >= 6:
+        return "productive"
+    elif drama < 4 and neutrality < 5:
+        return "dismissive"
+    return "mixed"
+
+
+# Every health threshold is an integer, so the label only depends on the
+# integer part of each score: HEALTH_TABLE[int(drama), int(neutrality)].
+# Scores are clamped to 0-10 first (values outside classify like the edge).
+HEALTH_TABLE = np.array(
+    [[_classify_health(d, n) for n in range(11)] for d in range(11)],
+    dtype=object
 )
 
 
-@dataclass
+def health_assessment(drama: float, neutrality: float) -> str:
+    """Health label for a drama/neutrality pair via HEALTH_TABLE."""
+    return HEALTH_TABLE[min(max(int(drama), 0), 10), min(max(int(neutrality), 0), 10)]
+
+
+@dataclass(slots=True)
 class DimensionalScores:
     """All dimensional scores for a piece of text."""
     # Core dimensions (0-10)
@@ -56,8 +89,34 @@ class DimensionalScores:
     # Health assessment
     health_assessment: str = "unknown"
 
-    # Evidence (for debugging, not shown to users)
-    evidence: Dict = field(default_factory=dict)
+    # Evidence (for debugging, not shown to users; only filled in debug mode)
+    evidence: Optional[Dict] = None
+
+    def to_dict(self) -> Dict:
+        """Convert to dictionary for JSON serialization (scores rounded to 2 places)."""
+        return {
+            "scores": {
+                "drama": round(self.drama_score, 2),
+                "neutrality": round(self.neutrality_score, 2),
+                "vader_negativity": round(self.vader_negativity, 2),
+                "subjectivity": round(self.subjectivity, 2),
+                "politeness": round(self.politeness, 2),
+                "face_threats": round(self.face_threats, 2),
+                "argument_quality": round(self.argument_quality, 2),
+                "fallacy_score": round(self.fallacy_score, 2)
+            },
+            "speech_acts": {
+                "directives": self.directive_count,
+                "expressives": self.expressive_count,
+                "accusations": self.accusation_count,
+                "challenges": self.challenge_count
+            },
+            "special": {
+                "stonewalling": self.stonewalling_indicators,
+                "threats": self.threat_indicators
+            },
+            "health": self.health_assessment
+        }
 
 
 class MultiDimensionalAnalyzer:
@@ -71,8 +130,42 @@ class MultiDimensionalAnalyzer:
     - Optionally enhance with Claude for nuance (separate method)
     """
 
-    def __init__(self):
-        self.vader = SentimentIntensityAnalyzer()
+    # analyze_many only starts a process pool for at least this many texts
+    PARALLEL_MIN_TEXTS = 32
+
+    # fast_mode: VADER compound beyond this, or text longer than this, skips TextBlob
+    FAST_MODE_COMPOUND = 0.8
+    FAST_MODE_MAX_CHARS = 2000
+
+    # deep_threshold: texts shorter than it only get VADER plus these categories
+    QUICK_CATEGORIES = (
+        'FACE_THREATENING', 'ACCUSATIONS', 'DISMISSIVE', 'AD_HOMINEM',
+        'STONEWALLING', 'THREATS', 'DISMISS_WITHOUT_ENGAGEMENT',
+    )
+    _quick_scanner = CategoryScanner(QUICK_CATEGORIES)
+
+    def __init__(self, cache_size: int = 4096, debug: bool = False, fast_mode: bool = False,
+                 deep_threshold: Optional[int] = None):
+        """
+        Initialize the analyzer.
+
+        Args:
+            cache_size: Number of distinct texts whose results are memoized
+                (quoted replies and repeated comments hit the cache); 0 disables
+            debug: Record the raw counts behind each score in scores.evidence
+            fast_mode: Estimate subjectivity from VADER instead of running
+                TextBlob when sentiment is extreme or the text is long
+                (changes subjectivity for those texts; off by default)
+            deep_threshold: Texts shorter than this many characters skip
+                TextBlob (subjectivity is estimated from VADER) and only
+                count QUICK_CATEGORIES, for the "lgtm" / "nack" long tail
+                (changes scores for those texts; None analyzes everything fully)
+        """
+        self.debug = debug
+        self.fast_mode = fast_mode
+        self.deep_threshold = deep_threshold
+        self.vader = _shared_vader()
+        self._analyze_cached = lru_cache(maxsize=cache_size)(self._analyze) if cache_size else None
 
     def analyze(self, text: str) -> DimensionalScores:
         """
@@ -84,10 +177,37 @@ class MultiDimensionalAnalyzer:
         Returns:
             DimensionalScores with all metrics
         """
+        if self._analyze_cached is None:
+            return self._analyze(text)
+        # Hand out a copy so callers can't mutate the cached result
+        return copy.deepcopy(self._analyze_cached(text))
+
+    @staticmethod
+    def _is_scorable(text: str) -> bool:
+        """Whether text is long enough to analyze (shorter text keeps default scores)."""
+        return bool(text) and len(text.strip()) >= 10
+
+    def _analyze(self, text: str, counts: Optional[Dict[str, int]] = None,
+                 composite: bool = True) -> DimensionalScores:
+        """
+        Uncached analysis behind analyze().
+
+        Args:
+            text: The text to analyze
+            counts: Pattern category counts for text if already scanned
+                (see scan_categories_batch)
+            composite: Compute drama/neutrality/health; batch callers pass
+                False and use _calculate_composite_scores_batch instead
+
+        Returns:
+            DimensionalScores with all metrics
+        """
+        debug = self.debug
         scores = DimensionalScores()
-        scores.evidence = {"text_length": len(text), "word_count": len(text.split())}
+        if debug:
+            scores.evidence = {"text_length": len(text), "word_count": len(text.split())}
 
-        if not text or len(text.strip()) < 10:
+        if not self._is_scorable(text):
             return scores
 
         # ===== 1. VADER Sentiment =====
@@ -95,109 +215,131 @@ class MultiDimensionalAnalyzer:
         # Convert compound (-1 to +1) to negativity (0 to 10)
         # compound of -1 = negativity of 10, compound of +1 = negativity of 0
         scores.vader_negativity = round((1 - vader_result['compound']) * 5, 2)
-        scores.evidence['vader'] = vader_result
+        if debug:
+            scores.evidence['vader'] = vader_result
+
+        quick = self.deep_threshold is not None and len(text) < self.deep_threshold
 
         # ===== 2. TextBlob Subjectivity =====
-        blob = TextBlob(text)
-        scores.subjectivity = round(blob.sentiment.subjectivity * 10, 2)
-        scores.evidence['textblob'] = {
-            'polarity': round(blob.sentiment.polarity, 3),
-            'subjectivity': round(blob.sentiment.subjectivity, 3)
-        }
+        if quick or (self.fast_mode and (abs(vader_result['compound']) > self.FAST_MODE_COMPOUND or
+                                         len(text) > self.FAST_MODE_MAX_CHARS)):
+            # Subjectivity carries little weight once VADER is this decisive;
+            # use VADER's non-neutral share instead of TextBlob
+            scores.subjectivity = round((1 - vader_result['neu']) * 10, 2)
+            if debug:
+                scores.evidence['textblob'] = {'estimated_from_vader': True}
+        else:
+            # Call TextBlob's pattern sentiment directly: TextBlob(text).sentiment
+            # builds a blob and PatternAnalyzer a namedtuple class on every call
+            polarity, subjectivity = pattern_sentiment(text)
+            scores.subjectivity = round(subjectivity * 10, 2)
+            if debug:
+                scores.evidence['textblob'] = {
+                    'polarity': round(polarity, 3),
+                    'subjectivity': round(subjectivity, 3)
+                }
+
+        # All pattern categories are counted up front in a single scan
+        if quick:
+            if counts is None:
+                counts = self._quick_scanner.scan(text)
+            else:
+                quick_categories = self.QUICK_CATEGORIES
+                counts = {category: count if category in quick_categories else 0
+                          for category, count in counts.items()}
+        elif counts is None:
+            counts = scan_categories(text)
 
         # ===== 3. Politeness Analysis =====
-        positive_count = self._count_patterns(text, POSITIVE_POLITENESS)
-        hedge_count = self._count_patterns(text, HEDGES)
-        fta_count = self._count_patterns(text, FACE_THREATENING)
-        indirect_agg_count = self._count_patterns(text, INDIRECT_AGGRESSION)
+        positive_count = counts['POSITIVE_POLITENESS']
+        hedge_count = counts['HEDGES']
+        fta_count = counts['FACE_THREATENING']
+        indirect_agg_count = counts['INDIRECT_AGGRESSION']
 
         # Politeness score: more positive/hedges = higher, more FTAs = lower
         politeness_raw = (positive_count * 2 + hedge_count) - (fta_count * 2 + indirect_agg_count * 1.5)
-        scores.politeness = round(max(0, min(10, 5 + politeness_raw)), 2)
-        scores.face_threats = round(min(10, (fta_count + indirect_agg_count) * 2), 2)
-
-        scores.evidence['politeness'] = {
-            'positive_markers': positive_count,
-            'hedges': hedge_count,
-            'face_threatening': fta_count,
-            'indirect_aggression': indirect_agg_count
-        }
+        # Count-based scores are exact multiples of 0.5, so unlike the
+        # sentiment-derived ones they need no rounding
+        scores.politeness = max(0, min(10, 5 + politeness_raw))
+        scores.face_threats = min(10, (fta_count + indirect_agg_count) * 2)
+
+        if debug:
+            scores.evidence['politeness'] = {
+                'positive_markers': positive_count,
+                'hedges': hedge_count,
+                'face_threatening': fta_count,
+                'indirect_aggression': indirect_agg_count
+            }
 
         # ===== 4. Speech Act Analysis =====
-        scores.directive_count = self._count_patterns(text, DIRECTIVES)
-        scores.expressive_count = self._count_patterns(text, EXPRESSIVES)
-        scores.accusation_count = self._count_patterns(text, ACCUSATIONS)
-        scores.challenge_count = self._count_patterns(text, CHALLENGES)
-
-        scores.evidence['speech_acts'] = {
-            'directives': scores.directive_count,
-            'expressives': scores.expressive_count,
-            'accusations': scores.accusation_count,
-            'challenges': scores.challenge_count
-        }
+        scores.directive_count = counts['DIRECTIVES']
+        scores.expressive_count = counts['EXPRESSIVES']
+        scores.accusation_count = counts['ACCUSATIONS']
+        scores.challenge_count = counts['CHALLENGES']
+
+        if debug:
+            scores.evidence['speech_acts'] = {
+                'directives': scores.directive_count,
+                'expressives': scores.expressive_count,
+                'accusations': scores.accusation_count,
+                'challenges': scores.challenge_count
+            }
 
         # ===== 5. Argument Quality =====
-        evidence_count = self._count_patterns(text, EVIDENCE_MARKERS)
-        ack_count = self._count_patterns(text, ACKNOWLEDGMENT)
-        constructive_count = self._count_patterns(text, CONSTRUCTIVE)
-        dismissive_count = self._count_patterns(text, DISMISSIVE)
+        evidence_count = counts['EVIDENCE_MARKERS']
+        ack_count = counts['ACKNOWLEDGMENT']
+        constructive_count = counts['CONSTRUCTIVE']
+        dismissive_count = counts['DISMISSIVE']
 
         # Quality score: evidence + acknowledgment + constructive - dismissive
         quality_raw = (evidence_count * 2 + ack_count * 2 + constructive_count * 1.5) - (dismissive_count * 2)
-        scores.argument_quality = round(max(0, min(10, 5 + quality_raw)), 2)
-
-        scores.evidence['argument_quality'] = {
-            'evidence_citations': evidence_count,
-            'acknowledgments': ack_count,
-            'constructive': constructive_count,
-            'dismissive': dismissive_count
-        }
+        scores.argument_quality = max(0, min(10, 5 + quality_raw))
+
+        if debug:
+            scores.evidence['argument_quality'] = {
+                'evidence_citations': evidence_count,
+                'acknowledgments': ack_count,
+                'constructive': constructive_count,
+                'dismissive': dismissive_count
+            }
 
         # ===== 6. Fallacy Detection =====
-        ad_hom = self._count_patterns(text, AD_HOMINEM)
-        strawman = self._count_patterns(text, STRAWMAN)
-        authority = self._count_patterns(text, APPEAL_TO_AUTHORITY)
-        goalposts = self._count_patterns(text, MOVING_GOALPOSTS)
-        whatabout = self._count_patterns(text, WHATABOUTISM)
+        ad_hom = counts['AD_HOMINEM']
+        strawman = counts['STRAWMAN']
+        authority = counts['APPEAL_TO_AUTHORITY']
+        goalposts = counts['MOVING_GOALPOSTS']
+        whatabout = counts['WHATABOUTISM']
 
         total_fallacies = ad_hom + strawman + authority + goalposts + whatabout
-        scores.fallacy_score = round(min(10, total_fallacies * 2.5), 2)
-
-        scores.evidence['fallacies'] = {
-            'ad_hominem': ad_hom,
-            'strawman': strawman,
-            'appeal_to_authority': authority,
-            'moving_goalposts': goalposts,
-            'whataboutism': whatabout,
-            'total': total_fallacies
-        }
+        scores.fallacy_score = min(10, total_fallacies * 2.5)
+
+        if debug:
+            scores.evidence['fallacies'] = {
+                'ad_hominem': ad_hom,
+                'strawman': strawman,
+                'appeal_to_authority': authority,
+                'moving_goalposts': goalposts,
+                'whataboutism': whatabout,
+                'total': total_fallacies
+            }
 
         # ===== 7. Special Patterns =====
-        scores.stonewalling_indicators = self._count_patterns(text, STONEWALLING)
-        scores.stonewalling_indicators += self._count_patterns(text, DISMISS_WITHOUT_ENGAGEMENT)
-        scores.threat_indicators = self._count_patterns(text, THREATS)
-
-        scores.evidence['special'] = {
-            'stonewalling': scores.stonewalling_indicators,
-            'threats': scores.threat_indicators
-        }
+        scores.stonewalling_indicators = counts['STONEWALLING']
+        scores.stonewalling_indicators += counts['DISMISS_WITHOUT_ENGAGEMENT']
+        scores.threat_indicators = counts['THREATS']
+
+        if debug:
+            scores.evidence['special'] = {
+                'stonewalling': scores.stonewalling_indicators,
+                'threats': scores.threat_indicators
+            }
 
         # ===== 8. Calculate Composite Scores =====
-        scores = self._calculate_composite_scores(scores)
+        if composite:
+            scores = self._calculate_composite_scores(scores)
 
         return scores
 
-    def _count_patterns(self, text: str, patterns: List) -> int:
-        """Count how many patterns match in the text."""
-        count = 0
-        for pattern in patterns:
-            if isinstance(pattern, re.Pattern):
-                count += len(pattern.findall(text))
-            else:
-                # It's a compiled pattern from compile_patterns()
-                count += len(pattern.findall(text))
-        return count
-
     def _calculate_composite_scores(self, scores: DimensionalScores) -> DimensionalScores:
         """Calculate final drama and neutrality scores from dimensions."""
 
@@ -237,25 +379,102 @@ class MultiDimensionalAnalyzer:
         , 2)
 
         # HEALTH ASSESSMENT
-        if scores.drama_score >= 6 and scores.neutrality_score < 5:
-            scores.health_assessment = "toxic"
-        elif scores.drama_score >= 5 and scores.neutrality_score >= 5:
-            scores.health_assessment = "heated-but-fair"
-        elif scores.drama_score < 4 and scores.neutrality_score >= 6:
-            scores.health_assessment = "productive"
-        elif scores.drama_score < 4 and scores.neutrality_score < 5:
-            scores.health_assessment = "dismissive"
-        else:
-            scores.health_assessment = "mixed"
+        scores.health_assessment = health_assessment(scores.drama_score, scores.neutrality_score)
 
         return scores
 
-    def analyze_thread(self, messages: List[Dict]) -> Dict:
+    def _calculate_composite_scores_batch(self, batch: List[DimensionalScores]):
+        """
+        Vectorized _calculate_composite_scores over many messages, in place.
+
+        The weighted sums run as NumPy float64 expressions in the same
+        operation order as the scalar version; the final round()/min() stay
+        in Python so results (including int 10 caps) are bit-identical.
+        """
+        if not batch:
+            return
+
+        dims = np.array([
+            (s.vader_negativity, s.politeness, s.face_threats, s.subjectivity,
+             s.fallacy_score, s.argument_quality)
+            for s in batch
+        ], dtype=np.float64)
+        acts = np.array([
+            (s.accusation_count, s.challenge_count, s.expressive_count,
+             s.directive_count, s.stonewalling_indicators)
+            for s in batch
+        ], dtype=np.float64)
+        negativity, politeness, face_threats, subjectivity, fallacy, quality = dims.T
+        accusations, challenges, expressives, directives, stonewalling = acts.T
+
+        speech_act_drama = np.minimum(10, (
+            accusations * 3 +
+            challenges * 2.5 +
+            expressives * 1.5 +
+            directives * 0.5
+        ))
+        stonewalling_penalty = np.minimum(3, stonewalling * 1.5)
+
+        drama = (
+            negativity * 0.20 +
+            (10 - politeness) * 0.20 +
+            face_threats * 0.15 +
+            subjectivity * 0.10 +
+            fallacy * 0.15 +
+            (10 - quality) * 0.10 +
+            speech_act_drama * 0.10
+        )
+        neutrality = (
+            (10 - subjectivity) * 0.30 +
+            quality * 0.30 +
+            politeness * 0.20 +
+            (10 - fallacy) * 0.10 +
+            (10 - face_threats) * 0.10
+        )
+
+        for scores, d, penalty, n in zip(batch, drama.tolist(),
+                                         stonewalling_penalty.tolist(), neutrality.tolist()):
+            scores.drama_score = round(min(10, round(d, 2) + penalty), 2)
+            scores.neutrality_score = round(n, 2)
+
+        final_drama = np.array([s.drama_score for s in batch], dtype=np.float64)
+        final_neutrality = np.array([s.neutrality_score for s in batch], dtype=np.float64)
+        health = HEALTH_TABLE[
+            np.clip(final_drama.astype(np.int64), 0, 10),
+            np.clip(final_neutrality.astype(np.int64), 0, 10)
+        ]
+        for scores, label in zip(batch, health.tolist()):
+            scores.health_assessment = label
+
+    def analyze_many(self, texts: List[str], workers: Optional[int] = None) -> List[DimensionalScores]:
+        """
+        Analyze several texts, optionally across worker processes.
+
+        The regex engine, VADER and TextBlob all hold the GIL, so threads
+        don't help here; with workers > 1 and at least PARALLEL_MIN_TEXTS
+        texts the work is spread over a process pool instead.
+
+        Args:
+            texts: Texts to analyze
+            workers: Number of worker processes (None or 1 = in-process)
+
+        Returns:
+            DimensionalScores per text, in input order
+        """
+        if not workers or workers < 2 or len(texts) < self.PARALLEL_MIN_TEXTS:
+            return [self.analyze(text) for text in texts]
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(self.debug, self.fast_mode, self.deep_threshold)) as pool:
+            return list(pool.map(_analyze_in_worker, texts, chunksize=16))
+
+    def analyze_thread(self, messages: List[Dict], workers: Optional[int] = None) -> Dict:
         """
         Analyze a full thread of messages.
 
         Args:
             messages: List of {"author": str, "content": str, "timestamp": str}
+            workers: Worker processes for long threads (see analyze_many)
 
         Returns:
             Thread-level analysis including pile-on detection
@@ -264,13 +483,45 @@ class MultiDimensionalAnalyzer:
             return {"drama_score": 0, "neutrality_score": 5, "health": "empty"}
 
         # Analyze each message
-        message_scores = []
-        author_scores = {}
+        message_scores = self.analyze_many([msg.get('content', '') for msg in messages], workers)
+        return self._summarize_thread(messages, message_scores)
+
+    def analyze_thread_fast(self, messages: List[Dict]) -> Dict:
+        """
+        Analyze a full thread, scanning patterns over the whole thread at once.
 
-        for msg in messages:
-            score = self.analyze(msg.get('content', ''))
-            message_scores.append(score)
+        Same result as analyze_thread(): the pattern categories are counted
+        with one pass per pattern over the joined messages instead of one per
+        message, and composite scores are computed as one vectorized batch.
+        VADER and TextBlob still run per message. Bypasses the
+        analyze() cache, so prefer analyze_thread for heavily repeated text.
 
+        Args:
+            messages: List of {"author": str, "content": str, "timestamp": str}
+
+        Returns:
+            Thread-level analysis including pile-on detection
+        """
+        if not messages:
+            return {"drama_score": 0, "neutrality_score": 5, "health": "empty"}
+
+        contents = [msg.get('content', '') for msg in messages]
+        analyze = self._analyze
+        message_scores = [
+            analyze(content, counts, composite=False)
+            for content, counts in zip(contents, scan_categories_batch(contents))
+        ]
+        self._calculate_composite_scores_batch([
+            scores for content, scores in zip(contents, message_scores)
+            if self._is_scorable(content)
+        ])
+        return self._summarize_thread(messages, message_scores)
+
+    def _summarize_thread(self, messages: List[Dict],
+                          message_scores: List[DimensionalScores]) -> Dict:
+        """Build the thread-level result from per-message scores."""
+        author_scores = {}
+        for msg, score in zip(messages, message_scores):
             author = msg.get('author', 'unknown')
             if author not in author_scores:
                 author_scores[author] = []
@@ -325,22 +576,30 @@ class MultiDimensionalAnalyzer:
 
     def _assess_thread_health(self, drama: float, neutrality: float) -> str:
         """Assess overall thread health."""
-        if drama >= 6 and neutrality < 5:
-            return "toxic"
-        elif drama >= 5 and neutrality >= 5:
-            return "heated-but-fair"
-        elif drama < 4 and neutrality >= 6:
-            return "productive"
-        elif drama < 4 and neutrality < 5:
-            return "dismissive"
-        return "mixed"
+        return health_assessment(drama, neutrality)
+
+
+# Per-process analyzer for analyze_many's worker pool
+_worker_analyzer: Optional[MultiDimensionalAnalyzer] = None
+
+
+def _init_worker(debug: bool, fast_mode: bool, deep_threshold: Optional[int]):
+    """Process pool initializer: build this worker's analyzer once."""
+    global _worker_analyzer
+    _worker_analyzer = MultiDimensionalAnalyzer(debug=debug, fast_mode=fast_mode,
+                                                deep_threshold=deep_threshold)
+
+
+def _analyze_in_worker(text: str) -> DimensionalScores:
+    """Analyze one text in a pool worker."""
+    return _worker_analyzer.analyze(text)
 
 
 # =============================================================================
 # PARTICIPANT PROFILING
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ParticipantProfile:
     """Profile of a participant's communication patterns."""
     handle: str
@@ -396,51 +655,79 @@ class ParticipantProfiler:
     def __init__(self, analyzer: MultiDimensionalAnalyzer):
         self.analyzer = analyzer
         self.profiles: Dict[str, ParticipantProfile] = {}
-        self._score_history: Dict[str, List[DimensionalScores]] = {}
+        # Running totals per handle, in _score_totals() order
+        self._sums: Dict[str, List[float]] = {}
+
+    @staticmethod
+    def _score_totals(scores: DimensionalScores) -> Tuple:
+        """Per-message values accumulated into a profile's running sums."""
+        return (
+            scores.drama_score, scores.neutrality_score, scores.politeness,
+            scores.argument_quality, scores.subjectivity, scores.fallacy_score,
+            scores.face_threats, scores.directive_count, scores.expressive_count,
+            scores.accusation_count, scores.challenge_count,
+            scores.stonewalling_indicators
+        )
 
     def add_message(self, handle: str, content: str):
         """Add a message to a participant's profile."""
-        scores = self.analyzer.analyze(content)
+        self._add_scores(handle, self.analyzer.analyze(content))
 
+    def add_messages(self, messages: List[Tuple[str, str]], workers: Optional[int] = None):
+        """
+        Add many messages, analyzing them in parallel before updating profiles.
+
+        Args:
+            messages: List of (handle, content) pairs, in order
+            workers: Worker processes for analysis (see analyze_many)
+        """
+        all_scores = self.analyzer.analyze_many([content for _, content in messages], workers)
+        for (handle, _), scores in zip(messages, all_scores):
+            self._add_scores(handle, scores)
+
+    def _add_scores(self, handle: str, scores: DimensionalScores):
+        """Fold one message's scores into a participant's profile."""
         if handle not in self.profiles:
             self.profiles[handle] = ParticipantProfile(handle=handle)
-            self._score_history[handle] = []
+            self._sums[handle] = [0] * 12
 
-        self._score_history[handle].append(scores)
+        sums = self._sums[handle]
+        for i, value in enumerate(self._score_totals(scores)):
+            sums[i] += value
+        self.profiles[handle].message_count += 1
         self._update_profile(handle)
 
     def _update_profile(self, handle: str):
-        """Recalculate profile from score history."""
-        history = self._score_history[handle]
+        """Recalculate profile averages from the running sums."""
+        (drama, neutrality, politeness, argument_quality, subjectivity, fallacy,
+         face_threats, directives, expressives, accusations, challenges,
+         stonewalling) = self._sums[handle]
         profile = self.profiles[handle]
 
-        n = len(history)
-        profile.message_count = n
-
+        n = profile.message_count
         if n == 0:
             return
 
         # Calculate averages
-        profile.avg_drama = sum(s.drama_score for s in history) / n
-        profile.avg_neutrality = sum(s.neutrality_score for s in history) / n
-        profile.avg_politeness = sum(s.politeness for s in history) / n
-        profile.avg_argument_quality = sum(s.argument_quality for s in history) / n
-        profile.avg_subjectivity = sum(s.subjectivity for s in history) / n
-        profile.avg_fallacy_rate = sum(s.fallacy_score for s in history) / n
-        profile.avg_face_threats = sum(s.face_threats for s in history) / n
+        profile.avg_drama = drama / n
+        profile.avg_neutrality = neutrality / n
+        profile.avg_politeness = politeness / n
+        profile.avg_argument_quality = argument_quality / n
+        profile.avg_subjectivity = subjectivity / n
+        profile.avg_fallacy_rate = fallacy / n
+        profile.avg_face_threats = face_threats / n
 
         # Speech act rates
-        total_speech_acts = sum(
-            s.directive_count + s.expressive_count + s.accusation_count + s.challenge_count
-            for s in history
+        total_speech_acts = (
+            directives + expressives + accusations + challenges
         ) or 1  # Avoid division by zero
 
-        profile.directive_rate = sum(s.directive_count for s in history) / total_speech_acts * 100
-        profile.expressive_rate = sum(s.expressive_count for s in history) / total_speech_acts * 100
-        profile.accusation_rate = sum(s.accusation_count for s in history) / total_speech_acts * 100
+        profile.directive_rate = directives / total_speech_acts * 100
+        profile.expressive_rate = expressives / total_speech_acts * 100
+        profile.accusation_rate = accusations / total_speech_acts * 100
 
         # Stonewalling
-        profile.total_stonewalling = sum(s.stonewalling_indicators for s in history)
+        profile.total_stonewalling = stonewalling
 
         # Is difficult?
         profile.is_difficult = (
@@ -4,18 +4,101 @@ Based on: Politeness Theory, Speech Act Theory, Argumentation frameworks, Fallac
 """
 
 import re
-from typing import List, Pattern
-
-def compile_patterns(phrases: List[str], word_boundary: bool = True) -> List[Pattern]:
-    """Compile a list of phrases into regex patterns."""
-    patterns = []
-    for phrase in phrases:
-        if word_boundary:
-            pattern = re.compile(r'\b' + re.escape(phrase) + r'\b', re.IGNORECASE)
-        else:
-            pattern = re.compile(re.escape(phrase), re.IGNORECASE)
-        patterns.append(pattern)
-    return patterns
+from bisect import bisect_right
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Pattern, Sequence, Tuple
+
+# Lookahead alternations whose every match starts at a word boundary with
+# one of these lowercase literals. Filled in by the compile helpers and used
+# to prefilter MEGA_PATTERN.
+_ANCHORS: Dict[Pattern, Tuple[str, ...]] = {}
+
+# Lowercase phrase lists of the anchored compile_patterns() alternations,
+# so MEGA_PATTERN can compile phrases shared between categories once.
+_PHRASES: Dict[Pattern, Tuple[str, ...]] = {}
+
+
+def compile_patterns(phrases: List[str], word_boundary: bool = True) -> Tuple[Pattern, ...]:
+    """
+    Compile a list of phrases into one alternation for the whole category.
+
+    The alternation sits inside a lookahead so every phrase occurrence is
+    counted, including phrases nested in longer ones ("could be" inside
+    "I could be wrong"), matching a separate findall per phrase.
+    """
+    # Lowercasing is safe under IGNORECASE and lets the trie share more prefixes
+    lowered = [phrase.lower() for phrase in phrases]
+    if word_boundary:
+        pattern = re.compile(_phrase_lookahead(lowered), re.IGNORECASE)
+        first_words = [re.match(r'\w*', phrase).group(0) for phrase in lowered]
+        if all(first_words):
+            _ANCHORS[pattern] = tuple(sorted(set(first_words)))
+            _PHRASES[pattern] = tuple(lowered)
+    else:
+        pattern = re.compile(r'(?=(?:' + _trie_alternation(lowered) + r'))', re.IGNORECASE)
+    return (pattern,)
+
+
+def _phrase_lookahead(phrases: Iterable[str]) -> str:
+    """Regex source counting word-bounded occurrences of any phrase."""
+    return r'\b(?=(?:' + _trie_alternation(phrases) + r')\b)'
+
+
+def compile_regex_group(raw_patterns: List[str], flags: int = re.IGNORECASE,
+                        overlapping: bool = True,
+                        anchors: Optional[Sequence[str]] = None) -> Pattern:
+    """
+    Compile hand-written regexes into a single alternation.
+
+    With overlapping=True the alternation is a lookahead, so matches of
+    different patterns that overlap are each counted. Patterns that can
+    overlap themselves (optional prefixes, inner punctuation) must be kept
+    as separate patterns or grouped with overlapping=False.
+
+    anchors lists literal prefixes (case-insensitive) that every match
+    starts with, right after a word boundary; they let the scan skip
+    positions where none of them occur.
+    """
+    alternation = '|'.join(f'(?:{raw})' for raw in raw_patterns)
+    if overlapping:
+        pattern = re.compile(f'(?=(?:{alternation}))', flags)
+        if anchors:
+            _ANCHORS[pattern] = tuple(sorted({anchor.lower() for anchor in anchors}))
+        return pattern
+    return re.compile(alternation, flags)
+
+
+def _trie_alternation(words: Iterable[str], prefix_match: bool = False) -> str:
+    """
+    Build a trie-factored regex alternation over literal words.
+
+    Matches the same strings as '|'.join(map(re.escape, words)), but shared
+    prefixes are tested once ("you(?:'re|\\ are)..."), so at each position
+    the engine only explores branches whose first characters match - the
+    same idea as an Aho-Corasick automaton, compiled into sre.
+
+    Args:
+        words: Literal strings
+        prefix_match: Only require that some word is a prefix of the input
+            here (longer words sharing a shorter word's prefix are dropped)
+
+    Returns:
+        Regex source for the alternation
+    """
+    trie: Dict = {}
+    for word in set(words):
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def emit(node: Dict) -> str:
+        if '' in node and (prefix_match or len(node) == 1):
+            return ''
+        branches = [re.escape(char) + emit(child) for char, child in sorted(node.items()) if char]
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        return f'(?:{body})?' if '' in node else body
+
+    return emit(trie)
 
 
 # =============================================================================
@@ -77,44 +160,53 @@ INDIRECT_AGGRESSION = compile_patterns([
 # =============================================================================
 
 # Directives - telling others what to do (medium-high drama potential)
-DIRECTIVES = [
-    re.compile(r'\byou should\b', re.I),
-    re.compile(r'\byou need to\b', re.I),
-    re.compile(r'\byou must\b', re.I),
-    re.compile(r'\byou have to\b', re.I),
-    re.compile(r'\bplease\s+(do|stop|consider|read|look)\b', re.I),
-    re.compile(r'\bstop\s+\w+ing\b', re.I),
+DIRECTIVES = (
+    compile_regex_group([
+        r'\byou should\b',
+        r'\byou need to\b',
+        r'\byou must\b',
+        r'\byou have to\b',
+        r'\bplease\s+(do|stop|consider|read|look)\b',
+        r'\bstop\s+\w+ing\b',
+        r'\bgo\s+(read|look|check)\b',
+    ], anchors=['you', 'please', 'stop', 'go']),
+    # Kept apart: the apostrophe lets matches overlap ("don't don't go")
     re.compile(r"\bdon't\s+\w+\b", re.I),
-    re.compile(r'\bgo\s+(read|look|check)\b', re.I),
-]
+)
 
 # Expressives - emotional statements (high drama signal)
-EXPRESSIVES = [
-    re.compile(r"\bI('m| am) (frustrated|annoyed|confused|disappointed|tired)\b", re.I),
-    re.compile(r"\bthis is (ridiculous|absurd|insane|crazy|nonsense|garbage)\b", re.I),
-    re.compile(r"\bwhat a (waste|joke|mess)\b", re.I),
-    re.compile(r"\bunbelievable\b", re.I),
-    re.compile(r"\bfrustrating\b", re.I),
-    re.compile(r"\bdisappointing\b", re.I),
-]
+EXPRESSIVES = (
+    compile_regex_group([
+        r"\bI('m| am) (frustrated|annoyed|confused|disappointed|tired)\b",
+        r"\bthis is (ridiculous|absurd|insane|crazy|nonsense|garbage)\b",
+        r"\bwhat a (waste|joke|mess)\b",
+        r"\bunbelievable\b",
+        r"\bfrustrating\b",
+        r"\bdisappointing\b",
+    ], anchors=['I', 'this', 'what', 'unbelievable', 'frustrating', 'disappointing']),
+)
 
 # Accusations - attributing blame (very high drama)
-ACCUSATIONS = [
-    re.compile(r"\byou (broke|ruined|caused|created|introduced)\b", re.I),
-    re.compile(r"\bthis is your (fault|mistake|problem)\b", re.I),
-    re.compile(r"\byou're (the one|responsible|to blame)\b", re.I),
-    re.compile(r"\bbecause of you\b", re.I),
-    re.compile(r"\byou made this\b", re.I),
-]
+ACCUSATIONS = (
+    compile_regex_group([
+        r"\byou (broke|ruined|caused|created|introduced)\b",
+        r"\bthis is your (fault|mistake|problem)\b",
+        r"\byou're (the one|responsible|to blame)\b",
+        r"\bbecause of you\b",
+        r"\byou made this\b",
+    ], anchors=['you', 'this', 'because']),
+)
 
 # Challenges - questioning competence (very high drama)
-CHALLENGES = [
-    re.compile(r"\bdo you (even|actually|really) (understand|know|read)\b", re.I),
-    re.compile(r"\bhave you (even|actually|ever) (read|looked|tried|used)\b", re.I),
-    re.compile(r"\bdo you understand\b", re.I),
-    re.compile(r"\bcan you (even|actually)\b", re.I),
-    re.compile(r"\bare you (sure|serious|kidding)\b", re.I),
-]
+CHALLENGES = (
+    compile_regex_group([
+        r"\bdo you (even|actually|really) (understand|know|read)\b",
+        r"\bhave you (even|actually|ever) (read|looked|tried|used)\b",
+        r"\bdo you understand\b",
+        r"\bcan you (even|actually)\b",
+        r"\bare you (sure|serious|kidding)\b",
+    ], anchors=['do', 'have', 'can', 'are']),
+)
 
 
 # =============================================================================
@@ -122,16 +214,19 @@ CHALLENGES = [
 # =============================================================================
 
 # Evidence markers - citations, data, specifics (reduces drama, increases quality)
-EVIDENCE_MARKERS = [
-    re.compile(r'https?://\S+'),  # URLs
-    re.compile(r'\b(BIP|PR|issue)[\s\-]?\d+\b', re.I),  # BIP-XXX, PR #123
-    re.compile(r'\bcommit\s+[a-f0-9]{6,}\b', re.I),  # commit hashes
+EVIDENCE_MARKERS = (
+    re.compile(r'https?://\S+'),  # URLs (case-sensitive)
+    compile_regex_group([
+        r'\b(BIP|PR|issue)[\s\-]?\d+\b',  # BIP-XXX, PR #123
+        r'\bcommit\s+[a-f0-9]{6,}\b',  # commit hashes
+        r'\baccording to\b',
+        r'\bin my (testing|experience|analysis)\b',
+        r'\bmeasured\b',
+    ], anchors=['BIP', 'PR', 'issue', 'commit', 'according', 'in', 'measured']),
+    # Optional prefix / decimal point let these overlap themselves
     re.compile(r'\b(the |my )?(data|benchmark|test|spec|measurement)s?\s+(show|indicate|suggest)\b', re.I),
-    re.compile(r'\baccording to\b', re.I),
-    re.compile(r'\bin my (testing|experience|analysis)\b', re.I),
-    re.compile(r'\bmeasured\b', re.I),
     re.compile(r'\b\d+(\.\d+)?\s*(ms|MB|KB|GB|%|x faster|x slower)\b', re.I),  # metrics
-]
+)
 
 # Acknowledgment - recognizing others' points (reduces drama)
 ACKNOWLEDGMENT = compile_patterns([
@@ -173,49 +268,60 @@ DISMISSIVE = compile_patterns([
 # =============================================================================
 
 # Ad hominem - attacking person not argument
-AD_HOMINEM = [
-    re.compile(r"\byou('re| are) (just|always|never|only)\b", re.I),
-    re.compile(r"\bcoming from you\b", re.I),
-    re.compile(r"\bof course you('d| would)\b", re.I),
-    re.compile(r"\btypical of you\b", re.I),
-    re.compile(r"\bpeople like you\b", re.I),
-    re.compile(r"\byou('re| are) the (kind|type|sort) of\b", re.I),
-]
+AD_HOMINEM = (
+    compile_regex_group([
+        r"\byou('re| are) (just|always|never|only)\b",
+        r"\bcoming from you\b",
+        r"\bof course you('d| would)\b",
+        r"\btypical of you\b",
+        r"\bpeople like you\b",
+        r"\byou('re| are) the (kind|type|sort) of\b",
+    ], anchors=['you', 'coming', 'of', 'typical', 'people']),
+)
 
 # Strawman - misrepresenting opponent's argument
-STRAWMAN = [
-    re.compile(r"\bso you('re| are) saying\b", re.I),
-    re.compile(r"\bwhat you('re| are) really (saying|meaning|suggesting)\b", re.I),
-    re.compile(r"\bin other words,?\s*you\b", re.I),
-    re.compile(r"\blet me get this straight\b", re.I),
-    re.compile(r"\bso basically you\b", re.I),
-]
+STRAWMAN = (
+    compile_regex_group([
+        r"\bso you('re| are) saying\b",
+        r"\bwhat you('re| are) really (saying|meaning|suggesting)\b",
+        r"\bin other words,?\s*you\b",
+        r"\blet me get this straight\b",
+        r"\bso basically you\b",
+    ], anchors=['so', 'what', 'in', 'let']),
+)
 
 # Appeal to authority
-APPEAL_TO_AUTHORITY = [
-    re.compile(r'\b\d+\s*(years?|yrs?)\s*(of experience|experience|in)\b', re.I),
-    re.compile(r"\bI('ve| have) been (doing|working|contributing)\b", re.I),
-    re.compile(r"\bas a (senior|core|experienced|long-time)\b", re.I),
-    re.compile(r"\bin my \d+ years\b", re.I),
-    re.compile(r"\bI('ve| have) been here (since|longer)\b", re.I),
-]
+APPEAL_TO_AUTHORITY = (
+    compile_regex_group([
+        r'\b\d+\s*(years?|yrs?)\s*(of experience|experience|in)\b',
+        r"\bI('ve| have) been (doing|working|contributing)\b",
+        r"\bas a (senior|core|experienced|long-time)\b",
+        r"\bin my \d+ years\b",
+        r"\bI('ve| have) been here (since|longer)\b",
+    ], anchors=list('0123456789') + ['I', 'as', 'in']),
+)
 
 # Moving goalposts
-MOVING_GOALPOSTS = [
-    re.compile(r"\b(but |okay,?\s*)?what about\b", re.I),
-    re.compile(r"\bthat('s| is) not what I meant\b", re.I),
-    re.compile(r"\bI never said\b", re.I),
-    re.compile(r"\byou('re| are) missing the point\b", re.I),
-    re.compile(r"\bthat('s| is) not the issue\b", re.I),
-]
+MOVING_GOALPOSTS = (
+    # No two of these can overlap, and the optional prefix must consume
+    compile_regex_group([
+        r"\b(but |okay,?\s*)?what about\b",
+        r"\bthat('s| is) not what I meant\b",
+        r"\bI never said\b",
+        r"\byou('re| are) missing the point\b",
+        r"\bthat('s| is) not the issue\b",
+    ], overlapping=False),
+)
 
 # Whataboutism
-WHATABOUTISM = [
-    re.compile(r"\bwhat about (when|the time)\b", re.I),
-    re.compile(r"\bbut (you|they|he|she) also\b", re.I),
-    re.compile(r"\byeah but what about\b", re.I),
-    re.compile(r"\bwhat about your\b", re.I),
-]
+WHATABOUTISM = (
+    compile_regex_group([
+        r"\bwhat about (when|the time)\b",
+        r"\bbut (you|they|he|she) also\b",
+        r"\byeah but what about\b",
+        r"\bwhat about your\b",
+    ], anchors=['what', 'but', 'yeah']),
+)
 
 
 # =============================================================================
@@ -241,8 +347,337 @@ THREATS = compile_patterns([
 ])
 
 # Dismissing without engagement
-DISMISS_WITHOUT_ENGAGEMENT = [
-    re.compile(r"^(no|wrong|incorrect|false|nope)\.?$", re.I | re.MULTILINE),
-    re.compile(r"^(nonsense|garbage|rubbish|bs)\.?$", re.I | re.MULTILINE),
-    re.compile(r"\bnot even worth\b", re.I),
-]
+# One-word lines and "not even worth" can't overlap each other or
+# themselves, so the whole set is a lookahead group scanned with the rest
+DISMISS_WITHOUT_ENGAGEMENT = (
+    compile_regex_group([
+        r"(?m:^)(?:no|wrong|incorrect|false|nope|nonsense|garbage|rubbish|bs)\.?(?m:$)",
+        r"\bnot even worth\b",
+    ], anchors=['no', 'wrong', 'incorrect', 'false', 'nope', 'nonsense', 'garbage', 'rubbish', 'bs', 'not']),
+)
+
+
+# =============================================================================
+# CATEGORY SCAN
+# =============================================================================
+
+# Category name -> patterns, scanned together by scan_categories()
+PATTERN_CATEGORIES: Dict[str, Tuple[Pattern, ...]] = {
+    'POSITIVE_POLITENESS': POSITIVE_POLITENESS,
+    'HEDGES': HEDGES,
+    'FACE_THREATENING': FACE_THREATENING,
+    'INDIRECT_AGGRESSION': INDIRECT_AGGRESSION,
+    'DIRECTIVES': DIRECTIVES,
+    'EXPRESSIVES': EXPRESSIVES,
+    'ACCUSATIONS': ACCUSATIONS,
+    'CHALLENGES': CHALLENGES,
+    'EVIDENCE_MARKERS': EVIDENCE_MARKERS,
+    'ACKNOWLEDGMENT': ACKNOWLEDGMENT,
+    'CONSTRUCTIVE': CONSTRUCTIVE,
+    'DISMISSIVE': DISMISSIVE,
+    'AD_HOMINEM': AD_HOMINEM,
+    'STRAWMAN': STRAWMAN,
+    'APPEAL_TO_AUTHORITY': APPEAL_TO_AUTHORITY,
+    'MOVING_GOALPOSTS': MOVING_GOALPOSTS,
+    'WHATABOUTISM': WHATABOUTISM,
+    'STONEWALLING': STONEWALLING,
+    'THREATS': THREATS,
+    'DISMISS_WITHOUT_ENGAGEMENT': DISMISS_WITHOUT_ENGAGEMENT,
+}
+
+
+def _is_positional(pattern: Pattern) -> bool:
+    """Whether a pattern is an anchored, case-insensitive lookahead alternation."""
+    return pattern in _ANCHORS and pattern.flags & ~re.UNICODE == re.IGNORECASE
+
+
+def _lowercase_twin(source: str, flags: int) -> Optional[Pattern]:
+    """
+    Case-sensitive copy of an IGNORECASE pattern for pre-lowercased text.
+
+    Returns None when the pattern isn't IGNORECASE or lowercasing its source
+    would change an escape (\\S, \\W, ...), so callers fall back to the original.
+    """
+    if not flags & re.IGNORECASE or re.search(r'\\[A-Z]', source):
+        return None
+    return re.compile(source.lower(), flags & ~re.IGNORECASE)
+
+
+def _bytes_twin(pattern: Optional[Pattern]) -> Optional[Pattern]:
+    """
+    bytes-mode copy of a lowercase twin, for ASCII text encoded once.
+
+    Returns None when there is no twin or its source isn't ASCII.
+    """
+    if pattern is None or not pattern.pattern.isascii():
+        return None
+    return re.compile(pattern.pattern.encode('ascii'), pattern.flags & ~re.UNICODE)
+
+
+_non_ascii_runs = re.compile(r'[^\x00-\x7f]+').findall
+# str-mode \s also matches the ASCII information separators, bytes-mode \s doesn't
+_info_separator = re.compile('[\x1c-\x1f]').search
+
+
+def _lowering_is_exact(text: str) -> bool:
+    """
+    Whether matching lowercased patterns against text.lower() gives exactly
+    the IGNORECASE results on text.
+
+    True when every non-ASCII character is uncased (quotes, dashes, emoji,
+    CJK ...): lower() then only touches ASCII letters, keeps the length and
+    offsets, and can't hit IGNORECASE special cases like 'ſ' ~ 's' or the
+    two-character 'İ'.lower().
+    """
+    if text.isascii():
+        return True
+    non_ascii = ''.join(_non_ascii_runs(text))
+    return non_ascii.lower() == non_ascii == non_ascii.upper()
+
+
+def _bytes_are_exact(text: str) -> bool:
+    """
+    Whether bytes-mode twins on text.lower().encode() match exactly like the
+    str-mode ones: the text is ASCII (so \\w, \\b and offsets agree) and has
+    no \\x1c-\\x1f, which only str-mode \\s treats as whitespace.
+    """
+    return text.isascii() and not _info_separator(text)
+
+
+_has_digit = re.compile(r'\d').search
+
+# Prefilters for consuming patterns: a cheap check for a substring the
+# pattern cannot match without. Texts that fail it skip the regex.
+# They are case-agnostic, so they work on original or lowercased text.
+_PREFILTERS: Dict[Pattern, Callable[[str], bool]] = {
+    DIRECTIVES[1]: lambda text: "'" in text,        # don't + word
+    EVIDENCE_MARKERS[0]: lambda text: '://' in text,  # URLs
+    EVIDENCE_MARKERS[3]: _has_digit,                # metrics
+}
+
+
+class CategoryScanner:
+    """
+    Counts matches for a set of pattern categories in one pass.
+
+    The lookahead alternations of the categories are folded into one mega
+    pattern: a word-boundary gate on the trie of all anchors (cheap, rejects
+    most positions), a gate that requires at least one category to match
+    here, then one optional named group per category. Each finditer hit
+    records every category matching at that position, so categories sharing
+    phrases ("you need to", "I'm done") are all counted like separate scans
+    would. Phrases listed under several categories ("you're right",
+    "i'm done") sit in a single group per set of owning categories instead
+    of once in each, and a hit there counts for all of them. Consuming
+    patterns keep non-overlapping findall semantics and run on their own.
+
+    Most text can be lowercased once and scanned with case-sensitive twins
+    (mega_lower and each consuming pattern's twin), which skips sre's
+    per-character case folding; see _lowering_is_exact. Plain ASCII text is
+    further encoded and scanned with bytes-mode copies of the twins, which
+    sre runs faster still; see _bytes_are_exact.
+    """
+
+    def __init__(self, categories: Iterable[str]):
+        """
+        Compile the scan for categories.
+
+        Args:
+            categories: Names from PATTERN_CATEGORIES to count
+        """
+        self.categories = tuple(categories)
+        # (group name, (category, pattern) pairs a match of the group counts for)
+        self.groups: List[Tuple[str, FrozenSet[Tuple[str, Pattern]]]] = []
+        # (category, pattern, lowercase twin, bytes twin, prefilter), each optional but pattern
+        self.consuming: List[Tuple[str, Pattern, Optional[Pattern], Optional[Pattern],
+                                   Optional[Callable[[str], bool]]]] = []
+
+        sources = []
+        anchors = []
+        phrase_owners: Dict[str, List[Tuple[str, Pattern]]] = {}
+
+        def add_group(source: str, owners: FrozenSet[Tuple[str, Pattern]]):
+            self.groups.append((f'g{len(self.groups)}', owners))
+            sources.append(source)
+
+        for category in self.categories:
+            for pattern in PATTERN_CATEGORIES[category]:
+                if _is_positional(pattern):
+                    anchors.extend(_ANCHORS[pattern])
+                    if pattern in _PHRASES:
+                        for phrase in _PHRASES[pattern]:
+                            phrase_owners.setdefault(phrase, []).append((category, pattern))
+                    else:
+                        add_group(pattern.pattern, frozenset([(category, pattern)]))
+                else:
+                    twin = _lowercase_twin(pattern.pattern, pattern.flags)
+                    self.consuming.append((
+                        category, pattern, twin, _bytes_twin(twin),
+                        _PREFILTERS.get(pattern)
+                    ))
+
+        phrases_by_owners: Dict[FrozenSet[Tuple[str, Pattern]], List[str]] = {}
+        for phrase, owners in phrase_owners.items():
+            phrases_by_owners.setdefault(frozenset(owners), []).append(phrase)
+        for owners, phrases in phrases_by_owners.items():
+            add_group(_phrase_lookahead(phrases), owners)
+
+        self.phrase_to_categories: Dict[str, Tuple[str, ...]] = {
+            phrase: tuple(category for category, _ in owners)
+            for phrase, owners in phrase_owners.items()
+        }
+
+        self.mega: Optional[Pattern] = None
+        self.mega_lower: Optional[Pattern] = None
+        self.mega_bytes: Optional[Pattern] = None
+        if sources:
+            anchor_gate = _trie_alternation((anchor.lower() for anchor in anchors), prefix_match=True)
+            self.mega = self._build_mega(anchor_gate, sources, re.IGNORECASE)
+            if not any(re.search(r'\\[A-Z]', source) for source in sources):
+                self.mega_lower = self._build_mega(
+                    anchor_gate, [source.lower() for source in sources], 0
+                )
+                self.mega_bytes = _bytes_twin(self.mega_lower)
+
+    def _build_mega(self, anchor_gate: str, sources: Sequence[str], flags: int) -> Pattern:
+        """Compile the anchor gate, match gate and per-category groups for sources."""
+        return re.compile(
+            r'\b(?=' + anchor_gate + ')' +
+            '(?=' + '|'.join(f'(?:{source})' for source in sources) + ')' +
+            ''.join(f'(?:(?P<{name}>{source})|)' for (name, _), source in zip(self.groups, sources)),
+            flags
+        )
+
+    def _scan(self, text: str, offsets: Optional[List[int]], results: List[Dict[str, int]]):
+        """
+        Add category counts for text into results.
+
+        With offsets, text is a BATCH_SEPARATOR join and each match is credited
+        to results[i] for the segment starting at offsets[i]; otherwise every
+        match goes to results[0].
+        """
+        lowered = encoded = None
+        if self.mega_lower is not None and _lowering_is_exact(text):
+            lowered = text.lower()
+            if self.mega_bytes is not None and _bytes_are_exact(text):
+                encoded = lowered.encode('ascii')
+
+        def target(index: int) -> Dict[str, int]:
+            return results[bisect_right(offsets, index) - 1] if offsets else results[0]
+
+        if self.mega is not None:
+            if encoded is not None:
+                mega, subject = self.mega_bytes, encoded
+            elif lowered is not None:
+                mega, subject = self.mega_lower, lowered
+            else:
+                mega, subject = self.mega, text
+            groups = self.groups
+            for match in mega.finditer(subject):
+                group = match.group
+                hits = [owners for name, owners in groups if group(name) is not None]
+                if len(hits) > 1:
+                    # A category owning several matching groups still counts once here
+                    hits = [frozenset().union(*hits)]
+                counts = target(match.start())
+                for category, _ in hits[0]:
+                    counts[category] += 1
+
+        for category, pattern, twin, bytes_twin, prefilter in self.consuming:
+            if prefilter is not None and not prefilter(text):
+                continue
+            if encoded is not None and bytes_twin is not None:
+                pattern, subject = bytes_twin, encoded
+            elif lowered is not None and twin is not None:
+                pattern, subject = twin, lowered
+            else:
+                subject = text
+            if offsets:
+                for match in pattern.finditer(subject):
+                    target(match.start())[category] += 1
+            else:
+                results[0][category] += len(pattern.findall(subject))
+
+    def scan(self, text: str) -> Dict[str, int]:
+        """
+        Count matches for the scanner's categories.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Dict of category name -> match count for every category in
+            PATTERN_CATEGORIES (0 for those this scanner doesn't cover)
+        """
+        counts = dict.fromkeys(PATTERN_CATEGORIES, 0)
+        self._scan(text, None, [counts])
+        return counts
+
+    def scan_batch(self, texts: List[str]) -> List[Dict[str, int]]:
+        """
+        Count category matches for many texts with one scan per pattern.
+
+        The texts are joined with BATCH_SEPARATOR and the mega pattern plus
+        each consuming pattern run over the joined string once; matches are
+        assigned back to their text by start offset. Counts equal scan() on
+        each text alone.
+
+        Args:
+            texts: Texts to scan
+
+        Returns:
+            One category -> count dict per text, in input order
+        """
+        starts = []
+        offset = 0
+        for text in texts:
+            starts.append(offset)
+            offset += len(text) + len(BATCH_SEPARATOR)
+
+        results = [dict.fromkeys(PATTERN_CATEGORIES, 0) for _ in texts]
+        if texts:
+            self._scan(BATCH_SEPARATOR.join(texts), starts, results)
+        return results
+
+
+# Joins texts for CategoryScanner.scan_batch. No pattern can match across
+# it: \x00 is neither a word nor a whitespace character, and the newlines
+# keep ^/$ and \S+ anchored to the message edges.
+BATCH_SEPARATOR = '\n\x00\n'
+
+_FULL_SCANNER = CategoryScanner(PATTERN_CATEGORIES)
+MEGA_PATTERN = _FULL_SCANNER.mega
+MEGA_PATTERN_LOWER = _FULL_SCANNER.mega_lower
+PHRASE_TO_CATEGORIES: Dict[str, Tuple[str, ...]] = _FULL_SCANNER.phrase_to_categories
+
+
+def scan_categories(text: str) -> Dict[str, int]:
+    """
+    Count matches for every pattern category.
+
+    One MEGA_PATTERN pass covers all lookahead alternations; the handful of
+    consuming patterns are counted with findall.
+
+    Args:
+        text: Text to scan
+
+    Returns:
+        Dict of category name -> match count (every category present)
+    """
+    return _FULL_SCANNER.scan(text)
+
+
+def scan_categories_batch(texts: List[str]) -> List[Dict[str, int]]:
+    """
+    Count category matches for many texts at once.
+
+    Counts equal scan_categories() on each text alone; see
+    CategoryScanner.scan_batch.
+
+    Args:
+        texts: Texts to scan
+
+    Returns:
+        One category -> count dict per text, in input order
+    """
+    return _FULL_SCANNER.scan_batch(texts)
@@ -4,9 +4,10 @@ Simple HTTP server for Bitcoin Dev Drama Detector dashboard.
 Run from the project root directory.
 """
 
+import functools
 import http.server
-import socketserver
 import os
+import stat
 from pathlib import Path
 
 # Change to project root
@@ -15,7 +16,39 @@ os.chdir(PROJECT_ROOT)
 
 PORT = 8000
 
+# Files up to this size are kept in memory between requests
+CACHE_MAX_FILE_BYTES = 8 * 1024 * 1024
+
+
+@functools.lru_cache(maxsize=64)
+def _read_file(path, mtime_ns, size):
+    """File contents; mtime and size in the key make edited files miss."""
+    with open(path, 'rb') as f:
+        return f.read()
+
+
 class CORSRequestHandler(http.server.SimpleHTTPRequestHandler):
+    def do_GET(self):
+        """Serve regular files from the in-memory cache, anything else as usual."""
+        path = self.translate_path(self.path)
+        try:
+            st = os.stat(path)
+        except OSError:
+            st = None
+        # Conditional requests go through send_head, which answers 304 Not
+        # Modified for unchanged files
+        if (st is None or not stat.S_ISREG(st.st_mode) or st.st_size > CACHE_MAX_FILE_BYTES
+                or self.path.split('?', 1)[0].endswith('/') or 'If-Modified-Since' in self.headers):
+            return super().do_GET()
+
+        content = _read_file(path, st.st_mtime_ns, st.st_size)
+        self.send_response(200)
+        self.send_header('Content-type', self.guess_type(path))
+        self.send_header('Content-Length', str(len(content)))
+        self.send_header('Last-Modified', self.date_time_string(st.st_mtime))
+        self.end_headers()
+        self.wfile.write(content)
+
     def end_headers(self):
         self.send_header('Access-Control-Allow-Origin', '*')
         self.send_header('Access-Control-Allow-Methods', 'GET')
@@ -39,7 +72,7 @@ if __name__ == '__main__':
     Press Ctrl+C to stop the server
     """)
 
-    with socketserver.TCPServer(("", PORT), CORSRequestHandler) as httpd:
+    with http.server.ThreadingHTTPServer(("", PORT), CORSRequestHandler) as httpd:
         try:
             httpd.serve_forever()
         except KeyboardInterrupt:
@@ -12,128 +12,406 @@ Usage:
 
 import os
 import sys
+import time
 import argparse
-from datetime import datetime, timedelta, timezone
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date as date_type, datetime, timedelta, timezone
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from scrapers.fetch_irc import IRCScraper
 from scrapers.fetch_mailing_list import MailingListScraper
-from scrapers.utils import logger, save_raw_data
+from scrapers.utils import (
+    logger, save_raw_data, list_saved_dates, date_strings, json_loads, RAW_DATA_DIR
+)
+from scrapers.http_cache import HTTPCache, DEFAULT_CACHE_PATH
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+
+# bitcoin/bitcoin PRs and issues matching a search, with only the fields
+# _github_item keeps
+_GITHUB_SEARCH_QUERY = """
+query($query: String!, $cursor: String) {
+  search(query: $query, type: ISSUE, first: 100, after: $cursor) {
+    issueCount
+    pageInfo { endCursor hasNextPage }
+    nodes {
+      __typename
+      ... on PullRequest { number title author { login } state createdAt updatedAt body comments { totalCount } url }
+      ... on Issue { number title author { login } state createdAt updatedAt body comments { totalCount } url }
+    }
+  }
+}
+"""
+
+# The Search API returns at most this many results per query
+GITHUB_SEARCH_CAP = 1000
+
+
+def _parse_github_date(timestamp):
+    """
+    Calendar date of a GitHub API timestamp.
+
+    GitHub returns fixed-width 'YYYY-MM-DDTHH:MM:SSZ' strings, so the date
+    is sliced out directly instead of going through strptime; anything else
+    falls back to fromisoformat.
+    """
+    if len(timestamp) == 20 and timestamp[4] == '-' and timestamp[7] == '-' and timestamp[-1] == 'Z':
+        return date_type(int(timestamp[0:4]), int(timestamp[5:7]), int(timestamp[8:10]))
+    return datetime.fromisoformat(timestamp).date()
 
 
 class HistoricalDataFetcher:
     """Fetch historical raw data from all sources."""
 
+    # Worker threads for the per-date fetches in fetch_date_range
+    MAX_WORKERS = 8
+
+    # Concurrent requests per host in fetch_date_range: within GitHub's
+    # rate limits, and few enough to be polite to gnusha.org
+    GITHUB_CONCURRENCY = 4
+    IRC_CONCURRENCY = 4
+
+    # Pages of a created-desc listing read per date (100 items each)
+    GITHUB_MAX_PAGES = 10
+
+    # GitHub list pages with their ETags, for conditional requests
+    CACHE_PATH = DEFAULT_CACHE_PATH
+
     def __init__(self, github_token=None):
         """Initialize fetcher."""
         self.github_token = github_token or os.getenv('GITHUB_TOKEN')
-        self.irc_scraper = IRCScraper()
+        # One IRCScraper per worker thread (see _irc_scraper)
+        self._irc_local = threading.local()
         self.ml_scraper = MailingListScraper()
 
-    def fetch_github_for_date(self, date):
+        # Dates already saved per source, read once instead of checked per date
+        self._existing = {
+            source: list_saved_dates(RAW_DATA_DIR / source)
+            for source in ('github', 'bips', 'irc', 'mailing_list')
+        }
+
+        self.session = requests.Session()
+        self.session.mount('https://', self._retry_adapter())
+        self.session.headers.update({
+            'Accept': 'application/vnd.github.v3+json',
+            'User-Agent': 'BitcoinDramaDetector/1.0'
+        })
+        if self.github_token:
+            self.session.headers['Authorization'] = f'token {self.github_token}'
+
+        self._github_slots = threading.Semaphore(self.GITHUB_CONCURRENCY)
+        self._irc_slots = threading.Semaphore(self.IRC_CONCURRENCY)
+
+        self.cache = HTTPCache(self.CACHE_PATH)
+
+    @staticmethod
+    def _retry_adapter():
+        """
+        Keep-alive adapter with connection pooling; transient errors and
+        429s are retried with exponential backoff (honoring Retry-After).
         """
-        Fetch GitHub data for a specific date.
+        return HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=5,
+                backoff_factor=1.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                respect_retry_after_header=True
+            )
+        )
+
+    def _irc_scraper(self):
+        """
+        This thread's IRCScraper.
 
-        Fetches PRs and issues created/updated on that date.
+        IRC dates are fetched concurrently, and a requests.Session isn't
+        safe to share between threads, so each worker gets its own.
         """
-        date_str = date.strftime('%Y-%m-%d')
-        logger.info(f"Fetching GitHub data for {date_str}")
+        scraper = getattr(self._irc_local, 'scraper', None)
+        if scraper is None:
+            scraper = self._irc_local.scraper = IRCScraper()
+            scraper.session.mount('https://', self._retry_adapter())
+        return scraper
+
+    @staticmethod
+    def _limited(slots, fetch, date):
+        """Run fetch(date) while holding one of a host's request slots."""
+        with slots:
+            return fetch(date)
+
+    def _github_get(self, url, params=None, headers=None):
+        """
+        GET a GitHub API URL, waiting out an exhausted rate limit.
 
-        # Check if already exists
-        existing_path = f"data/raw/github/{date_str}.json"
-        if os.path.exists(existing_path):
-            logger.info(f"  Already exists, skipping")
-            return True
+        Raises requests.HTTPError for other failed responses.
+        """
+        return self._github_request('get', url, params=params, headers=headers)
 
-        try:
-            headers = {
-                'Accept': 'application/vnd.github.v3+json',
-                'User-Agent': 'BitcoinDramaDetector/1.0'
-            }
-            if self.github_token:
-                headers['Authorization'] = f'token {self.github_token}'
+    def _github_graphql(self, query, variables):
+        """
+        Run a GitHub GraphQL query, waiting out an exhausted rate limit.
 
-            # Fetch PRs created on this date
-            next_day = date + timedelta(days=1)
-            date_filter = f"{date.strftime('%Y-%m-%dT%H:%M:%SZ')}..{next_day.strftime('%Y-%m-%dT%H:%M:%SZ')}"
+        Returns:
+            The response's data dict
 
-            pull_requests = []
-            issues = []
+        Raises requests.HTTPError for failed responses or GraphQL errors.
+        """
+        payload = self._github_request(
+            'post', GITHUB_GRAPHQL_URL, json={'query': query, 'variables': variables}
+        ).json()
+        if payload.get('errors'):
+            raise requests.HTTPError(f"GraphQL error: {payload['errors'][0].get('message')}")
+        return payload['data']
+
+    def _github_request(self, method, url, **kwargs):
+        """Send a GitHub API request, retrying after an exhausted rate limit."""
+        while True:
+            response = self.session.request(method, url, timeout=30, **kwargs)
+            if response.status_code == 403 and response.headers.get('X-RateLimit-Remaining') == '0':
+                reset_time = int(response.headers.get('X-RateLimit-Reset', 0))
+                wait_time = max(reset_time - time.time(), 0) + 1
+                logger.warning(f"GitHub rate limit exhausted. Waiting {wait_time:.0f}s")
+                time.sleep(wait_time)
+                continue
+            response.raise_for_status()
+            return response
+
+    def _github_list(self, url, params=None):
+        """
+        GET one page of a GitHub list endpoint as a conditional request.
 
-            # Fetch PRs (limit to 100 for historical data)
-            pr_url = f"https://api.github.com/repos/bitcoin/bitcoin/pulls"
-            params = {
-                'state': 'all',
-                'sort': 'created',
-                'direction': 'desc',
-                'per_page': 100
-            }
+        The page's ETag is sent as If-None-Match; a 304 Not Modified has no
+        body and doesn't count against the rate limit, so the cached copy
+        of the page is used instead.
 
-            response = requests.get(pr_url, headers=headers, params=params, timeout=30)
-            if response.status_code == 200:
-                all_prs = response.json()
-                # Filter by date
-                for pr in all_prs:
-                    created_at = datetime.strptime(pr['created_at'], '%Y-%m-%dT%H:%M:%SZ')
-                    if created_at.date() == date.date():
-                        pull_requests.append({
-                            'number': pr['number'],
-                            'title': pr['title'],
-                            'user': pr['user']['login'],
-                            'state': pr['state'],
-                            'created_at': pr['created_at'],
-                            'updated_at': pr['updated_at'],
-                            'body': pr.get('body') or '',
-                            'comments': pr.get('comments', 0),
-                            'url': pr['html_url']
-                        })
-
-            # Fetch issues (limit to 100)
-            issue_url = f"https://api.github.com/repos/bitcoin/bitcoin/issues"
-            response = requests.get(issue_url, headers=headers, params=params, timeout=30)
-            if response.status_code == 200:
-                all_issues = response.json()
-                # Filter by date and exclude PRs
-                for issue in all_issues:
-                    if 'pull_request' not in issue:
-                        created_at = datetime.strptime(issue['created_at'], '%Y-%m-%dT%H:%M:%SZ')
-                        if created_at.date() == date.date():
-                            issues.append({
-                                'number': issue['number'],
-                                'title': issue['title'],
-                                'user': issue['user']['login'],
-                                'state': issue['state'],
-                                'created_at': issue['created_at'],
-                                'updated_at': issue['updated_at'],
-                                'body': issue.get('body') or '',
-                                'comments': issue.get('comments', 0),
-                                'url': issue['html_url']
-                            })
+        Args:
+            url: Endpoint URL
+            params: Query parameters, including the page number
 
-            # Save data
-            data = {
-                'source': 'github',
-                'repository': 'bitcoin/bitcoin',
-                'fetched_at': datetime.now(timezone.utc).isoformat(),
-                'date': date_str,
-                'pull_requests': pull_requests,
-                'issues': issues,
-                'summary': {
-                    'pull_requests': len(pull_requests),
-                    'issues': len(issues)
-                }
+        Returns:
+            Tuple of (items, URL of the next page or None)
+        """
+        key = requests.Request('GET', url, params=params).prepare().url
+        cached = self.cache.get(key)
+
+        response = self._github_get(url, params, HTTPCache.conditional_headers(cached))
+        if response.status_code == 304 and cached:
+            body, link = cached['body'], cached['link']
+        else:
+            self.cache.set(key, response)
+            body, link = response.content, response.headers.get('Link')
+
+        next_url = None
+        for link_value in requests.utils.parse_header_links(link or ''):
+            if link_value.get('rel') == 'next':
+                next_url = link_value['url']
+        return json_loads(body), next_url
+
+    def _github_created_on(self, url, target_date):
+        """
+        List a repo's PRs or issues created on one date.
+
+        Pages through the created-desc listing with explicit page numbers
+        until it reaches older items, GITHUB_MAX_PAGES at most.
+
+        Args:
+            url: List endpoint URL (pulls or issues)
+            target_date: The date (datetime.date)
+
+        Returns:
+            List of trimmed items created on target_date
+        """
+        params = {
+            'state': 'all',
+            'sort': 'created',
+            'direction': 'desc',
+            'per_page': 100
+        }
+        matched = []
+        for page in range(1, self.GITHUB_MAX_PAGES + 1):
+            items, _ = self._github_list(url, {**params, 'page': page})
+            for item in items:
+                if _parse_github_date(item['created_at']) == target_date:
+                    matched.append(item)
+            if len(items) < params['per_page'] or _parse_github_date(items[-1]['created_at']) < target_date:
+                break
+        return matched
+
+    def _graphql_created_between(self, first, last):
+        """
+        List bitcoin/bitcoin PRs and issues created in a date range via GraphQL.
+
+        A created:FIRST..LAST search, oldest first, returns only the kept
+        fields. Ranges with more results than one search returns are split
+        in half.
+
+        Args:
+            first: First date (datetime.date)
+            last: Last date (datetime.date)
+
+        Returns:
+            Tuple of (PRs, issues) in _github_item form, oldest first
+        """
+        variables = {
+            'query': f"repo:bitcoin/bitcoin created:{first.isoformat()}..{last.isoformat()} sort:created-asc",
+            'cursor': None
+        }
+        pull_requests, issues = [], []
+        while True:
+            search = self._github_graphql(_GITHUB_SEARCH_QUERY, variables)['search']
+            if variables['cursor'] is None and search['issueCount'] > GITHUB_SEARCH_CAP and first < last:
+                middle = first + timedelta(days=(last - first).days // 2)
+                earlier = self._graphql_created_between(first, middle)
+                later = self._graphql_created_between(middle + timedelta(days=1), last)
+                return earlier[0] + later[0], earlier[1] + later[1]
+
+            for node in search['nodes']:
+                kind = pull_requests if node['__typename'] == 'PullRequest' else issues
+                kind.append(self._graphql_item(node))
+            if not search['pageInfo']['hasNextPage']:
+                return pull_requests, issues
+            variables['cursor'] = search['pageInfo']['endCursor']
+
+    def _rest_created_between(self, first, last):
+        """
+        List bitcoin/bitcoin PRs and issues created in a date range via REST.
+
+        Walks the issues endpoint (which lists PRs too) once, oldest first
+        from first, following Link: rel="next" pages until items are
+        created after last.
+
+        Args:
+            first: First date (datetime.date)
+            last: Last date (datetime.date)
+
+        Returns:
+            Tuple of (PRs, issues) in _github_item form, oldest first
+        """
+        url = "https://api.github.com/repos/bitcoin/bitcoin/issues"
+        params = {
+            'state': 'all',
+            'sort': 'created',
+            'direction': 'asc',
+            'since': datetime.combine(first, datetime.min.time()).strftime('%Y-%m-%dT%H:%M:%SZ'),
+            'per_page': 100
+        }
+        pull_requests, issues = [], []
+        while url:
+            items, next_url = self._github_list(url, params)
+            for item in items:
+                created = _parse_github_date(item['created_at'])
+                if created > last:
+                    return pull_requests, issues
+                if created >= first:
+                    kind = pull_requests if 'pull_request' in item else issues
+                    kind.append(self._github_item(item))
+            # The next URL carries the query string
+            url = next_url if items else None
+            params = None
+        return pull_requests, issues
+
+    @staticmethod
+    def _graphql_item(node):
+        """A GraphQL PR/issue node in the same form as _github_item."""
+        state = node['state']
+        return {
+            'number': node['number'],
+            'title': node['title'],
+            # Deleted accounts have no author; REST reports them as "ghost"
+            'user': (node['author'] or {}).get('login', 'ghost'),
+            # REST calls merged PRs closed
+            'state': 'closed' if state == 'MERGED' else state.lower(),
+            'created_at': node['createdAt'],
+            'updated_at': node['updatedAt'],
+            'body': node.get('body') or '',
+            'comments': node.get('comments', {}).get('totalCount', 0),
+            'url': node['url']
+        }
+
+    @staticmethod
+    def _github_item(item):
+        """Fields kept from a bitcoin/bitcoin PR or issue."""
+        return {
+            'number': item['number'],
+            'title': item['title'],
+            'user': item['user']['login'],
+            'state': item['state'],
+            'created_at': item['created_at'],
+            'updated_at': item['updated_at'],
+            'body': item.get('body') or '',
+            'comments': item.get('comments', 0),
+            'url': item['html_url']
+        }
+
+    @staticmethod
+    def _github_data(date_str, pull_requests, issues):
+        """Raw GitHub file contents for one date."""
+        return {
+            'source': 'github',
+            'repository': 'bitcoin/bitcoin',
+            'fetched_at': datetime.now(timezone.utc).isoformat(),
+            'date': date_str,
+            'pull_requests': pull_requests,
+            'issues': issues,
+            'summary': {
+                'pull_requests': len(pull_requests),
+                'issues': len(issues)
             }
+        }
 
-            save_raw_data(data, 'github', date_str)
-            logger.info(f"  ✅ Saved {len(pull_requests)} PRs, {len(issues)} issues")
-            return True
+    def fetch_github_range(self, start_date, end_date):
+        """
+        Fetch bitcoin/bitcoin PRs and issues for every date in a range.
+
+        With a token, a GraphQL search returns just the kept fields;
+        otherwise the REST issues listing is walked once. One file is saved
+        per missing date.
+
+        Args:
+            start_date: First date (datetime)
+            end_date: Last date (datetime)
+
+        Returns:
+            Set of date strings that have GitHub data saved afterwards
+        """
+        first, last = start_date.date(), end_date.date()
+        date_strs = date_strings(start_date, end_date)
+        missing = [date_str for date_str in date_strs if date_str not in self._existing['github']]
+        if not missing:
+            return set(date_strs)
+
+        logger.info(f"Fetching GitHub data for {missing[0]} to {missing[-1]}")
+        by_date = defaultdict(lambda: {'pull_requests': [], 'issues': []})
+
+        try:
+            if self.github_token:
+                pull_requests, issues = self._graphql_created_between(first, last)
+            else:
+                pull_requests, issues = self._rest_created_between(first, last)
+            for kind, items in (('pull_requests', pull_requests), ('issues', issues)):
+                for item in items:
+                    by_date[item['created_at'][:10]][kind].append(item)
 
         except Exception as e:
             logger.error(f"  ❌ Error: {e}")
-            return False
+            return set(date_strs) & self._existing['github']
+
+        for date_str in missing:
+            day = by_date[date_str]
+            save_raw_data(self._github_data(date_str, day['pull_requests'], day['issues']), 'github', date_str)
+            self._existing['github'].add(date_str)
+            logger.info(f"  ✅ {date_str}: saved {len(day['pull_requests'])} PRs, {len(day['issues'])} issues")
+
+        return set(date_strs)
 
     def fetch_bips_for_date(self, date):
         """
@@ -145,104 +423,71 @@ class HistoricalDataFetcher:
         logger.info(f"Fetching BIPs data for {date_str}")
 
         # Check if already exists
-        existing_path = f"data/raw/bips/{date_str}.json"
-        if os.path.exists(existing_path):
+        if date_str in self._existing['bips']:
             logger.info(f"  Already exists, skipping")
             return True
 
         try:
-            headers = {
-                'Accept': 'application/vnd.github.v3+json',
-                'User-Agent': 'BitcoinDramaDetector/1.0'
-            }
-            if self.github_token:
-                headers['Authorization'] = f'token {self.github_token}'
-
             # Fetch PRs created on this date
             next_day = date + timedelta(days=1)
             date_filter = f"{date.strftime('%Y-%m-%dT%H:%M:%SZ')}..{next_day.strftime('%Y-%m-%dT%H:%M:%SZ')}"
 
+            target_date = date.date()
             pull_requests = []
             issues = []
 
-            # Fetch PRs (limit to 100 for historical data)
+            # Fetch PRs created on the date
             pr_url = f"https://api.github.com/repos/bitcoin/bips/pulls"
-            params = {
-                'state': 'all',
-                'sort': 'created',
-                'direction': 'desc',
-                'per_page': 100
-            }
+            for pr in self._github_created_on(pr_url, target_date):
+                pull_requests.append({
+                    'id': pr['id'],
+                    'number': pr['number'],
+                    'title': pr['title'],
+                    'body': pr.get('body') or '',
+                    'state': pr['state'],
+                    'user': pr['user']['login'],
+                    'created_at': pr['created_at'],
+                    'updated_at': pr['updated_at'],
+                    'merged_at': pr.get('merged_at'),
+                    'comments': pr.get('comments', 0),
+                    'review_comments': pr.get('review_comments', 0),
+                    'url': pr['html_url'],
+                    'labels': [l['name'] for l in pr.get('labels', [])],
+                    'drama_signals': {
+                        'drama_keywords': 0,
+                        'positive_keywords': 0,
+                        'text_length': len(pr['title']) + len(pr.get('body') or ''),
+                        'has_nack': False,
+                        'has_ack': False
+                    }
+                })
 
-            response = requests.get(pr_url, headers=headers, params=params, timeout=30)
-            if response.status_code == 200:
-                all_prs = response.json()
-                # Filter by date
-                for pr in all_prs:
-                    created_at = datetime.strptime(pr['created_at'], '%Y-%m-%dT%H:%M:%SZ')
-                    if created_at.date() == date.date():
-                        pull_requests.append({
-                            'id': pr['id'],
-                            'number': pr['number'],
-                            'title': pr['title'],
-                            'body': pr.get('body') or '',
-                            'state': pr['state'],
-                            'user': pr['user']['login'],
-                            'created_at': pr['created_at'],
-                            'updated_at': pr['updated_at'],
-                            'merged_at': pr.get('merged_at'),
-                            'comments': pr.get('comments', 0),
-                            'review_comments': pr.get('review_comments', 0),
-                            'url': pr['html_url'],
-                            'labels': [l['name'] for l in pr.get('labels', [])],
-                            'drama_signals': {
-                                'drama_keywords': 0,
-                                'positive_keywords': 0,
-                                'text_length': len(pr['title']) + len(pr.get('body') or ''),
-                                'has_nack': False,
-                                'has_ack': False
-                            }
-                        })
-
-            # Fetch issues
+            # Fetch issues created on the date, excluding PRs
             issue_url = f"https://api.github.com/repos/bitcoin/bips/issues"
-            params = {
-                'state': 'all',
-                'sort': 'created',
-                'direction': 'desc',
-                'per_page': 100
-            }
-
-            response = requests.get(issue_url, headers=headers, params=params, timeout=30)
-            if response.status_code == 200:
-                all_issues = response.json()
-                # Filter by date and exclude PRs
-                for issue in all_issues:
-                    if 'pull_request' in issue:
-                        continue
-                    created_at = datetime.strptime(issue['created_at'], '%Y-%m-%dT%H:%M:%SZ')
-                    if created_at.date() == date.date():
-                        issues.append({
-                            'id': issue['id'],
-                            'number': issue['number'],
-                            'title': issue['title'],
-                            'body': issue.get('body') or '',
-                            'state': issue['state'],
-                            'user': issue['user']['login'],
-                            'created_at': issue['created_at'],
-                            'updated_at': issue['updated_at'],
-                            'closed_at': issue.get('closed_at'),
-                            'comments': issue.get('comments', 0),
-                            'url': issue['html_url'],
-                            'labels': [l['name'] for l in issue.get('labels', [])],
-                            'drama_signals': {
-                                'drama_keywords': 0,
-                                'positive_keywords': 0,
-                                'text_length': len(issue['title']) + len(issue.get('body') or ''),
-                                'has_nack': False,
-                                'has_ack': False
-                            }
-                        })
+            for issue in self._github_created_on(issue_url, target_date):
+                if 'pull_request' in issue:
+                    continue
+                issues.append({
+                    'id': issue['id'],
+                    'number': issue['number'],
+                    'title': issue['title'],
+                    'body': issue.get('body') or '',
+                    'state': issue['state'],
+                    'user': issue['user']['login'],
+                    'created_at': issue['created_at'],
+                    'updated_at': issue['updated_at'],
+                    'closed_at': issue.get('closed_at'),
+                    'comments': issue.get('comments', 0),
+                    'url': issue['html_url'],
+                    'labels': [l['name'] for l in issue.get('labels', [])],
+                    'drama_signals': {
+                        'drama_keywords': 0,
+                        'positive_keywords': 0,
+                        'text_length': len(issue['title']) + len(issue.get('body') or ''),
+                        'has_nack': False,
+                        'has_ack': False
+                    }
+                })
 
             # Save data
             data = {
@@ -264,6 +509,7 @@ class HistoricalDataFetcher:
             }
 
             save_raw_data(data, 'bips', date_str)
+            self._existing['bips'].add(date_str)
             logger.info(f"  ✅ Saved {len(pull_requests)} PRs, {len(issues)} issues")
             return True
 
@@ -277,14 +523,13 @@ class HistoricalDataFetcher:
         logger.info(f"Fetching IRC data for {date_str}")
 
         # Check if already exists
-        existing_path = f"data/raw/irc/{date_str}.json"
-        if os.path.exists(existing_path):
+        if date_str in self._existing['irc']:
             logger.info(f"  Already exists, skipping")
             return True
 
         try:
             # Fetch log for this specific date
-            log_data = self.irc_scraper.fetch_date(date)
+            log_data = self._irc_scraper().fetch_date(date)
 
             if log_data:
                 # Wrap in expected format
@@ -306,6 +551,7 @@ class HistoricalDataFetcher:
                 }
 
                 save_raw_data(data, 'irc', date_str)
+                self._existing['irc'].add(date_str)
                 logger.info(f"  ✅ Saved {log_data['message_count']} messages")
                 return True
             else:
@@ -328,8 +574,7 @@ class HistoricalDataFetcher:
         logger.info(f"Fetching mailing list data for {date_str}")
 
         # Check if already exists
-        existing_path = f"data/raw/mailing_list/{date_str}.json"
-        if os.path.exists(existing_path):
+        if date_str in self._existing['mailing_list']:
             logger.info(f"  Already exists, skipping")
             return True
 
@@ -344,23 +589,33 @@ class HistoricalDataFetcher:
         logger.info(f"Fetching historical data: {start_date.date()} to {end_date.date()}")
         logger.info(f"{'='*60}\n")
 
-        current = start_date
-        success_count = 0
-        total_days = (end_date - start_date).days + 1
-
-        while current <= end_date:
-            logger.info(f"\n--- {current.strftime('%Y-%m-%d')} ---")
-
-            # Fetch from all sources
-            github_ok = self.fetch_github_for_date(current)
-            bips_ok = self.fetch_bips_for_date(current)
-            irc_ok = self.fetch_irc_for_date(current)
-            ml_ok = self.fetch_mailing_list_for_date(current)
-
-            if github_ok or bips_ok or irc_ok or ml_ok:
-                success_count += 1
-
-            current += timedelta(days=1)
+        date_strs = date_strings(start_date, end_date)
+        dates = [start_date + timedelta(days=offset) for offset in range(len(date_strs))]
+        total_days = len(dates)
+
+        # bitcoin/bitcoin is fetched for the whole range in one paginated walk
+        github_dates = self.fetch_github_range(start_date, end_date)
+        ok_dates = set(date_strs) & github_dates
+
+        # The other sources are fetched per date; the requests are I/O-bound,
+        # so they overlap in threads, with per-host limits
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as pool:
+            futures = {}
+            for date, date_str in zip(dates, date_strs):
+                futures[pool.submit(self._limited, self._github_slots, self.fetch_bips_for_date, date)] = date_str
+                futures[pool.submit(self._limited, self._irc_slots, self.fetch_irc_for_date, date)] = date_str
+                futures[pool.submit(self.fetch_mailing_list_for_date, date)] = date_str
+
+            for done, future in enumerate(as_completed(futures), 1):
+                if future.result():
+                    ok_dates.add(futures[future])
+                if done % 50 == 0 or done == len(futures):
+                    logger.info(f"Progress: {done}/{len(futures)} fetches done")
+
+        # Drop list pages no run has asked for lately (range walks are keyed
+        # on their start date, so old ones never recur)
+        self.cache.prune()
+        success_count = len(ok_dates)
 
         logger.info(f"\n{'='*60}")
         logger.info(f"Fetch complete: {success_count}/{total_days} days")
@@ -18,6 +18,7 @@ from .utils import (
     save_processed_data,
     load_processed_data,
     calculate_basic_drama_signals,
+    calculate_basic_drama_signals_batch,
     DRAMA_KEYWORDS,
     POSITIVE_KEYWORDS,
 )
@@ -30,6 +31,7 @@ __all__ = [
     'save_processed_data',
     'load_processed_data',
     'calculate_basic_drama_signals',
+    'calculate_basic_drama_signals_batch',
     'DRAMA_KEYWORDS',
     'POSITIVE_KEYWORDS',
 ]
@@ -15,9 +15,13 @@ Uses GitHub REST API with pagination support.
 import os
 import sys
 import time
-import requests
+import logging
+import random
+import importlib.util
+import httpx
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Generator, Optional, List, Dict, Union
+from typing import Callable, Generator, Optional, List, Dict, Union
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -31,8 +35,10 @@ from scrapers.utils import (
     get_date_range,
     save_raw_data,
     format_iso_date,
-    calculate_basic_drama_signals
+    parse_github_timestamp,
+    calculate_basic_drama_signals_batch
 )
+from scrapers.http_cache import HTTPCache, DEFAULT_CACHE_PATH
 
 
 class BIPsScraper:
@@ -41,6 +47,15 @@ class BIPsScraper:
     BASE_URL = "https://api.github.com"
     REPO = "bitcoin/bips"
 
+    # Concurrent comment fetches, low enough for GitHub's secondary rate limits
+    COMMENT_WORKERS = 10
+
+    # Multiplex the concurrent fetches over one connection when h2 is installed
+    HTTP2 = importlib.util.find_spec('h2') is not None
+
+    # Fetched pages with their ETags, for conditional requests
+    CACHE_PATH = DEFAULT_CACHE_PATH
+
     def __init__(self, token: str = None):
         """
         Initialize the BIPs scraper.
@@ -49,7 +64,12 @@ class BIPsScraper:
             token: GitHub personal access token (optional but recommended)
         """
         self.token = token or os.getenv('GITHUB_TOKEN')
-        self.session = requests.Session()
+        self.session = httpx.Client(
+            http2=self.HTTP2,
+            timeout=30.0,
+            follow_redirects=True,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=20)
+        )
 
         # Set headers
         self.session.headers.update({
@@ -63,7 +83,14 @@ class BIPsScraper:
         else:
             logger.warning("No GitHub token - rate limits will be stricter (60 req/hr)")
 
-    def _request(self, endpoint: str, params: dict = None, max_retries: int = 3) -> Union[dict, list]:
+        # Shared by the comment workers; HTTPCache locks its connection
+        self.cache = HTTPCache(self.CACHE_PATH)
+
+        # Last seen X-RateLimit-Remaining/Reset, to pause before the quota runs out
+        self._rate_remaining = None
+        self._rate_reset = 0
+
+    def _request(self, endpoint: str, params: dict = None, max_retries: int = 5) -> Union[dict, list]:
         """
         Make a request to the GitHub API with rate limit handling and retry logic.
 
@@ -75,49 +102,100 @@ class BIPsScraper:
         Returns:
             JSON response data
         """
-        url = f"{self.BASE_URL}{endpoint}"
+        return self._get(f"{self.BASE_URL}{endpoint}", params, max_retries).json()
 
-        for attempt in range(max_retries + 1):
-            try:
-                response = self.session.get(url, params=params)
+    def _get(self, url: str, params: dict = None, max_retries: int = 5) -> httpx.Response:
+        """
+        GET a GitHub API URL with rate limit handling and retry logic.
 
-                # Check rate limits
-                remaining = int(response.headers.get('X-RateLimit-Remaining', 0))
-                reset_time = int(response.headers.get('X-RateLimit-Reset', 0))
+        Args:
+            url: Full request URL
+            params: Query parameters
+            max_retries: Maximum number of retries for transient errors
 
-                if remaining < 10:
-                    logger.warning(f"GitHub rate limit low: {remaining} remaining")
+        Returns:
+            The successful response
 
-                if response.status_code == 403 and 'rate limit' in response.text.lower():
-                    wait_time = max(reset_time - time.time(), 60)
-                    logger.error(f"Rate limited. Waiting {wait_time:.0f}s")
+        Pages fetched before are requested with If-None-Match/If-Modified-Since.
+        A 304 Not Modified doesn't count against the rate limit and is answered
+        with the stored page.
+        """
+        key = str(httpx.URL(url).copy_merge_params(params or {}))
+        stored = self.cache.get(key)
+        headers = HTTPCache.conditional_headers(stored)
+
+        for attempt in range(max_retries + 1):
+            # Wait for the reset rather than spend the last requests of the quota
+            if self._rate_remaining is not None and self._rate_remaining < 5:
+                wait_time = self._rate_reset - time.time()
+                if wait_time > 0:
+                    logger.warning(f"GitHub rate limit nearly exhausted. Waiting {wait_time:.0f}s for reset")
+                    time.sleep(wait_time)
+                self._rate_remaining = None
+
+            try:
+                response = self.session.get(url, params=params, headers=headers)
+            except httpx.NetworkError:
+                if attempt < max_retries:
+                    wait_time = self._backoff(attempt)
+                    logger.warning(f"Connection error. Retrying in {wait_time:.0f}s (attempt {attempt + 1}/{max_retries})")
                     time.sleep(wait_time)
                     continue
+                raise
 
-                # Retry on transient server errors (502, 503, 504)
-                if response.status_code in (502, 503, 504):
-                    if attempt < max_retries:
-                        wait_time = (2 ** attempt) * 5  # Exponential backoff: 5s, 10s, 20s
-                        logger.warning(f"Server error {response.status_code}. Retrying in {wait_time}s (attempt {attempt + 1}/{max_retries})")
-                        time.sleep(wait_time)
-                        continue
-                    else:
-                        logger.error(f"Server error {response.status_code} after {max_retries} retries")
-                        response.raise_for_status()
+            # Check rate limits
+            if 'X-RateLimit-Remaining' in response.headers:
+                self._rate_remaining = int(response.headers['X-RateLimit-Remaining'])
+                self._rate_reset = int(response.headers.get('X-RateLimit-Reset', 0))
+                if self._rate_remaining < 10:
+                    logger.warning(f"GitHub rate limit low: {self._rate_remaining} remaining")
 
-                response.raise_for_status()
-                return response.json()
+            rate_limited = response.status_code == 429 or (
+                response.status_code == 403 and 'rate limit' in response.text.lower()
+            )
 
-            except requests.exceptions.ConnectionError as e:
+            # Retry rate limits and transient server errors (502, 503, 504)
+            if rate_limited or response.status_code in (502, 503, 504):
                 if attempt < max_retries:
-                    wait_time = (2 ** attempt) * 5
-                    logger.warning(f"Connection error. Retrying in {wait_time}s (attempt {attempt + 1}/{max_retries})")
+                    retry_after = response.headers.get('Retry-After', '')
+                    if retry_after.isdigit():
+                        wait_time = int(retry_after)
+                    elif rate_limited and self._rate_remaining == 0:
+                        wait_time = max(self._rate_reset - time.time(), 60)
+                    else:
+                        wait_time = self._backoff(attempt)
+                    logger.warning(f"GitHub returned {response.status_code}. Retrying in {wait_time:.0f}s (attempt {attempt + 1}/{max_retries})")
                     time.sleep(wait_time)
-                else:
-                    raise
+                    continue
+                logger.error(f"GitHub returned {response.status_code} after {max_retries} retries")
+
+            if response.status_code == 304 and stored:
+                link = stored['link']
+                return httpx.Response(200, headers={'Link': link} if link else None,
+                                      content=stored['body'], request=response.request)
+
+            response.raise_for_status()
+            self.cache.set(key, response)
+            return response
 
         # Should not reach here, but just in case
-        raise requests.exceptions.HTTPError(f"Failed after {max_retries} retries")
+        raise httpx.HTTPError(f"Failed after {max_retries} retries")
+
+    @staticmethod
+    def _backoff(attempt: int) -> float:
+        """Exponential backoff with jitter, capped at a minute."""
+        return min(2 ** attempt + random.uniform(0, 1), 60)
+
+    @staticmethod
+    def _since_param(since: datetime) -> str:
+        """
+        Server-side since filter, rounded down to the start of its UTC day.
+
+        since is now - N days to the second, so passing it as is would make
+        every run's URLs new and never answerable with a 304. The rounded
+        filter returns a superset; callers still filter on the exact since.
+        """
+        return format_iso_date(since.replace(hour=0, minute=0, second=0, microsecond=0))
 
     def _paginate(self, endpoint: str, params: dict = None, max_pages: int = 10) -> Generator[dict, None, None]:
         """
@@ -131,13 +209,13 @@ class BIPsScraper:
         Yields:
             Individual items from paginated results
         """
+        url = f"{self.BASE_URL}{endpoint}"
         params = params or {}
         params['per_page'] = 100
-        page = 1
 
-        while page <= max_pages:
-            params['page'] = page
-            results = self._request(endpoint, params)
+        for _ in range(max_pages):
+            response = self._get(url, params)
+            results = response.json()
 
             if not results:
                 break
@@ -145,10 +223,42 @@ class BIPsScraper:
             for item in results:
                 yield item
 
-            if len(results) < 100:
+            # Follow GitHub's Link header; the next URL already carries the query
+            next_link = response.links.get('next')
+            if not next_link:
                 break
+            url, params = next_link['url'], None
+
+    def _attach_comments(self, items: List[dict], fetch: Callable[[dict], List[dict]]):
+        """
+        Fetch comment_data for items concurrently.
+
+        Comment fetches are latency-bound round-trips, so they overlap in
+        threads over the shared keep-alive session.
+
+        Args:
+            items: PR/issue dicts to attach comment_data to
+            fetch: Returns the comment list for one item
+        """
+        with ThreadPoolExecutor(max_workers=self.COMMENT_WORKERS) as pool:
+            for item, comments in zip(items, pool.map(fetch, items)):
+                item['comment_data'] = comments
+
+    @staticmethod
+    def _attach_drama_signals(items: List[dict]):
+        """
+        Calculate basic drama signals for items and their comment_data.
+
+        Every title+body and comment body goes through one batched keyword
+        scan rather than one scan per text.
 
-            page += 1
+        Args:
+            items: PR/issue dicts, with comment_data already attached
+        """
+        comments = [comment for item in items for comment in item.get('comment_data', [])]
+        texts = [f"{item['title']} {item['body']}" for item in items] + [c['body'] for c in comments]
+        for record, signals in zip(items + comments, calculate_basic_drama_signals_batch(texts)):
+            record['drama_signals'] = signals
 
     def fetch_pull_requests(self, since: datetime) -> List[dict]:
         """
@@ -171,7 +281,7 @@ class BIPsScraper:
         }
 
         for pr in self._paginate(endpoint, params):
-            updated_at = datetime.fromisoformat(pr['updated_at'].replace('Z', '+00:00'))
+            updated_at = parse_github_timestamp(pr['updated_at'])
 
             if updated_at < since:
                 break
@@ -191,62 +301,74 @@ class BIPsScraper:
                 'url': pr['html_url'],
                 'labels': [l['name'] for l in pr.get('labels', [])],
             }
-
-            # Fetch comments if there are any
-            if pr_data['comments'] > 0 or pr_data['review_comments'] > 0:
-                pr_data['comment_data'] = self._fetch_pr_comments(pr['number'], since)
-
-            # Calculate basic drama signals
-            full_text = f"{pr_data['title']} {pr_data['body']}"
-            pr_data['drama_signals'] = calculate_basic_drama_signals(full_text)
-
             prs.append(pr_data)
-            logger.debug(f"Fetched BIP PR #{pr['number']}: {pr['title'][:50]}")
+
+        # Fetch comments for the PRs that have any
+        self._attach_comments(
+            [pr_data for pr_data in prs if pr_data['comments'] > 0 or pr_data['review_comments'] > 0],
+            lambda pr_data: self._fetch_pr_comments(
+                pr_data['number'], since,
+                issue_comments=pr_data['comments'] > 0,
+                review_comments=pr_data['review_comments'] > 0
+            )
+        )
+
+        self._attach_drama_signals(prs)
+        # Skip formatting a line per PR unless debug logging is on
+        if logger.isEnabledFor(logging.DEBUG):
+            for pr_data in prs:
+                logger.debug(f"Fetched BIP PR #{pr_data['number']}: {pr_data['title'][:50]}")
 
         logger.info(f"Fetched {len(prs)} BIPs pull requests")
         return prs
 
-    def _fetch_pr_comments(self, pr_number: int, since: datetime) -> List[dict]:
+    def _fetch_pr_comments(self, pr_number: int, since: datetime,
+                           issue_comments: bool = True, review_comments: bool = True) -> List[dict]:
         """
         Fetch comments on a specific PR.
 
         Args:
             pr_number: The PR number
             since: Only fetch comments after this date
+            issue_comments: Whether the PR has discussion comments to fetch
+            review_comments: Whether the PR has review comments to fetch
 
         Returns:
             List of comment dictionaries
         """
         comments = []
+        # Comments created after since were also updated after it, so the
+        # server-side filter only drops pages we would discard anyway
+        params = {'since': self._since_param(since)}
 
         # Issue comments (general discussion)
-        endpoint = f"/repos/{self.REPO}/issues/{pr_number}/comments"
-        for comment in self._paginate(endpoint, max_pages=5):
-            created_at = datetime.fromisoformat(comment['created_at'].replace('Z', '+00:00'))
-            if created_at >= since:
-                comments.append({
-                    'id': comment['id'],
-                    'type': 'issue_comment',
-                    'user': comment['user']['login'],
-                    'body': comment['body'],
-                    'created_at': comment['created_at'],
-                    'drama_signals': calculate_basic_drama_signals(comment['body'])
-                })
+        if issue_comments:
+            endpoint = f"/repos/{self.REPO}/issues/{pr_number}/comments"
+            for comment in self._paginate(endpoint, dict(params), max_pages=5):
+                created_at = parse_github_timestamp(comment['created_at'])
+                if created_at >= since:
+                    comments.append({
+                        'id': comment['id'],
+                        'type': 'issue_comment',
+                        'user': comment['user']['login'],
+                        'body': comment['body'],
+                        'created_at': comment['created_at']
+                    })
 
         # Review comments (inline code comments)
-        endpoint = f"/repos/{self.REPO}/pulls/{pr_number}/comments"
-        for comment in self._paginate(endpoint, max_pages=5):
-            created_at = datetime.fromisoformat(comment['created_at'].replace('Z', '+00:00'))
-            if created_at >= since:
-                comments.append({
-                    'id': comment['id'],
-                    'type': 'review_comment',
-                    'user': comment['user']['login'],
-                    'body': comment['body'],
-                    'created_at': comment['created_at'],
-                    'path': comment.get('path'),
-                    'drama_signals': calculate_basic_drama_signals(comment['body'])
-                })
+        if review_comments:
+            endpoint = f"/repos/{self.REPO}/pulls/{pr_number}/comments"
+            for comment in self._paginate(endpoint, dict(params), max_pages=5):
+                created_at = parse_github_timestamp(comment['created_at'])
+                if created_at >= since:
+                    comments.append({
+                        'id': comment['id'],
+                        'type': 'review_comment',
+                        'user': comment['user']['login'],
+                        'body': comment['body'],
+                        'created_at': comment['created_at'],
+                        'path': comment.get('path')
+                    })
 
         return comments
 
@@ -268,13 +390,18 @@ class BIPsScraper:
             'state': 'all',
             'sort': 'updated',
             'direction': 'desc',
-            'since': format_iso_date(since)
+            'since': self._since_param(since)
         }
+        # What the exact since filter would have kept (it has second precision)
+        cutoff = since.replace(microsecond=0)
 
         for issue in self._paginate(endpoint, params):
             # Skip pull requests (they appear in issues endpoint too)
             if 'pull_request' in issue:
                 continue
+            # The server-side filter is rounded down to the day
+            if parse_github_timestamp(issue['updated_at']) < cutoff:
+                break
 
             issue_data = {
                 'id': issue['id'],
@@ -290,17 +417,18 @@ class BIPsScraper:
                 'url': issue['html_url'],
                 'labels': [l['name'] for l in issue.get('labels', [])],
             }
+            issues.append(issue_data)
 
-            # Fetch comments if there are any
-            if issue_data['comments'] > 0:
-                issue_data['comment_data'] = self._fetch_issue_comments(issue['number'], since)
-
-            # Calculate basic drama signals
-            full_text = f"{issue_data['title']} {issue_data['body']}"
-            issue_data['drama_signals'] = calculate_basic_drama_signals(full_text)
+        # Fetch comments for the issues that have any
+        self._attach_comments(
+            [issue_data for issue_data in issues if issue_data['comments'] > 0],
+            lambda issue_data: self._fetch_issue_comments(issue_data['number'], since)
+        )
 
-            issues.append(issue_data)
-            logger.debug(f"Fetched BIP issue #{issue['number']}: {issue['title'][:50]}")
+        self._attach_drama_signals(issues)
+        if logger.isEnabledFor(logging.DEBUG):
+            for issue_data in issues:
+                logger.debug(f"Fetched BIP issue #{issue_data['number']}: {issue_data['title'][:50]}")
 
         logger.info(f"Fetched {len(issues)} BIPs issues")
         return issues
@@ -318,15 +446,19 @@ class BIPsScraper:
         """
         comments = []
         endpoint = f"/repos/{self.REPO}/issues/{issue_number}/comments"
-        params = {'since': format_iso_date(since)}
+        params = {'since': self._since_param(since)}
+        # What the exact since filter would have kept (it has second precision)
+        cutoff = since.replace(microsecond=0)
 
         for comment in self._paginate(endpoint, params, max_pages=5):
+            # The server-side filter is rounded down to the day
+            if parse_github_timestamp(comment['updated_at']) < cutoff:
+                continue
             comments.append({
                 'id': comment['id'],
                 'user': comment['user']['login'],
                 'body': comment['body'],
-                'created_at': comment['created_at'],
-                'drama_signals': calculate_basic_drama_signals(comment['body'])
+                'created_at': comment['created_at']
             })
 
         return comments
@@ -366,14 +498,19 @@ class BIPsScraper:
             ) + sum(
                 len(issue.get('comment_data', [])) for issue in data['issues']
             ),
-            'unique_participants': len(set(
-                [pr['user'] for pr in data['pull_requests']] +
-                [issue['user'] for issue in data['issues']] +
-                [c['user'] for pr in data['pull_requests'] for c in pr.get('comment_data', [])] +
-                [c['user'] for issue in data['issues'] for c in issue.get('comment_data', [])]
-            ))
         }
 
+        # Accumulate into one set instead of concatenating lists first
+        participants = set()
+        for items in (data['pull_requests'], data['issues']):
+            for item in items:
+                participants.add(item['user'])
+                participants.update(c['user'] for c in item.get('comment_data', []))
+        data['summary']['unique_participants'] = len(participants)
+
+        # Drop cached pages no run has asked for lately
+        self.cache.prune()
+
         logger.info(f"BIPs fetch complete: {data['summary']}")
         return data
 
@@ -28,6 +28,7 @@ from scrapers.utils import (
     get_date_range,
     save_raw_data,
     format_iso_date,
+    parse_github_timestamp,
     calculate_basic_drama_signals
 )
 
@@ -168,7 +169,7 @@ class GitHubScraper:
         }
         
         for pr in self._paginate(endpoint, params):
-            updated_at = datetime.fromisoformat(pr['updated_at'].replace('Z', '+00:00'))
+            updated_at = parse_github_timestamp(pr['updated_at'])
             
             if updated_at < since:
                 break
@@ -219,7 +220,7 @@ class GitHubScraper:
         # Issue comments (general discussion)
         endpoint = f"/repos/{self.REPO}/issues/{pr_number}/comments"
         for comment in self._paginate(endpoint, max_pages=5):
-            created_at = datetime.fromisoformat(comment['created_at'].replace('Z', '+00:00'))
+            created_at = parse_github_timestamp(comment['created_at'])
             if created_at >= since:
                 comments.append({
                     'id': comment['id'],
@@ -233,7 +234,7 @@ class GitHubScraper:
         # Review comments (inline code comments)
         endpoint = f"/repos/{self.REPO}/pulls/{pr_number}/comments"
         for comment in self._paginate(endpoint, max_pages=5):
-            created_at = datetime.fromisoformat(comment['created_at'].replace('Z', '+00:00'))
+            created_at = parse_github_timestamp(comment['created_at'])
             if created_at >= since:
                 comments.append({
                     'id': comment['id'],
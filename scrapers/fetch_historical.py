@@ -14,13 +14,21 @@ Usage:
 import os
 import sys
 import re
+import gzip
 import json
 import time
 import argparse
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from datetime import datetime, timedelta, timezone
-from bs4 import BeautifulSoup
-from typing import Optional, List, Dict
+from pathlib import Path
+from lxml import etree, html as lxml_html
+from typing import Optional, List, Dict, Tuple
 from dotenv import load_dotenv
 
 # Load environment variables from project root
@@ -30,8 +38,28 @@ load_dotenv(os.path.join(project_root, '.env'))
 # Add parent directory to path for imports
 sys.path.insert(0, project_root)
 
-from scrapers.utils import logger, save_raw_data, calculate_basic_drama_signals
+from scrapers.utils import (
+    logger, save_raw_data, calculate_basic_drama_signals, json_loads, raw_data_path, RAW_DATA_DIR,
+    TokenBucket
+)
 from scrapers.fetch_irc import IRCScraper
+from scrapers.http_cache import HTTPCache, DEFAULT_CACHE_PATH
+
+# Mailing list archive patterns
+_INDEX_DATE_RE = re.compile(r'(\d{4}-\d{2}-\d{2})\s+\d{2}:\d{2}')
+_NEXT_TS_RE = re.compile(r'\?t=(\d+)')
+_FROM_RE = re.compile(r'From:\s*(.+?)(?:\n|$)')
+_DATE_HDR_RE = re.compile(r'Date:\s*(.+?)(?:\t|\n)')
+_SUBJ_RE = re.compile(r'Subject:\s*(.+?)(?:\n|$)')
+_BODY_RE = re.compile(r'\n\n(.+)', re.DOTALL)
+_REPLY_PREFIX_RE = re.compile(r'^(?:Re|Fwd|FW):\s*', re.IGNORECASE)
+_ANGLE_ADDR_RE = re.compile(r'<[^>]+>')
+_GITHUB_DONE_RE = re.compile(r'\.(\d{4}-\d{2}-\d{2})\.done\.(\d+)\.(\d+)')
+
+# Message pages are cut off here; the headers and kept body come first
+MESSAGE_PAGE_MAX_BYTES = 256_000
+# Bytes fed to the message page parser at a time
+MESSAGE_PARSE_CHUNK = 16 * 1024
 
 
 class HistoricalMailingListScraper:
@@ -39,33 +67,146 @@ class HistoricalMailingListScraper:
 
     BASE_URL = "https://gnusha.org/pi/bitcoindev"
 
+    # Fetched pages, so reruns revalidate or skip them instead of downloading
+    CACHE_PATH = DEFAULT_CACHE_PATH
+
     def __init__(self):
         self.session = requests.Session()
+        # Pooled keep-alive connections for every day and message worker;
+        # transient gnusha.org errors are retried with backoff
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=1, status_forcelist=[502, 503, 504])
+        ))
         self.session.headers.update({
             'User-Agent': 'BitcoinDramaDetector/1.0 (research project)'
         })
-        self.request_delay = 1.0
-        self.last_request_time = 0
+        # Politeness: 5 requests/second on average (bursts of 5), 5 in flight
+        self.request_delay = 0.2
+        self.max_workers = 5
+        self.rate_bucket = TokenBucket(rate=1 / self.request_delay, capacity=5)
+        self.cache = HTTPCache(self.CACHE_PATH)
 
     def _rate_limit(self):
-        """Enforce rate limiting between requests."""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.request_delay:
-            time.sleep(self.request_delay - elapsed)
-        self.last_request_time = time.time()
-
-    def _fetch_page(self, url: str) -> Optional[BeautifulSoup]:
-        """Fetch and parse a web page."""
-        self._rate_limit()
-        try:
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-            return BeautifulSoup(response.text, 'html.parser')
-        except requests.RequestException as e:
-            logger.error(f"Error fetching {url}: {e}")
+        """Enforce rate limiting between requests, across threads."""
+        self.rate_bucket.acquire()
+
+    def _fetch_raw(self, url: str, immutable: bool = False,
+                   max_bytes: Optional[int] = None) -> Optional[Dict]:
+        """
+        Fetch a web page without parsing it.
+
+        Pages seen before are revalidated with their stored ETag or
+        Last-Modified, and a 304 is answered from the cache.
+
+        Args:
+            url: Page URL
+            immutable: The page never changes (a single message), so a
+                stored copy is used without asking the server
+            max_bytes: Stop downloading after this many bytes and keep
+                what arrived; cut-off pages aren't cached
+
+        Returns:
+            Dict with the page's encoding and body (bytes), or None if the
+            fetch failed
+        """
+        page = self.cache.get(url)
+        if not (immutable and page):
+            self._rate_limit()
+            try:
+                with self.session.get(url, timeout=30, headers=HTTPCache.conditional_headers(page),
+                                      stream=max_bytes is not None) as response:
+                    if response.status_code != 304 or page is None:
+                        response.raise_for_status()
+                        if max_bytes is None:
+                            body = response.content
+                        else:
+                            body = self._read_limited(response, max_bytes)
+                        if max_bytes is None or len(body) <= max_bytes:
+                            self.cache.set(url, response, always=immutable, body=body)
+                        page = {'encoding': response.encoding, 'body': body[:max_bytes]}
+            except requests.RequestException as e:
+                logger.error(f"Error fetching {url}: {e}")
+                return None
+        return page
+
+    def _fetch_page(self, url: str) -> Optional[lxml_html.HtmlElement]:
+        """
+        Fetch and parse a web page.
+
+        Args:
+            url: Page URL
+
+        Returns:
+            Parsed document, or None if the fetch failed
+        """
+        page = self._fetch_raw(url)
+        if page is None:
             return None
+        # Decode the same way response.text would
+        parser = lxml_html.HTMLParser(encoding=page['encoding'] or 'utf-8')
+        return lxml_html.document_fromstring(page['body'], parser=parser)
 
-    def _parse_index_page(self, soup: BeautifulSoup) -> tuple[List[dict], Optional[str]]:
+    @staticmethod
+    def _message_parts(page: Dict) -> tuple[Optional[str], Optional[str]]:
+        """
+        Text of a message page's <title> and second <pre> (the message).
+
+        The page is fed to a pull parser in chunks and parsing stops once
+        the message block has closed, so the thread overview after it is
+        never parsed.
+
+        Args:
+            page: Page dict from _fetch_raw
+
+        Returns:
+            Tuple of (stripped title text or None, message text or None)
+        """
+        parser = etree.HTMLPullParser(events=('end',), tag=('title', 'pre'),
+                                      encoding=page['encoding'] or 'utf-8')
+        title = None
+        pres = 0
+        body = page['body']
+        chunks = (body[offset:offset + MESSAGE_PARSE_CHUNK]
+                  for offset in range(0, len(body), MESSAGE_PARSE_CHUNK))
+        # A final None closes the parser, ending tags a cut-off page left open
+        for chunk in chain(chunks, [None]):
+            if chunk is None:
+                try:
+                    parser.close()
+                except etree.XMLSyntaxError:  # Empty page
+                    break
+            else:
+                parser.feed(chunk)
+            for _, elem in parser.read_events():
+                if elem.tag == 'title':
+                    if title is None:
+                        title = ''.join(text.strip() for text in elem.itertext())
+                else:
+                    pres += 1
+                    if pres == 2:
+                        return title, ''.join(elem.itertext())
+        return title, None
+
+    @staticmethod
+    def _read_limited(response: requests.Response, max_bytes: int) -> bytes:
+        """Read a streamed body, stopping once it passes max_bytes."""
+        chunks = []
+        size = 0
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size > max_bytes:
+                break
+        return b''.join(chunks)
+
+    @staticmethod
+    def _stripped_text(elem: lxml_html.HtmlElement) -> str:
+        """An element's text with each text node stripped, like get_text(strip=True)."""
+        return ''.join(text.strip() for text in elem.itertext())
+
+    def _parse_index_page(self, tree: lxml_html.HtmlElement) -> tuple[List[dict], Optional[str]]:
         """
         Parse an index page for messages and the next page link.
 
@@ -75,25 +216,28 @@ class HistoricalMailingListScraper:
         messages = []
         next_timestamp = None
 
-        # Find all message entries - look for links to threads
-        for link in soup.find_all('a', href=True):
+        # Index entries often share one <pre>, so date each parent once
+        parent_dates = {}
+
+        # One walk over the links: thread links contain /T/#, and the first
+        # "next (older)" link with a timestamp gives the next page
+        for link in tree.xpath('//a[@href]'):
             href = link.get('href', '')
 
-            # Thread links contain /T/#
             if '/T/#' in href:
                 message_id = href.split('/T/')[0].lstrip('/')
-                title = link.get_text(strip=True)
+                title = self._stripped_text(link)
 
                 if title and len(title) > 5:
                     # Try to find the date from surrounding text
-                    parent = link.find_parent(['pre', 'div', 'p'])
+                    parent = next(link.iterancestors('pre', 'div', 'p'), None)
                     date_str = None
-                    if parent:
-                        text = parent.get_text()
-                        # Look for UTC timestamp pattern
-                        date_match = re.search(r'(\d{4}-\d{2}-\d{2})\s+\d{2}:\d{2}', text)
-                        if date_match:
-                            date_str = date_match.group(1)
+                    if parent is not None:
+                        if parent not in parent_dates:
+                            # Look for UTC timestamp pattern
+                            date_match = _INDEX_DATE_RE.search(parent.text_content())
+                            parent_dates[parent] = date_match.group(1) if date_match else None
+                        date_str = parent_dates[parent]
 
                     messages.append({
                         'message_id': message_id,
@@ -102,23 +246,24 @@ class HistoricalMailingListScraper:
                         'url': f"{self.BASE_URL}/{message_id}"
                     })
 
-        # Find "next (older)" link for pagination
-        for link in soup.find_all('a', href=True):
-            if 'next' in link.get_text().lower() or 'older' in link.get_text().lower():
-                href = link.get('href', '')
-                # Extract timestamp parameter
-                match = re.search(r'\?t=(\d+)', href)
-                if match:
-                    next_timestamp = match.group(1)
-                    break
+            if next_timestamp is None:
+                link_text = link.text_content().lower()
+                if 'next' in link_text or 'older' in link_text:
+                    # Extract timestamp parameter
+                    match = _NEXT_TS_RE.search(href)
+                    if match:
+                        next_timestamp = match.group(1)
 
         return messages, next_timestamp
 
     def _parse_message(self, url: str) -> Optional[dict]:
         """Parse an individual message."""
-        soup = self._fetch_page(url)
-        if not soup:
+        # Only the headers and the first 2000 body characters are kept, so
+        # pages with large attachments needn't be downloaded in full
+        page = self._fetch_raw(url, immutable=True, max_bytes=MESSAGE_PAGE_MAX_BYTES)
+        if page is None:
             return None
+        title, text = self._message_parts(page)
 
         message = {
             'url': url,
@@ -129,29 +274,25 @@ class HistoricalMailingListScraper:
         }
 
         # Get title
-        title_elem = soup.find('title')
-        if title_elem:
-            message['title'] = title_elem.get_text(strip=True)
+        if title is not None:
+            message['title'] = title
 
         # Parse headers from pre tag
-        pre_tags = soup.find_all('pre')
-        if len(pre_tags) >= 2:
-            text = pre_tags[1].get_text()
-
-            from_match = re.search(r'From:\s*(.+?)(?:\n|$)', text)
+        if text is not None:
+            from_match = _FROM_RE.search(text)
             if from_match:
                 author = from_match.group(1).strip().replace('•', '@')
                 message['author'] = author
 
-            date_match = re.search(r'Date:\s*(.+?)(?:\t|\n)', text)
+            date_match = _DATE_HDR_RE.search(text)
             if date_match:
                 message['date'] = date_match.group(1).strip()
 
-            subject_match = re.search(r'Subject:\s*(.+?)(?:\n|$)', text)
+            subject_match = _SUBJ_RE.search(text)
             if subject_match:
                 message['title'] = subject_match.group(1).strip()
 
-            body_match = re.search(r'\n\n(.+)', text, re.DOTALL)
+            body_match = _BODY_RE.search(text)
             if body_match:
                 message['body'] = body_match.group(1).strip()[:2000]
 
@@ -186,11 +327,11 @@ class HistoricalMailingListScraper:
         day_before = (target_date - timedelta(days=1)).strftime('%Y-%m-%d')
 
         while pages_fetched < max_pages and len(messages) < max_messages:
-            soup = self._fetch_page(current_url)
-            if not soup:
+            tree = self._fetch_page(current_url)
+            if tree is None:
                 break
 
-            page_messages, next_timestamp = self._parse_index_page(soup)
+            page_messages, next_timestamp = self._parse_index_page(tree)
             pages_fetched += 1
 
             # Filter messages for our target date
@@ -207,13 +348,14 @@ class HistoricalMailingListScraper:
 
             current_url = f"{self.BASE_URL}/?t={next_timestamp}"
 
-        # Fetch full content for each message
-        full_messages = []
-        for msg_meta in messages[:max_messages]:
+        # Fetch full content for each message; the fetches overlap in
+        # threads, still paced by _rate_limit
+        selected = messages[:max_messages]
+        for msg_meta in selected:
             logger.info(f"  Fetching: {msg_meta['title'][:50]}...")
-            full_msg = self._parse_message(msg_meta['url'])
-            if full_msg:
-                full_messages.append(full_msg)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            parsed = pool.map(self._parse_message, [msg_meta['url'] for msg_meta in selected])
+            full_messages = [full_msg for full_msg in parsed if full_msg]
 
         return full_messages
 
@@ -229,41 +371,44 @@ class HistoricalMailingListScraper:
         """
         messages = self.fetch_messages_for_date(date)
 
-        # Group into threads
-        threads_map = {}
+        # Group into threads, tallying participants and drama as we go
+        threads_map = defaultdict(lambda: {
+            'title': None,
+            'messages': [],
+            'participants': set(),
+            'drama_keywords': 0,
+        })
+        all_participants = set()
+        # Authors repeat across a day's messages; strip each address once
+        clean_authors = {}
         for msg in messages:
-            subject = re.sub(r'^(Re|Fwd|FW):\s*', '', msg.get('title', ''), flags=re.IGNORECASE)
+            subject = _REPLY_PREFIX_RE.sub('', msg.get('title', ''))
             subject = subject.strip().lower()
 
-            if subject not in threads_map:
-                threads_map[subject] = {
-                    'title': msg.get('title', 'Unknown'),
-                    'messages': [],
-                    'participants': set(),
-                }
-
-            threads_map[subject]['messages'].append(msg)
+            thread = threads_map[subject]
+            if thread['title'] is None:
+                thread['title'] = msg.get('title', 'Unknown')
+            thread['messages'].append(msg)
+            thread['drama_keywords'] += msg.get('drama_signals', {}).get('drama_keywords', 0)
             author = msg.get('author', '')
             if author:
-                author_clean = re.sub(r'<[^>]+>', '', author).strip()
+                author_clean = clean_authors.get(author)
+                if author_clean is None:
+                    author_clean = clean_authors[author] = sys.intern(_ANGLE_ADDR_RE.sub('', author).strip())
                 if author_clean:
-                    threads_map[subject]['participants'].add(author_clean)
+                    thread['participants'].add(author_clean)
+                    all_participants.add(author_clean)
 
         threads = []
         for subject, thread_data in threads_map.items():
-            total_drama = sum(m.get('drama_signals', {}).get('drama_keywords', 0) for m in thread_data['messages'])
             threads.append({
                 'title': thread_data['title'],
                 'message_count': len(thread_data['messages']),
                 'participants': list(thread_data['participants']),
                 'messages': thread_data['messages'],
-                'drama_signals': {'drama_keywords': total_drama}
+                'drama_signals': {'drama_keywords': thread_data['drama_keywords']}
             })
 
-        all_participants = set()
-        for thread in threads:
-            all_participants.update(thread['participants'])
-
         return {
             'source': 'mailing_list',
             'list': 'bitcoin-dev',
@@ -278,108 +423,310 @@ class HistoricalMailingListScraper:
         }
 
 
-def fetch_historical_irc(start_date: datetime, end_date: datetime) -> None:
-    """Fetch historical IRC logs for a date range."""
-    scraper = IRCScraper()
-    current_date = start_date
+# Days fetched at once by the historical range fetchers. Mailing list
+# requests are already paced by the scraper's shared rate limit; IRC gets
+# fewer workers to stay polite to gnusha.org.
+IRC_DAY_WORKERS = 4
+MAILING_LIST_DAY_WORKERS = 8
+
+
+def _done_marker(source: str, date_str: str) -> Path:
+    """Sidecar marking a day whose saved file has messages."""
+    return RAW_DATA_DIR / source / f'.{date_str}.done'
+
+
+def _has_saved_messages(source: str, date_str: str) -> bool:
+    """
+    Check if an IRC/mailing list file exists with real data.
+
+    A .done marker newer than the file answers without parsing it; a file
+    rewritten since the marker was touched is parsed again.
+    """
+    filepath = raw_data_path(source, date_str)
+    if filepath is None:
+        return False
+    marker = _done_marker(source, date_str)
+    try:
+        if marker.stat().st_mtime >= filepath.stat().st_mtime:
+            return True
+    except FileNotFoundError:
+        pass
+
+    opener = gzip.open if filepath.suffix == '.gz' else open
+    with opener(filepath, 'rb') as f:
+        existing = json_loads(f.read())
+    has_messages = existing.get('summary', {}).get('total_messages', 0) > 0
+    if has_messages:
+        marker.touch()
+    return has_messages
+
+
+def _github_done_markers(source: str) -> Dict[str, Tuple[int, int]]:
+    """
+    PR and issue counts of saved GitHub days, from one directory listing.
+
+    Days saved with data get a .{date}.done.{prs}.{issues} marker, so the
+    skip check doesn't open their files.
+    """
+    try:
+        names = os.listdir(RAW_DATA_DIR / source)
+    except FileNotFoundError:
+        return {}
+    markers = {}
+    for name in names:
+        match = _GITHUB_DONE_RE.fullmatch(name)
+        if match:
+            markers[match.group(1)] = (int(match.group(2)), int(match.group(3)))
+    return markers
+
+
+def _mark_github_done(source: str, date_str: str, pr_count: int, issue_count: int):
+    """Replace a GitHub day's .done marker with one for its current counts."""
+    for old in (RAW_DATA_DIR / source).glob(f'.{date_str}.done.*'):
+        old.unlink()
+    if pr_count > 0 or issue_count > 0:
+        (RAW_DATA_DIR / source / f'.{date_str}.done.{pr_count}.{issue_count}').touch()
+
+
+def _saved_github_counts(source: str, date_str: str,
+                         markers: Dict[str, Tuple[int, int]]) -> Optional[Tuple[int, int]]:
+    """
+    PR and issue counts of a saved GitHub day, or None if it has no data.
+
+    A marker newer than the file answers without parsing it; a file
+    rewritten since the marker was touched is parsed again.
+    """
+    filepath = raw_data_path(source, date_str)
+    if filepath is None:
+        return None
+    counts = markers.get(date_str)
+    if counts is not None:
+        marker = RAW_DATA_DIR / source / f'.{date_str}.done.{counts[0]}.{counts[1]}'
+        try:
+            if marker.stat().st_mtime >= filepath.stat().st_mtime:
+                return counts
+        except FileNotFoundError:
+            pass
+
+    try:
+        opener = gzip.open if filepath.suffix == '.gz' else open
+        with opener(filepath, 'rb') as f:
+            existing = json_loads(f.read())
+    except (ValueError, IOError):
+        return None
+    pr_count = len(existing.get('pull_requests', []))
+    issue_count = len(existing.get('issues', []))
+    if pr_count == 0 and issue_count == 0:
+        return None
+    _mark_github_done(source, date_str, pr_count, issue_count)
+    return pr_count, issue_count
 
-    total_days = (end_date - start_date).days + 1
-    processed = 0
 
-    while current_date <= end_date:
-        date_str = current_date.strftime('%Y-%m-%d')
-        output_path = f"data/raw/irc/{date_str}.json"
+class _ProgressCursor:
+    """
+    Days of a historical range fetch finished without gaps.
 
-        # Check if we already have this file with real data
-        if os.path.exists(output_path):
-            with open(output_path, 'r', encoding='utf-8') as f:
-                existing = json.load(f)
-                if existing.get('summary', {}).get('total_messages', 0) > 0:
-                    logger.info(f"IRC {date_str}: Already has data, skipping")
-                    current_date += timedelta(days=1)
-                    processed += 1
-                    continue
+    Kept in data/raw/<source>/.progress as the first and last date of the
+    finished run, so a restarted fetch can skip those days without opening
+    their files. Only days saved with data count as finished; empty days
+    are still retried on the next run.
+    """
 
-        logger.info(f"IRC [{processed+1}/{total_days}] Fetching {date_str}...")
-
-        data = scraper.fetch_date(current_date)
-
-        if data:
-            # Wrap single day data in the expected format
-            wrapped_data = {
-                'source': 'irc',
-                'channel': '#bitcoin-core-dev',
-                'fetched_at': datetime.now(timezone.utc).isoformat(),
-                'date': date_str,
-                'logs': [data],
-                'summary': {
-                    'days_fetched': 1,
-                    'total_messages': data.get('message_count', 0),
-                    'total_threads': len(data.get('threads', [])),
-                    'unique_participants': data.get('participant_count', 0)
-                }
-            }
-            save_raw_data(wrapped_data, 'irc', date_str)
-            logger.info(f"  -> {data.get('message_count', 0)} messages, {len(data.get('threads', []))} threads")
+    def __init__(self, source: str, start_date: datetime):
+        """
+        Load the stored cursor if it reaches the start of this fetch.
+
+        Args:
+            source: Raw data source (irc, mailing_list)
+            start_date: First date of the range being fetched
+        """
+        self.path = RAW_DATA_DIR / source / '.progress'
+        self._lock = threading.Lock()
+        self._done = set()
+
+        start_str = start_date.strftime('%Y-%m-%d')
+        day_before = (start_date - timedelta(days=1)).strftime('%Y-%m-%d')
+        stored = self._read()
+        if stored and stored['start'] <= start_str and day_before <= stored['through']:
+            self.start, self.through = stored['start'], stored['through']
+            self._stored = None
         else:
-            # Save empty file to indicate we tried
-            empty_data = {
-                'source': 'irc',
-                'channel': '#bitcoin-core-dev',
-                'fetched_at': datetime.now(timezone.utc).isoformat(),
-                'date': date_str,
-                'logs': [],
-                'summary': {
-                    'days_fetched': 0,
-                    'total_messages': 0,
-                    'total_threads': 0,
-                    'unique_participants': 0
-                }
+            self.start, self.through = start_str, day_before
+            # An earlier run further ahead, joined once this one reaches it
+            self._stored = stored
+
+    def _read(self) -> Optional[dict]:
+        """Read the stored cursor (None if missing or corrupt)."""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def is_done(self, date_str: str) -> bool:
+        """Check if a date of this fetch is already behind the cursor."""
+        return date_str <= self.through
+
+    def mark_done(self, date_str: str):
+        """Record a finished date, advancing the cursor over any run it completes."""
+        with self._lock:
+            self._done.add(date_str)
+            advanced = False
+            while True:
+                next_day = (datetime.strptime(self.through, '%Y-%m-%d') + timedelta(days=1)).strftime('%Y-%m-%d')
+                if next_day not in self._done:
+                    break
+                self._done.remove(next_day)
+                self.through = next_day
+                advanced = True
+                if self._stored and self._stored['start'] <= next_day < self._stored['through']:
+                    self.through = self._stored['through']
+
+            if advanced:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.path.with_name(self.path.name + '.tmp')
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump({'start': self.start, 'through': self.through}, f)
+                os.replace(tmp_path, self.path)
+
+
+def _fetch_irc_day(scraper: IRCScraper, date: datetime, position: int, total_days: int) -> bool:
+    """Fetch and save one day of IRC logs, returning whether it had any."""
+    date_str = date.strftime('%Y-%m-%d')
+    logger.info(f"IRC [{position}/{total_days}] Fetching {date_str}...")
+
+    data = scraper.fetch_date(date)
+
+    if data:
+        # Wrap single day data in the expected format
+        wrapped_data = {
+            'source': 'irc',
+            'channel': '#bitcoin-core-dev',
+            'fetched_at': datetime.now(timezone.utc).isoformat(),
+            'date': date_str,
+            'logs': [data],
+            'summary': {
+                'days_fetched': 1,
+                'total_messages': data.get('message_count', 0),
+                'total_threads': len(data.get('threads', [])),
+                'unique_participants': data.get('participant_count', 0)
+            }
+        }
+        save_raw_data(wrapped_data, 'irc', date_str)
+        logger.info(f"  -> {date_str}: {data.get('message_count', 0)} messages, {len(data.get('threads', []))} threads")
+        if wrapped_data['summary']['total_messages'] > 0:
+            _done_marker('irc', date_str).touch()
+            return True
+        return False
+    else:
+        # Save empty file to indicate we tried
+        empty_data = {
+            'source': 'irc',
+            'channel': '#bitcoin-core-dev',
+            'fetched_at': datetime.now(timezone.utc).isoformat(),
+            'date': date_str,
+            'logs': [],
+            'summary': {
+                'days_fetched': 0,
+                'total_messages': 0,
+                'total_threads': 0,
+                'unique_participants': 0
             }
-            save_raw_data(empty_data, 'irc', date_str)
-            logger.info(f"  -> No logs found")
+        }
+        save_raw_data(empty_data, 'irc', date_str)
+        logger.info(f"  -> {date_str}: No logs found")
+        return False
 
-        current_date += timedelta(days=1)
-        processed += 1
 
-    logger.info(f"IRC historical fetch complete: {processed} days processed")
+def fetch_historical_irc(start_date: datetime, end_date: datetime) -> None:
+    """Fetch historical IRC logs for a date range."""
+    dates = [start_date + timedelta(days=i) for i in range((end_date - start_date).days + 1)]
+    total_days = len(dates)
+    progress = _ProgressCursor('irc', start_date)
 
+    pending = []
+    resumed = 0
+    for position, date in enumerate(dates, 1):
+        date_str = date.strftime('%Y-%m-%d')
+        if progress.is_done(date_str):
+            resumed += 1
+        # Check if we already have this file with real data
+        elif _has_saved_messages('irc', date_str):
+            logger.info(f"IRC {date_str}: Already has data, skipping")
+            progress.mark_done(date_str)
+        else:
+            pending.append((date, position))
+    if resumed:
+        logger.info(f"IRC: skipping {resumed} days finished by an earlier run")
 
-def fetch_historical_mailing_list(start_date: datetime, end_date: datetime) -> None:
-    """Fetch historical mailing list data for a date range."""
-    scraper = HistoricalMailingListScraper()
-    current_date = start_date
+    # Each worker gets its own IRCScraper, so no requests.Session is shared
+    workers = threading.local()
 
-    total_days = (end_date - start_date).days + 1
-    processed = 0
+    def fetch_day(job):
+        date, position = job
+        if not hasattr(workers, 'scraper'):
+            workers.scraper = IRCScraper()
+        if _fetch_irc_day(workers.scraper, date, position, total_days):
+            progress.mark_done(date.strftime('%Y-%m-%d'))
 
-    while current_date <= end_date:
-        date_str = current_date.strftime('%Y-%m-%d')
-        output_path = f"data/raw/mailing_list/{date_str}.json"
+    # Days are independent and I/O-bound, so they are fetched in threads
+    with ThreadPoolExecutor(max_workers=IRC_DAY_WORKERS) as pool:
+        list(pool.map(fetch_day, pending))
 
-        # Check if we already have this file with real data
-        if os.path.exists(output_path):
-            with open(output_path, 'r', encoding='utf-8') as f:
-                existing = json.load(f)
-                if existing.get('summary', {}).get('total_messages', 0) > 0:
-                    logger.info(f"Mailing list {date_str}: Already has data, skipping")
-                    current_date += timedelta(days=1)
-                    processed += 1
-                    continue
+    logger.info(f"IRC historical fetch complete: {total_days} days processed")
+
+
+def _fetch_mailing_list_day(scraper: HistoricalMailingListScraper, date: datetime,
+                            position: int, total_days: int) -> bool:
+    """Fetch and save one day of mailing list messages, returning whether it had any."""
+    date_str = date.strftime('%Y-%m-%d')
+    logger.info(f"Mailing list [{position}/{total_days}] Fetching {date_str}...")
+
+    data = scraper.fetch_date(date)
+    save_raw_data(data, 'mailing_list', date_str)
+
+    msg_count = data.get('summary', {}).get('total_messages', 0)
+    thread_count = data.get('summary', {}).get('total_threads', 0)
+    logger.info(f"  -> {date_str}: {msg_count} messages, {thread_count} threads")
+    if msg_count > 0:
+        _done_marker('mailing_list', date_str).touch()
+        return True
+    return False
 
-        logger.info(f"Mailing list [{processed+1}/{total_days}] Fetching {date_str}...")
 
-        data = scraper.fetch_date(current_date)
-        save_raw_data(data, 'mailing_list', date_str)
+def fetch_historical_mailing_list(start_date: datetime, end_date: datetime) -> None:
+    """Fetch historical mailing list data for a date range."""
+    scraper = HistoricalMailingListScraper()
+    dates = [start_date + timedelta(days=i) for i in range((end_date - start_date).days + 1)]
+    total_days = len(dates)
+    progress = _ProgressCursor('mailing_list', start_date)
+
+    pending = []
+    resumed = 0
+    for position, date in enumerate(dates, 1):
+        date_str = date.strftime('%Y-%m-%d')
+        if progress.is_done(date_str):
+            resumed += 1
+        # Check if we already have this file with real data
+        elif _has_saved_messages('mailing_list', date_str):
+            logger.info(f"Mailing list {date_str}: Already has data, skipping")
+            progress.mark_done(date_str)
+        else:
+            pending.append((date, position))
+    if resumed:
+        logger.info(f"Mailing list: skipping {resumed} days finished by an earlier run")
 
-        msg_count = data.get('summary', {}).get('total_messages', 0)
-        thread_count = data.get('summary', {}).get('total_threads', 0)
-        logger.info(f"  -> {msg_count} messages, {thread_count} threads")
+    def fetch_day(job):
+        date, position = job
+        if _fetch_mailing_list_day(scraper, date, position, total_days):
+            progress.mark_done(date.strftime('%Y-%m-%d'))
 
-        current_date += timedelta(days=1)
-        processed += 1
+    # Days overlap in threads. They share one scraper, unlike IRC, because
+    # its rate limit has to pace all of them together
+    with ThreadPoolExecutor(max_workers=MAILING_LIST_DAY_WORKERS) as pool:
+        list(pool.map(fetch_day, pending))
 
-    logger.info(f"Mailing list historical fetch complete: {processed} days processed")
+    logger.info(f"Mailing list historical fetch complete: {total_days} days processed")
 
 
 class HistoricalGitHubScraper:
@@ -388,9 +735,21 @@ class HistoricalGitHubScraper:
     BASE_URL = "https://api.github.com"
     REPOS = ["bitcoin/bitcoin", "bitcoin/bips"]
 
+    # Search and comment results, for conditional requests on reruns
+    CACHE_PATH = DEFAULT_CACHE_PATH
+
+    # The Search API returns at most this many results per query
+    SEARCH_RESULT_CAP = 1000
+
     def __init__(self, token: str = None):
         self.token = token or os.getenv('GITHUB_TOKEN')
         self.session = requests.Session()
+        # Connection errors and 5xx responses are retried by the adapter
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=1, status_forcelist=[502, 503, 504])
+        ))
         self.session.headers.update({
             'Accept': 'application/vnd.github.v3+json',
             'User-Agent': 'BitcoinDramaDetector/1.0'
@@ -402,23 +761,31 @@ class HistoricalGitHubScraper:
             logger.warning("No GitHub token - rate limits will be very strict for Search API")
 
         self.request_delay = 2.0  # Search API has stricter rate limits
-        self.last_request_time = 0
-
-    def _rate_limit(self):
-        """Enforce rate limiting between requests."""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.request_delay:
-            time.sleep(self.request_delay - elapsed)
-        self.last_request_time = time.time()
+        # Comment fetches count against the core limit (5000/hour with a token)
+        self.core_request_delay = 0.75
+        self.max_workers = 4
+        self.search_bucket = TokenBucket(rate=1 / self.request_delay, capacity=2)
+        self.core_bucket = TokenBucket(rate=1 / self.core_request_delay, capacity=3)
+        self.cache = HTTPCache(self.CACHE_PATH)
+
+    def _rate_limit(self, endpoint: str):
+        """Enforce rate limiting between requests, across threads."""
+        if endpoint.startswith('/search/'):
+            self.search_bucket.acquire()
+        else:
+            self.core_bucket.acquire()
 
     def _request(self, endpoint: str, params: dict = None, max_retries: int = 3) -> Optional[dict]:
         """Make a request to the GitHub API with retry logic."""
-        self._rate_limit()
+        self._rate_limit(endpoint)
         url = f"{self.BASE_URL}{endpoint}"
+        # A 304 Not Modified doesn't count against the rate limit
+        key = requests.Request('GET', url, params=params).prepare().url
+        cached = self.cache.get(key)
 
         for attempt in range(max_retries + 1):
             try:
-                response = self.session.get(url, params=params)
+                response = self.session.get(url, params=params, headers=HTTPCache.conditional_headers(cached))
 
                 # Check rate limits
                 remaining = int(response.headers.get('X-RateLimit-Remaining', 0))
@@ -435,28 +802,21 @@ class HistoricalGitHubScraper:
                     time.sleep(wait_time)
                     continue
 
-                if response.status_code in (502, 503, 504):
-                    if attempt < max_retries:
-                        wait_time = (2 ** attempt) * 5
-                        logger.warning(f"Server error {response.status_code}. Retrying in {wait_time}s")
-                        time.sleep(wait_time)
-                        continue
+                if response.status_code == 304 and cached:
+                    return json_loads(cached['body'])
 
                 if response.status_code == 422:
                     logger.warning(f"Validation error: {response.text}")
                     return None
 
                 response.raise_for_status()
+                self.cache.set(key, response)
                 return response.json()
 
             except requests.exceptions.RequestException as e:
-                if attempt < max_retries:
-                    wait_time = (2 ** attempt) * 5
-                    logger.warning(f"Request error: {e}. Retrying in {wait_time}s")
-                    time.sleep(wait_time)
-                else:
-                    logger.error(f"Request failed after {max_retries} retries: {e}")
-                    return None
+                # The adapter has already retried transient failures
+                logger.error(f"Request failed: {e}")
+                return None
 
         return None
 
@@ -490,6 +850,59 @@ class HistoricalGitHubScraper:
             return result['items']
         return []
 
+    def search_issues_for_range(self, repo: str, start: datetime, end: datetime,
+                                item_type: str = 'pr') -> Optional[Dict[str, List[dict]]]:
+        """
+        Search for PRs or issues created over a date range, grouped by day.
+
+        One paginated created:START..END search replaces a request per day.
+        Ranges with more results than the Search API returns are split in
+        half and searched separately.
+
+        Args:
+            repo: Repository (e.g., 'bitcoin/bitcoin')
+            start: First date of the range
+            end: Last date of the range
+            item_type: 'pr' or 'issue'
+
+        Returns:
+            Dict of YYYY-MM-DD -> items created that day (newest first),
+            or None if a search request failed
+        """
+        type_filter = 'pr' if item_type == 'pr' else 'issue'
+        query = f"repo:{repo} is:{type_filter} created:{start.strftime('%Y-%m-%d')}..{end.strftime('%Y-%m-%d')}"
+
+        by_date = defaultdict(list)
+        page = 1
+        while True:
+            params = {
+                'q': query,
+                'sort': 'created',
+                'order': 'desc',
+                'per_page': 100,
+                'page': page
+            }
+            result = self._request('/search/issues', params)
+            if not result or 'items' not in result:
+                return None
+
+            total_count = result.get('total_count', 0)
+            if page == 1 and total_count > self.SEARCH_RESULT_CAP and start < end:
+                mid = start + timedelta(days=(end - start).days // 2)
+                for part in (self.search_issues_for_range(repo, start, mid, item_type),
+                             self.search_issues_for_range(repo, mid + timedelta(days=1), end, item_type)):
+                    if part is None:
+                        return None
+                    by_date.update(part)
+                return by_date
+
+            for item in result['items']:
+                by_date[item.get('created_at', '')[:10]].append(item)
+
+            if len(result['items']) < 100 or page * 100 >= min(total_count, self.SEARCH_RESULT_CAP):
+                return by_date
+            page += 1
+
     def fetch_item_details(self, item: dict, repo: str) -> dict:
         """Fetch additional details for a PR or issue."""
         number = item.get('number')
@@ -525,13 +938,16 @@ class HistoricalGitHubScraper:
 
         return details
 
-    def fetch_date(self, date: datetime, repo: str = "bitcoin/bitcoin") -> dict:
+    def fetch_date(self, date: datetime, repo: str = "bitcoin/bitcoin",
+                   prs_raw: Optional[List[dict]] = None, issues_raw: Optional[List[dict]] = None) -> dict:
         """
         Fetch all GitHub activity for a specific date.
 
         Args:
             date: The date to fetch
             repo: Repository to fetch from
+            prs_raw: The date's PR search results, if already searched
+            issues_raw: The date's issue search results, if already searched
 
         Returns:
             Structured data for that date
@@ -540,23 +956,20 @@ class HistoricalGitHubScraper:
         logger.info(f"Searching GitHub {repo} for {date_str}...")
 
         # Search for PRs
-        prs_raw = self.search_issues_for_date(repo, date, 'pr')
+        if prs_raw is None:
+            prs_raw = self.search_issues_for_date(repo, date, 'pr')
         logger.info(f"  Found {len(prs_raw)} PRs")
 
         # Search for issues
-        issues_raw = self.search_issues_for_date(repo, date, 'issue')
+        if issues_raw is None:
+            issues_raw = self.search_issues_for_date(repo, date, 'issue')
         logger.info(f"  Found {len(issues_raw)} issues")
 
-        # Fetch details for each (limit to avoid rate limits)
-        pull_requests = []
-        for pr in prs_raw[:30]:  # Limit to 30 PRs per day
-            details = self.fetch_item_details(pr, repo)
-            pull_requests.append(details)
-
-        issues = []
-        for issue in issues_raw[:30]:  # Limit to 30 issues per day
-            details = self.fetch_item_details(issue, repo)
-            issues.append(details)
+        # Fetch details for each (limit to avoid rate limits). Comment
+        # fetches overlap; map() keeps the search order.
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            pull_requests = list(pool.map(lambda pr: self.fetch_item_details(pr, repo), prs_raw[:30]))  # Limit to 30 PRs per day
+            issues = list(pool.map(lambda issue: self.fetch_item_details(issue, repo), issues_raw[:30]))  # Limit to 30 issues per day
 
         return {
             'source': 'github',
@@ -572,13 +985,15 @@ class HistoricalGitHubScraper:
         }
 
 
+# Days covered by one GitHub range search
+GITHUB_SEARCH_WINDOW_DAYS = 31
+
+
 def fetch_historical_github(start_date: datetime, end_date: datetime, repo: str = "bitcoin/bitcoin") -> None:
     """Fetch historical GitHub data for a date range."""
     scraper = HistoricalGitHubScraper()
-    current_date = start_date
-
-    total_days = (end_date - start_date).days + 1
-    processed = 0
+    dates = [start_date + timedelta(days=i) for i in range((end_date - start_date).days + 1)]
+    total_days = len(dates)
 
     # Determine output directory based on repo
     if repo == "bitcoin/bips":
@@ -586,38 +1001,50 @@ def fetch_historical_github(start_date: datetime, end_date: datetime, repo: str
     else:
         source_name = "github"
 
-    while current_date <= end_date:
-        date_str = current_date.strftime('%Y-%m-%d')
-        output_path = f"data/raw/{source_name}/{date_str}.json"
+    markers = _github_done_markers(source_name)
+    pending = []
+    for position, date in enumerate(dates, 1):
+        date_str = date.strftime('%Y-%m-%d')
 
         # Check if we already have this file with real data
-        if os.path.exists(output_path):
-            try:
-                with open(output_path, 'r', encoding='utf-8') as f:
-                    existing = json.load(f)
-                    pr_count = len(existing.get('pull_requests', []))
-                    issue_count = len(existing.get('issues', []))
-                    if pr_count > 0 or issue_count > 0:
-                        logger.info(f"GitHub {date_str}: Already has data ({pr_count} PRs, {issue_count} issues), skipping")
-                        current_date += timedelta(days=1)
-                        processed += 1
-                        continue
-            except (json.JSONDecodeError, IOError):
-                pass
-
-        logger.info(f"GitHub [{processed+1}/{total_days}] Fetching {date_str}...")
-
-        data = scraper.fetch_date(current_date, repo)
+        counts = _saved_github_counts(source_name, date_str, markers)
+        if counts is not None:
+            pr_count, issue_count = counts
+            logger.info(f"GitHub {date_str}: Already has data ({pr_count} PRs, {issue_count} issues), skipping")
+            continue
+        pending.append((date, position))
+
+    # Search a window of days at once instead of twice per day. Days of a
+    # window whose search failed fall back to a per-day search.
+    prs_by_date, issues_by_date = {}, {}
+    window_end = None
+    for date, _ in pending:
+        if window_end is not None and date <= window_end:
+            continue
+        window_end = min(date + timedelta(days=GITHUB_SEARCH_WINDOW_DAYS - 1), end_date)
+        for by_date, item_type in ((prs_by_date, 'pr'), (issues_by_date, 'issue')):
+            found = scraper.search_issues_for_range(repo, date, window_end, item_type)
+            if found is None:
+                continue
+            window_date = date
+            while window_date <= window_end:
+                window_str = window_date.strftime('%Y-%m-%d')
+                by_date[window_str] = found.get(window_str, [])
+                window_date += timedelta(days=1)
+
+    for date, position in pending:
+        date_str = date.strftime('%Y-%m-%d')
+        logger.info(f"GitHub [{position}/{total_days}] Fetching {date_str}...")
+
+        data = scraper.fetch_date(date, repo, prs_by_date.get(date_str), issues_by_date.get(date_str))
         save_raw_data(data, source_name, date_str)
 
         pr_count = data.get('summary', {}).get('pull_requests', 0)
         issue_count = data.get('summary', {}).get('issues', 0)
+        _mark_github_done(source_name, date_str, pr_count, issue_count)
         logger.info(f"  -> {pr_count} PRs, {issue_count} issues")
 
-        current_date += timedelta(days=1)
-        processed += 1
-
-    logger.info(f"GitHub historical fetch complete: {processed} days processed")
+    logger.info(f"GitHub historical fetch complete: {total_days} days processed")
 
 
 def main():
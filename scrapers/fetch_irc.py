@@ -24,7 +24,7 @@ from scrapers.utils import (
     logger,
     get_date_range,
     save_raw_data,
-    calculate_basic_drama_signals
+    calculate_basic_drama_signals_batch
 )
 
 
@@ -167,13 +167,16 @@ class IRCScraper:
         for line in raw_log.split('\n'):
             parsed = self._parse_log_line(line, date)
             if parsed and parsed['type'] in ('message', 'action'):
-                # Add drama signals
-                parsed['drama_signals'] = calculate_basic_drama_signals(parsed['content'])
                 messages.append(parsed)
 
                 if parsed['user']:
                     participants.add(parsed['user'])
 
+        # Add drama signals
+        signals = calculate_basic_drama_signals_batch([m['content'] for m in messages])
+        for message, message_signals in zip(messages, signals):
+            message['drama_signals'] = message_signals
+
         return {
             'date': date.strftime('%Y-%m-%d'),
             'channel': self.CHANNEL,
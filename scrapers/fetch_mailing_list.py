@@ -11,7 +11,6 @@ This is rate-limited and respectful of the service.
 import os
 import sys
 import re
-import time
 import requests
 from datetime import datetime, timedelta, timezone
 from bs4 import BeautifulSoup
@@ -25,9 +24,18 @@ from scrapers.utils import (
     logger,
     get_date_range,
     save_raw_data,
-    calculate_basic_drama_signals
+    calculate_basic_drama_signals,
+    TokenBucket
 )
 
+# Message header patterns
+_FROM_RE = re.compile(r'From:\s*(.+?)(?:\n|$)')
+_DATE_HDR_RE = re.compile(r'Date:\s*(.+?)\t')
+_SUBJ_RE = re.compile(r'Subject:\s*(.+?)(?:\n|$)')
+_BODY_RE = re.compile(r'\n\n(.+)', re.DOTALL)
+_REPLY_PREFIX_RE = re.compile(r'^(?:Re|Fwd|FW):\s*', re.IGNORECASE)
+_ANGLE_ADDR_RE = re.compile(r'<[^>]+>')
+
 
 class MailingListScraper:
     """Scraper for bitcoin-dev mailing list from Google Groups."""
@@ -52,15 +60,12 @@ class MailingListScraper:
         })
         
         # Rate limiting: be nice to the servers
-        self.request_delay = 1.0  # seconds between requests
-        self.last_request_time = 0
+        self.request_delay = 1.0  # seconds between requests, on average
+        self.rate_bucket = TokenBucket(rate=1 / self.request_delay, capacity=3)
     
     def _rate_limit(self):
         """Enforce rate limiting between requests."""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.request_delay:
-            time.sleep(self.request_delay - elapsed)
-        self.last_request_time = time.time()
+        self.rate_bucket.acquire()
     
     def _fetch_page(self, url: str) -> Optional[BeautifulSoup]:
         """
@@ -168,24 +173,24 @@ class MailingListScraper:
             text = pre_tags[1].get_text()
 
             # Parse headers from the message
-            from_match = re.search(r'From:\s*(.+?)(?:\n|$)', text)
+            from_match = _FROM_RE.search(text)
             if from_match:
                 # Clean up author (remove bullet characters used in emails)
                 author = from_match.group(1).strip()
                 author = author.replace('•', '@')  # gnusha replaces @ with •
                 message['author'] = author
 
-            date_match = re.search(r'Date:\s*(.+?)\t', text)  # Date ends with tab
+            date_match = _DATE_HDR_RE.search(text)  # Date ends with tab
             if date_match:
                 message['date'] = date_match.group(1).strip()
 
-            subject_match = re.search(r'Subject:\s*(.+?)(?:\n|$)', text)
+            subject_match = _SUBJ_RE.search(text)
             if subject_match:
                 message['title'] = subject_match.group(1).strip()
 
             # Get body (everything after the headers section, which ends with blank line)
             # Headers end with "In-Reply-To:" or similar, then blank line, then body
-            body_match = re.search(r'\n\n(.+)', text, re.DOTALL)
+            body_match = _BODY_RE.search(text)
             if body_match:
                 body = body_match.group(1).strip()
                 # Remove quoted text and signature for cleaner analysis
@@ -250,7 +255,7 @@ class MailingListScraper:
         for msg in messages:
             # Normalize subject
             subject = msg.get('title', '')
-            subject = re.sub(r'^(Re|Fwd|FW):\s*', '', subject, flags=re.IGNORECASE)
+            subject = _REPLY_PREFIX_RE.sub('', subject)
             subject = subject.strip().lower()
             
             if subject not in threads_map:
@@ -267,7 +272,7 @@ class MailingListScraper:
             author = msg.get('author', '')
             if author:
                 # Clean up author (extract just the name or email)
-                author_clean = re.sub(r'<[^>]+>', '', author).strip()
+                author_clean = _ANGLE_ADDR_RE.sub('', author).strip()
                 if author_clean:
                     threads_map[subject]['participants'].add(author_clean)
             
@@ -0,0 +1,150 @@
+"""
+HTTP Cache - On-disk store of fetched pages for the historical scrapers.
+
+Reruns and resumed backfills fetch the same archive pages and API results
+again. Bodies are kept zlib-compressed in SQLite with their ETag and
+Last-Modified, so a rerun can revalidate with If-None-Match /
+If-Modified-Since and answer a 304 from disk, or skip the request
+entirely for pages that never change.
+
+Each page records when it was last used, so pages whose URLs stop being
+requested (list pages keyed on a moving date, say) can be pruned.
+"""
+
+import sqlite3
+import sys
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+# Add parent directory for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scrapers.utils import DATA_DIR
+
+DEFAULT_CACHE_PATH = DATA_DIR / 'cache' / 'http.sqlite'
+
+# Pages unused for this long are dropped by prune()
+DEFAULT_MAX_AGE_DAYS = 30
+
+# A page's last-use time is only rewritten once it is this stale
+_USED_AT_RESOLUTION = 24 * 60 * 60
+
+
+class HTTPCache:
+    """SQLite-backed cache of response bodies, safe to share between threads."""
+
+    def __init__(self, path: Union[str, Path] = DEFAULT_CACHE_PATH):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: SQLite file path
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Scraper workers share the connection, so access goes through _lock
+        self.conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS pages ("
+            "url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, encoding TEXT, body BLOB NOT NULL, "
+            "link TEXT, used_at REAL)"
+        )
+        # Caches created before Link headers and use times were recorded
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(pages)")}
+        if 'link' not in columns:
+            self.conn.execute("ALTER TABLE pages ADD COLUMN link TEXT")
+        if 'used_at' not in columns:
+            self.conn.execute("ALTER TABLE pages ADD COLUMN used_at REAL")
+            self.conn.execute("UPDATE pages SET used_at = ?", (time.time(),))
+        self.conn.commit()
+        self._lock = threading.Lock()
+
+    def get(self, url: str) -> Optional[Dict]:
+        """
+        Look up a stored page.
+
+        Args:
+            url: Full request URL, including the query string
+
+        Returns:
+            Dict with etag, last_modified, encoding, link (the Link header)
+            and body (bytes), or None
+        """
+        now = time.time()
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT etag, last_modified, encoding, link, body, used_at FROM pages WHERE url = ?", (url,)
+            ).fetchone()
+            if row is not None and (row[5] or 0) < now - _USED_AT_RESOLUTION:
+                self.conn.execute("UPDATE pages SET used_at = ? WHERE url = ?", (now, url))
+                self.conn.commit()
+        if row is None:
+            return None
+        etag, last_modified, encoding, link, body, _ = row
+        try:
+            body = zlib.decompress(body)
+        except zlib.error:
+            return None
+        return {'etag': etag, 'last_modified': last_modified, 'encoding': encoding, 'link': link, 'body': body}
+
+    @staticmethod
+    def conditional_headers(entry: Optional[Dict]) -> Dict[str, str]:
+        """Request headers that revalidate a stored page (empty if none)."""
+        headers = {}
+        if entry:
+            if entry['etag']:
+                headers['If-None-Match'] = entry['etag']
+            if entry['last_modified']:
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def set(self, url: str, response, always: bool = False, body: Optional[bytes] = None):
+        """
+        Store a response body if it can be revalidated later.
+
+        Args:
+            url: Full request URL, including the query string
+            response: The successful requests response
+            always: Store even without an ETag/Last-Modified (for pages
+                that never change)
+            body: The body already read from a streamed response
+                (defaults to response.content)
+        """
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not (etag or last_modified or always):
+            return
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO pages (url, etag, last_modified, encoding, body, link, used_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (url, etag, last_modified, response.encoding,
+                 zlib.compress(response.content if body is None else body, 6),
+                 response.headers.get('Link'), time.time())
+            )
+            self.conn.commit()
+
+    def prune(self, max_age_days: float = DEFAULT_MAX_AGE_DAYS) -> int:
+        """
+        Drop pages that haven't been used recently.
+
+        Args:
+            max_age_days: Keep pages used within this many days
+
+        Returns:
+            Number of pages dropped
+        """
+        with self._lock:
+            deleted = self.conn.execute(
+                "DELETE FROM pages WHERE used_at < ?", (time.time() - max_age_days * 24 * 60 * 60,)
+            ).rowcount
+            self.conn.commit()
+        return deleted
+
+    def close(self):
+        """Close the database connection."""
+        self.conn.close()
@@ -3,11 +3,28 @@ Shared utilities for Bitcoin Dev Drama Detector scrapers.
 """
 
 import os
+import gzip
 import json
 import logging
+import threading
+import time
+from bisect import bisect_right
+from functools import lru_cache
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Union, Optional, Tuple
+from typing import List, Union, Optional, Set, Tuple
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib json module
+    orjson = None
+
+try:
+    import ciso8601
+except ImportError:  # Fall back to datetime.fromisoformat
+    ciso8601 = None
 
 # Setup logging
 logging.basicConfig(
@@ -22,11 +39,50 @@ DATA_DIR = PROJECT_ROOT / 'data'
 RAW_DATA_DIR = DATA_DIR / 'raw'
 PROCESSED_DATA_DIR = DATA_DIR / 'processed'
 
+# zlib level for gzip-compressed raw data (RAW_DATA_GZIP=1); higher levels
+# cost several times the CPU for a few percent smaller files
+RAW_GZIP_LEVEL = 3
+
 # Ensure directories exist
 RAW_DATA_DIR.mkdir(parents=True, exist_ok=True)
 PROCESSED_DATA_DIR.mkdir(parents=True, exist_ok=True)
 
 
+def json_loads(data: Union[str, bytes]):
+    """
+    Parse JSON text, using orjson when it is installed.
+
+    Raises json.JSONDecodeError on invalid input either way (orjson's
+    error type subclasses it).
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps_pretty(data: Union[dict, list]) -> bytes:
+    """
+    Serialize data as 2-space indented UTF-8 JSON.
+
+    With orjson the layout matches json.dump(indent=2, default=str,
+    ensure_ascii=False) and datetimes still go through str(); NaN is
+    written as null rather than the non-standard NaN token.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            data,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        )
+    return json.dumps(data, indent=2, default=str, ensure_ascii=False).encode('utf-8')
+
+
+def dump_json_pretty(data: Union[dict, list], filepath: Path):
+    """Write data as 2-space indented UTF-8 JSON (see json_dumps_pretty)."""
+    with open(filepath, 'wb') as f:
+        f.write(json_dumps_pretty(data))
+
+
 def get_date_range(days_back: int = 1) -> Tuple[datetime, datetime]:
     """
     Get the date range for scraping.
@@ -42,7 +98,29 @@ def get_date_range(days_back: int = 1) -> Tuple[datetime, datetime]:
     return start_date, end_date
 
 
-def save_raw_data(data: Union[dict, list], source: str, date_str: str = None) -> Path:
+def date_strings(start_date: datetime, end_date: datetime) -> List[str]:
+    """
+    Every date from start_date to end_date inclusive, as YYYY-MM-DD strings.
+
+    Built in one numpy datetime64 range instead of a timedelta/strftime
+    loop.
+
+    Args:
+        start_date: First date
+        end_date: Last date
+
+    Returns:
+        List of date strings in order (empty if end_date is before start_date)
+    """
+    return np.arange(
+        np.datetime64(start_date.date()),
+        np.datetime64(end_date.date()) + np.timedelta64(1, 'D'),
+        dtype='datetime64[D]'
+    ).astype('U10').tolist()
+
+
+def save_raw_data(data: Union[dict, list], source: str, date_str: str = None,
+                  compress: Optional[bool] = None) -> Path:
     """
     Save raw scraped data to JSON file.
     
@@ -50,29 +128,63 @@ def save_raw_data(data: Union[dict, list], source: str, date_str: str = None) ->
         data: The data to save
         source: Source identifier ('github', 'mailing_list', 'irc')
         date_str: Optional date string (defaults to today)
+        compress: Write {date_str}.json.gz instead of {date_str}.json
+            (defaults to the RAW_DATA_GZIP=1 environment setting)
     
     Returns:
         Path to saved file
     """
     if date_str is None:
         date_str = datetime.now(timezone.utc).strftime('%Y-%m-%d')
+    if compress is None:
+        compress = os.getenv('RAW_DATA_GZIP') == '1'
     
     source_dir = RAW_DATA_DIR / source
     source_dir.mkdir(parents=True, exist_ok=True)
     
-    filepath = source_dir / f'{date_str}.json'
+    plain_path = source_dir / f'{date_str}.json'
+    gzip_path = source_dir / f'{date_str}.json.gz'
     
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, default=str, ensure_ascii=False)
+    if compress:
+        filepath, stale_path = gzip_path, plain_path
+        with gzip.open(filepath, 'wb', compresslevel=RAW_GZIP_LEVEL) as f:
+            f.write(json_dumps_pretty(data))
+    else:
+        filepath, stale_path = plain_path, gzip_path
+        dump_json_pretty(data, filepath)
+    # Don't leave an older copy in the other format behind
+    stale_path.unlink(missing_ok=True)
     
     logger.info(f"Saved raw data to {filepath}")
     return filepath
 
 
+def raw_data_path(source: str, date_str: str) -> Optional[Path]:
+    """
+    Path of the saved raw data file for a source and date.
+    
+    Args:
+        source: Source identifier ('github', 'mailing_list', 'irc')
+        date_str: Date string (YYYY-MM-DD)
+    
+    Returns:
+        {date_str}.json, else {date_str}.json.gz, or None if neither exists
+    """
+    filepath = RAW_DATA_DIR / source / f'{date_str}.json'
+    if filepath.exists():
+        return filepath
+    gzip_path = filepath.with_name(filepath.name + '.gz')
+    if gzip_path.exists():
+        return gzip_path
+    return None
+
+
 def load_raw_data(source: str, date_str: str) -> Optional[Union[dict, list]]:
     """
     Load raw data for a specific source and date.
     
+    Reads {date_str}.json, or the gzip-compressed {date_str}.json.gz.
+    
     Args:
         source: Source identifier ('github', 'mailing_list', 'irc')
         date_str: Date string (YYYY-MM-DD)
@@ -80,14 +192,47 @@ def load_raw_data(source: str, date_str: str) -> Optional[Union[dict, list]]:
     Returns:
         Loaded data or None if not found
     """
-    filepath = RAW_DATA_DIR / source / f'{date_str}.json'
+    filepath = raw_data_path(source, date_str)
     
-    if not filepath.exists():
-        logger.warning(f"No data found at {filepath}")
+    if filepath is None:
+        logger.warning(f"No data found at {RAW_DATA_DIR / source / f'{date_str}.json'}")
         return None
     
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    if filepath.suffix == '.gz':
+        with gzip.open(filepath, 'rb') as f:
+            return json_loads(f.read())
+    return json_loads(filepath.read_bytes())
+
+
+def list_saved_dates(directory: Path, prefix: str = '') -> Set[str]:
+    """
+    List the dates that have a saved JSON file in a data directory.
+
+    One directory read replaces a per-date existence check.
+
+    Args:
+        directory: Directory to scan (e.g. RAW_DATA_DIR / 'github')
+        prefix: Filename prefix before the date (e.g. 'daily_scores_')
+
+    Returns:
+        Set of date strings from files named {prefix}{date_str}.json
+        or {prefix}{date_str}.json.gz
+    """
+    dates = set()
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                name = entry.name
+                # Dotfiles (e.g. github/.etags.json) are caches, not dates
+                if name.startswith('.') or not name.startswith(prefix):
+                    continue
+                if name.endswith('.json'):
+                    dates.add(name[len(prefix):-len('.json')])
+                elif name.endswith('.json.gz'):
+                    dates.add(name[len(prefix):-len('.json.gz')])
+    except FileNotFoundError:
+        pass
+    return dates
 
 
 def save_processed_data(data: Union[dict, list], filename: str) -> Path:
@@ -103,8 +248,7 @@ def save_processed_data(data: Union[dict, list], filename: str) -> Path:
     """
     filepath = PROCESSED_DATA_DIR / filename
     
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, default=str, ensure_ascii=False)
+    dump_json_pretty(data, filepath)
     
     logger.info(f"Saved processed data to {filepath}")
     return filepath
@@ -125,8 +269,7 @@ def load_processed_data(filename: str) -> Optional[Union[dict, list]]:
     if not filepath.exists():
         return None
     
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return json_loads(filepath.read_bytes())
 
 
 # Drama-related keywords that might indicate controversy
@@ -174,20 +317,94 @@ def calculate_basic_drama_signals(text: str) -> dict:
     Returns:
         Dict with drama signal counts
     """
-    text_lower = text.lower()
-    
-    drama_count = sum(1 for kw in DRAMA_KEYWORDS if kw in text_lower)
-    positive_count = sum(1 for kw in POSITIVE_KEYWORDS if kw in text_lower)
+    drama_count, positive_count, has_nack, has_ack = _keyword_signals(text)
     
     return {
         'drama_keywords': drama_count,
         'positive_keywords': positive_count,
         'text_length': len(text),
-        'has_nack': 'nack' in text_lower,
-        'has_ack': 'ack' in text_lower and 'nack' not in text_lower,
+        'has_nack': has_nack,
+        'has_ack': has_ack,
     }
 
 
+@lru_cache(maxsize=50_000)
+def _keyword_signals(text: str) -> Tuple[int, int, bool, bool]:
+    """
+    Keyword counts and ACK/NACK flags for a text, memoized.
+
+    Short review comments ("ACK", "Concept ACK") repeat constantly, and
+    historical fetches see the same PR bodies on many days.
+    """
+    text_lower = text.lower()
+    drama_count = sum(1 for kw in DRAMA_KEYWORDS if kw in text_lower)
+    positive_count = sum(1 for kw in POSITIVE_KEYWORDS if kw in text_lower)
+    has_nack = 'nack' in text_lower
+    return drama_count, positive_count, has_nack, 'ack' in text_lower and not has_nack
+
+
+_ALL_KEYWORDS = tuple(dict.fromkeys(DRAMA_KEYWORDS + POSITIVE_KEYWORDS))
+_DRAMA_KEYWORD_SET = frozenset(DRAMA_KEYWORDS)
+_POSITIVE_KEYWORD_SET = frozenset(POSITIVE_KEYWORDS)
+
+
+def calculate_basic_drama_signals_batch(texts: List[str]) -> List[dict]:
+    """
+    Calculate basic drama signals for many texts at once.
+
+    Gives the same result as calling calculate_basic_drama_signals on each
+    text, but lowercases and joins the texts first so each keyword is one
+    substring search over the whole batch instead of one per text. Meant
+    for IRC logs, where a day is thousands of short lines.
+
+    Args:
+        texts: The texts to analyze
+
+    Returns:
+        List of drama signal dicts, one per text
+    """
+    # Keywords never contain NUL, so a match can't span two texts
+    joined = '\x00'.join(texts).lower()
+    lengths = [len(text) for text in texts]
+    if len(joined) != sum(lengths) + len(texts) - 1:
+        # A few characters lowercase to several (e.g. 'İ'), which would shift
+        # the offsets, so lowercase text by text instead
+        lowered = [text.lower() for text in texts]
+        joined = '\x00'.join(lowered)
+        lengths = [len(text) for text in lowered]
+    starts = []
+    pos = 0
+    for length in lengths:
+        starts.append(pos)
+        pos += length + 1
+
+    found = [None] * len(texts)
+    for kw in _ALL_KEYWORDS:
+        i = joined.find(kw)
+        while i != -1:
+            n = bisect_right(starts, i) - 1
+            if found[n] is None:
+                found[n] = set()
+            found[n].add(kw)
+            # A keyword counts once per text, so skip to the next text
+            if n + 1 == len(starts):
+                break
+            i = joined.find(kw, starts[n + 1])
+
+    results = []
+    for text, present in zip(texts, found):
+        present = present or ()
+        has_nack = 'nack' in present
+        results.append({
+            'drama_keywords': len(_DRAMA_KEYWORD_SET.intersection(present)),
+            'positive_keywords': len(_POSITIVE_KEYWORD_SET.intersection(present)),
+            'text_length': len(text),
+            'has_nack': has_nack,
+            'has_ack': 'ack' in present and not has_nack,
+        })
+    return results
+
+
 def format_iso_date(dt: datetime) -> str:
     """Format datetime to ISO string."""
     return dt.strftime('%Y-%m-%dT%H:%M:%SZ')
@@ -205,3 +422,47 @@ def parse_iso_date(date_str: str) -> datetime:
         except ValueError:
             continue
     raise ValueError(f"Unable to parse date: {date_str}")
+
+
+def parse_github_timestamp(timestamp: str) -> datetime:
+    """Parse a GitHub API timestamp ('YYYY-MM-DDTHH:MM:SSZ') to an aware datetime."""
+    if ciso8601 is not None:
+        return ciso8601.parse_datetime(timestamp)
+    # Python 3.11+ accepts the Z suffix without rewriting it to +00:00
+    return datetime.fromisoformat(timestamp)
+
+
+class TokenBucket:
+    """
+    Thread-safe request pacing that allows short bursts.
+
+    Tokens refill at `rate` per second up to `capacity`; each request takes
+    one. Time spent waiting on slow responses earns tokens back, so the next
+    requests go out at once instead of after a fixed gap, while the
+    long-term rate stays the same.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1):
+        """
+        Args:
+            rate: Tokens added per second (long-term requests per second)
+            capacity: Most tokens that can be saved up for a burst
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take a token, sleeping until one is available."""
+        # Callers reserve their token under the lock (going negative when
+        # others are already waiting), then sleep outside it
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0
+        if wait > 0:
+            time.sleep(wait)
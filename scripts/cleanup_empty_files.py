@@ -98,7 +98,7 @@ def cleanup_empty_files(data_dir: str, dry_run: bool = True) -> dict:
         source_dir = os.path.join(data_dir, 'raw', source)
         if os.path.exists(source_dir):
             for filename in os.listdir(source_dir):
-                if filename.endswith('.json'):
+                if filename.endswith('.json') and not filename.startswith('.'):
                     filepath = os.path.join(source_dir, filename)
                     if is_empty_raw_file(filepath, source):
                         summary[source]['empty'] += 1
@@ -7,6 +7,7 @@ analyzer to generate proper daily scores.
 
 import os
 import sys
+import gzip
 import json
 import argparse
 from datetime import datetime, timedelta
@@ -25,6 +26,9 @@ def load_raw_data(data_dir: str, source: str, date_str: str) -> dict:
     if os.path.exists(filepath):
         with open(filepath, 'r', encoding='utf-8') as f:
             return json.load(f)
+    if os.path.exists(filepath + '.gz'):
+        with gzip.open(filepath + '.gz', 'rt', encoding='utf-8') as f:
+            return json.load(f)
     return {}
 
 